@@ -11,19 +11,29 @@ import logging
 import time
 import threading
 import json
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple, Set, Callable
+
+from file_lock import FileLock, FileLockTimeout, atomic_write_text
+from fleet_mirror import FleetMirror, MirrorLease, RepositoryMirror, default_node_id
+from git_backend import GitRepository, redact_url
+from health_checks import run_health_checks
+from hub_services import LAUNCHER, services_for_paths, lockfile_changed
+from impact_gate import ImpactGate, ImpactIndex
+from install_cache import InstallCache, build_services
+from partial_checkout import BLOB_FILTER, apply_sparse_checkout, enable_partial_clone, sparse_directories
+from poll_scheduler import PollScheduler, STOPPED
+from release_stager import ReleaseStager
+from single_flight import SingleFlight
+from snapshot_store import SnapshotStore
+from status_server import StatusServer, StatusSnapshot
+from update_journal import UpdateJournal
+from webhook_listener import WebhookListener
+from updater_logging import configure_logging, log_context
+import updater_metrics
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('field_elevate_auto_updater.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
 
@@ -42,13 +52,45 @@ class FieldElevateAutoUpdater:
         self.check_interval = check_interval
         self.last_check = None
         self.last_commit = None
+        self.last_snapshot = None
+        self.last_remote_tip = None
+        self.last_changes = []
+        self.stage_timings: Dict[str, float] = {}
         self.update_thread = None
+        self.scheduler = None
+        self.webhook = None
+        self.fleet = None
+        self.status = StatusSnapshot()
+        self.status_server = None
         self.running = False
+        self._repo = None
+        self._checkout_mode = None
+        self._releases = None
+        self._impact_gate = None
+        self.blue_green = None  # BlueGreenServer attached by the launcher
+        self.supervisor = None  # ProcessSupervisor attached by the launcher
+        self.sampler = None  # ResourceSampler attached by the launcher
         self.config_file = self.repo_path / "field_elevate_auto_update_config.json"
+        self.metrics_label = self.repo_path.resolve().name
         
         # Load or create configuration
         self.config = self.load_config()
         
+        # Runtime history lives in the journal, not the config file
+        self.journal = UpdateJournal(
+            self.repo_path / self.config.get("journal_file", "logs/update_journal.jsonl"),
+            max_entries=self.config.get("journal_max_entries", 2000),
+            keep_entries=self.config.get("journal_keep_entries", 500)
+        )
+        if "update_count" in self.config or "last_update" in self.config:
+            self.journal.seed(self.config.pop("update_count", 0) or 0, self.config.pop("last_update", None))
+        self.release_state = self._load_release_state()
+        # One check at a time per host; concurrent callers share its result
+        self._single_flight = SingleFlight(
+            self.journal.path.with_name("update.lock"),
+            timeout=self.config.get("update_lock_timeout", 1800)
+        )
+        
         # Validate this is a Git repository
         if not self._is_git_repo():
             logger.warning(f"Not a Git repository: {self.repo_path}")
@@ -63,11 +105,74 @@ class FieldElevateAutoUpdater:
         default_config = {
             "enabled": True,
             "check_interval": 1800,  # 30 minutes
+            "poll_jitter": 0.1,
+            "failure_backoff_base": 60,
+            "failure_backoff_max": 3600,
+            "boost_interval": 60,
+            "boost_duration": 600,
+            "webhook_enabled": False,
+            "webhook_port": 9465,
+            "webhook_path": "/webhook",
+            "webhook_secret": "",
+            "webhook_debounce": 5,
+            "webhook_fallback_interval": 7200,
             "auto_restart": False,
+            "restart_mode": "partial",
             "notify_on_update": True,
             "backup_before_update": True,
-            "last_update": None,
-            "update_count": 0,
+            "probe_before_fetch": True,
+            "update_lock_timeout": 1800,
+            "stale_git_lock_age": 600,
+            "health_checks": [],
+            "health_check_timeout": 30,
+            "rollback_on_failure": True,
+            "test_gate_enabled": False,
+            "test_gate_roots": ["tests/unit", "tests/api"],
+            "test_gate_shards": 4,
+            "test_gate_timeout": 900,
+            "test_gate_index": "logs/test_impact_index.json",
+            "test_gate_commands": {},
+            "staged_releases": False,
+            "releases_dir": "releases",
+            "release_keep": 3,
+            "release_smoke_command": ["node", "--check", "server.js"],
+            "release_smoke_timeout": 120,
+            "fleet_enabled": False,
+            "fleet_node_id": "",
+            "fleet_lease_file": "",
+            "fleet_lease_ttl": 30,
+            "fleet_mirror_path": "",
+            "fleet_mirror_url": "",
+            "fleet_mirror_interval": 60,
+            "fleet_followers": [],
+            "fleet_serve_port": None,
+            "partial_clone": False,
+            "sparse_services": [],
+            "multi_repo": False,
+            "max_concurrency": 4,
+            "repo_timeout": 120,
+            "backup_keep_last": 10,
+            "backup_keep_days": 30,
+            "journal_file": "logs/update_journal.jsonl",
+            "journal_max_entries": 2000,
+            "journal_keep_entries": 500,
+            "resource_sampling": True,
+            "resource_sample_interval": 15,
+            "resource_history": 240,
+            "resource_regression_ratio": 1.5,
+            "resource_min_samples": 8,
+            "metrics_port": 9464,
+            "status_port": 9466,
+            "status_host": "127.0.0.1",
+            "status_allowed_origins": ["http://localhost:3000", "http://127.0.0.1:3000"],
+            "log_file": "logs/field_elevate_auto_updater.log",
+            "log_level": "INFO",
+            "log_max_bytes": 10485760,
+            "log_backup_count": 5,
+            "log_rotate_interval": 86400,
+            "services": ["hub"],
+            "service_overrides": {},
+            "build_timeout": 600,
             "project_name": "Field-Elevate-Hub"
         }
         
@@ -86,24 +191,26 @@ class FieldElevateAutoUpdater:
         return default_config
     
     def save_config(self) -> None:
-        """Save auto-update configuration"""
+        """Save auto-update configuration atomically, under a lock shared by all launchers"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            with FileLock(self.journal.path.with_name("config.lock")):
+                atomic_write_text(self.config_file, json.dumps(self.config, indent=2))
         except Exception as e:
             logger.error(f"Error saving config: {e}")
     
+    def _git_repo(self) -> Optional[GitRepository]:
+        """Return the cached in-process Git backend, rediscovering it if .git changed"""
+        if self._repo is not None and self._repo.is_valid():
+            return self._repo
+        if self._repo is not None:
+            self._repo.close()
+        self._repo = GitRepository.discover(self.repo_path)
+        return self._repo
+    
     def _is_git_repo(self) -> bool:
         """Check if the current directory is a Git repository"""
         try:
-            result = subprocess.run(
-                ['git', 'rev-parse', '--git-dir'],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            return result.returncode == 0
+            return self._git_repo() is not None
         except Exception as e:
             logger.error(f"Error checking Git repository: {e}")
             return False
@@ -111,79 +218,223 @@ class FieldElevateAutoUpdater:
     def _get_current_commit(self) -> Optional[str]:
         """Get the current commit hash"""
         try:
-            result = subprocess.run(
-                ['git', 'rev-parse', 'HEAD'],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
+            repo = self._git_repo()
+            if repo:
+                return repo.head_commit()
         except Exception as e:
             logger.error(f"Error getting current commit: {e}")
         return None
     
     def _get_remote_url(self) -> Optional[str]:
-        """Get the remote repository URL"""
+        """Get the remote repository URL, without any credentials embedded in it"""
         try:
-            result = subprocess.run(
-                ['git', 'config', '--get', 'remote.origin.url'],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
+            repo = self._git_repo()
+            if repo:
+                return redact_url(repo.config_get('remote.origin.url'))
         except Exception as e:
             logger.error(f"Error getting remote URL: {e}")
         return None
     
+    def _tracked_branch(self) -> Optional[Tuple[str, str]]:
+        """Return (remote, remote branch) tracked by the current branch, or None when detached"""
+        repo = self._git_repo()
+        if repo is None:
+            return None
+        branch = repo.current_branch()
+        if not branch:
+            return None
+        return repo.upstream(branch)
+    
+    def _probe_remote(self) -> Optional[bool]:
+        """
+        Compare the remote's advertised branch tip with the last one fetched
+        
+        Returns:
+            True if the tip moved, False if unchanged, None if the probe failed
+        """
+        tracked = self._tracked_branch()
+        if tracked is None:
+            return None
+        remote, branch = tracked
+        repo = self._git_repo()
+        tip = repo.remote_tip(self._fetch_sources(remote)[0], branch)
+        if tip is None:
+            return None
+        self.last_remote_tip = tip
+        return tip != repo.resolve_ref(f'refs/remotes/{remote}/{branch}')
+    
     def _fetch_updates(self) -> bool:
         """Fetch latest changes from remote repository"""
         try:
+            tracked = self._tracked_branch()
+            if tracked and self.config.get("probe_before_fetch", True):
+                if self._probe_remote() is False:
+                    logger.debug("Remote branch tip unchanged, skipping fetch")
+                    return True
+            
             logger.info("Fetching updates from Field-Elevate-Hub repository...")
-            result = subprocess.run(
-                ['git', 'fetch', '--quiet'],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            if not self._ensure_checkout_mode():
+                logger.warning("Partial clone/sparse checkout settings could not be applied")
+            command = ['git', 'fetch', '--quiet']
+            if self.config.get("partial_clone", False):
+                # Commits and trees only; blobs arrive lazily for checked-out paths
+                command.append(f'--filter={BLOB_FILTER}')
+            repo = self._git_repo()
+            size_before = repo.object_store_size() if repo else 0
+            if tracked:
+                # Fetch only the tracked branch into its remote-tracking ref,
+                # from the fleet mirror first when there is one
+                remote, branch = tracked
+                refspec = f'+refs/heads/{branch}:refs/remotes/{remote}/{branch}'
+                for source in self._fetch_sources(remote):
+                    result = subprocess.run(
+                        command + [source, refspec],
+                        cwd=self.repo_path,
+                        capture_output=True,
+                        text=True,
+                        timeout=30
+                    )
+                    if result.returncode == 0:
+                        break
+                    logger.warning(f"Fetch from {source} failed: {result.stderr.strip()}")
+            else:
+                result = subprocess.run(
+                    command,
+                    cwd=self.repo_path,
+                    capture_output=True,
+                    text=True,
+                    timeout=30
+                )
+            if result.returncode == 0 and repo:
+                fetched_bytes = repo.object_store_size() - size_before
+                if fetched_bytes > 0:
+                    updater_metrics.FETCHED_BYTES.labels(repo=self.metrics_label).inc(fetched_bytes)
             return result.returncode == 0
         except Exception as e:
             logger.error(f"Error fetching updates: {e}")
             return False
     
+    def _fetch_sources(self, remote: str) -> List[str]:
+        """Where to fetch from, in order: the fleet mirror (if configured), then the remote"""
+        mirror_url = self.config.get("fleet_mirror_url")
+        if self.config.get("fleet_enabled", False) and mirror_url:
+            return [mirror_url, remote]
+        return [remote]
+    
+    def _start_fleet_mirror(self) -> Optional[FleetMirror]:
+        """Contend for fleet mirror leadership if fleet mode is configured"""
+        if not self.config.get("fleet_enabled", False):
+            return None
+        lease_file = self.config.get("fleet_lease_file")
+        mirror_path = self.config.get("fleet_mirror_path")
+        tracked = self._tracked_branch()
+        upstream_url = self._git_repo().config_get(f"remote.{tracked[0]}.url") if tracked else None
+        if not lease_file or not mirror_path or not upstream_url:
+            logger.info("Fleet mirror leadership disabled (needs fleet_lease_file, fleet_mirror_path and a tracked remote)")
+            return None
+        fleet = FleetMirror(
+            MirrorLease(Path(lease_file), self.config.get("fleet_node_id") or default_node_id(),
+                        ttl=self.config.get("fleet_lease_ttl", 30)),
+            RepositoryMirror(Path(mirror_path), upstream_url),
+            followers=self.config.get("fleet_followers", []),
+            secret=os.environ.get("FIELD_ELEVATE_WEBHOOK_SECRET") or self.config.get("webhook_secret"),
+            interval=self.config.get("fleet_mirror_interval", 60),
+            serve_port=self.config.get("fleet_serve_port"),
+            on_advance=lambda moved: self.check_now()
+        )
+        fleet.start()
+        return fleet
+    
+    def _ensure_checkout_mode(self) -> bool:
+        """Apply the partial_clone and sparse_services settings, once per distinct value"""
+        partial = bool(self.config.get("partial_clone", False))
+        services = tuple(self.config.get("sparse_services") or ())
+        if (partial, services) == self._checkout_mode:
+            return True
+        try:
+            if partial:
+                tracked = self._tracked_branch()
+                if not enable_partial_clone(self.repo_path, tracked[0] if tracked else "origin"):
+                    return False
+            if services and not apply_sparse_checkout(self.repo_path, sparse_directories(services)):
+                return False
+        except (ValueError, subprocess.SubprocessError) as e:
+            logger.error(f"Error applying checkout mode: {e}")
+            return False
+        self._checkout_mode = (partial, services)
+        return True
+    
+    def _release_stager(self) -> Optional[ReleaseStager]:
+        """Release stager for staged_releases mode, or None when updating in place"""
+        if not self.config.get("staged_releases", False):
+            return None
+        if self._releases is None:
+            self._releases = ReleaseStager(
+                self.repo_path,
+                self.repo_path / self.config.get("releases_dir", "releases"),
+                keep=self.config.get("release_keep", 3),
+                smoke_command=self.config.get("release_smoke_command"),
+                smoke_timeout=self.config.get("release_smoke_timeout", 120),
+                builder=lambda root: build_services(
+                    root,
+                    overrides=self.config.get("service_overrides"),
+                    timeout=self.config.get("build_timeout", 600)
+                )
+            )
+        return self._releases
+    
+    def app_root(self) -> Path:
+        """Directory services run from: the active release's link when staging, else the checkout"""
+        stager = self._release_stager()
+        if stager is not None and stager.current() is not None:
+            return stager.current_link
+        return self.repo_path
+    
+    def prepare_release(self) -> bool:
+        """In staged_releases mode, make sure the checked-out commit is the active release"""
+        if self._release_stager() is None:
+            return True
+        return self._run_exclusive("preparing the release", self._prepare_release_locked)
+    
+    def _prepare_release_locked(self) -> bool:
+        stager = self._release_stager()
+        commit = self._get_current_commit()
+        if not commit:
+            return False
+        if stager.current_commit() == commit:
+            return True
+        staged = stager.stage(commit)
+        if not staged['success']:
+            logger.error(f"Could not stage release {commit[:8]}: {staged['reason']}")
+            return False
+        stager.activate(staged['path'])
+        return True
+    
     def _check_for_updates(self) -> bool:
         """Check if there are updates available"""
         try:
-            # Get the current branch
-            result = subprocess.run(
-                ['git', 'branch', '--show-current'],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode != 0:
+            repo = self._git_repo()
+            if repo is None:
                 return False
             
-            current_branch = result.stdout.strip()
+            # Get the branch tracked by the current branch
+            tracked = self._tracked_branch()
+            if not tracked:
+                return False
             
             # Check if local is behind remote
-            result = subprocess.run(
-                ['git', 'rev-list', '--count', f'HEAD..origin/{current_branch}'],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            remote, branch = tracked
+            remote_tip = repo.resolve_ref(f'refs/remotes/{remote}/{branch}')
+            head = repo.head_commit()
+            if not remote_tip or not head:
+                return False
             
-            if result.returncode == 0:
-                commits_behind = int(result.stdout.strip())
-                return commits_behind > 0
+            commits_behind = repo.count_commits_between(head, remote_tip)
+            updater_metrics.COMMITS_BEHIND.labels(repo=self.metrics_label).set(commits_behind or 0)
+            if commits_behind and remote_tip in self.release_state.get("bad_commits", []):
+                logger.warning(f"Not updating to {remote_tip[:8]}: it was rejected by the test gate or health checks")
+                return False
+            return bool(commits_behind)
             
         except Exception as e:
             logger.error(f"Error checking for updates: {e}")
@@ -196,20 +447,25 @@ class FieldElevateAutoUpdater:
             return True
         
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_dir = self.repo_path / "backups" / f"field_elevate_backup_{timestamp}"
-            backup_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Copy all files except .git and backups
-            import shutil
-            for item in self.repo_path.iterdir():
-                if item.name not in ['.git', 'backups', '__pycache__', '.pytest_cache', 'node_modules']:
-                    if item.is_file():
-                        shutil.copy2(item, backup_dir / item.name)
-                    elif item.is_dir():
-                        shutil.copytree(item, backup_dir / item.name, dirs_exist_ok=True)
+            store = SnapshotStore(self.repo_path / "backups")
+            snapshot = store.create_snapshot(self.repo_path, label=self.last_commit)
+            self.last_snapshot = snapshot["id"]
+            updater_metrics.BACKUP_BYTES.labels(repo=self.metrics_label).set(snapshot["bytes_added"])
+            updater_metrics.BACKUP_FILES.labels(repo=self.metrics_label).set(snapshot["files"])
+            logger.info(
+                f"Field Elevate backup created: snapshot {snapshot['id']} "
+                f"({snapshot['files']} files, {snapshot['new_blobs']} new blobs, {snapshot['bytes_added']} bytes added)"
+            )
             
-            logger.info(f"Field Elevate backup created: {backup_dir}")
+            pruned = store.prune(
+                keep_last=self.config.get("backup_keep_last"),
+                keep_days=self.config.get("backup_keep_days")
+            )
+            if pruned["snapshots_removed"]:
+                logger.info(
+                    f"Pruned {pruned['snapshots_removed']} old backups "
+                    f"({pruned['blobs_removed']} blobs, {pruned['bytes_freed']} bytes freed)"
+                )
             return True
             
         except Exception as e:
@@ -222,11 +478,42 @@ class FieldElevateAutoUpdater:
             logger.info("Pulling latest changes for Field-Elevate-Hub...")
             
             # Create backup if enabled
-            if not self._create_backup():
+            self.last_snapshot = None
+            with self._stage("backup") as stage:
+                stage['success'] = backed_up = self._create_backup()
+            if not backed_up:
                 logger.warning("Backup failed, but continuing with update")
             
+            # Keep the sparse cone in step with this node's services before touching files
+            if not self._ensure_checkout_mode():
+                logger.error("Sparse checkout is inconsistent with configuration, not merging")
+                return False
+            
+            # The tracked branch was just fetched; merge it rather than fetching again
+            tracked = self._tracked_branch()
+            # What upstream published; HEAD after the merge differs from it when the checkout has local commits
+            target = self._git_repo().resolve_ref(f'refs/remotes/{tracked[0]}/{tracked[1]}') if tracked else None
+            stager = self._release_stager()
+            if stager is not None and tracked:
+                # Build the new release off to the side; the live one is untouched until the swap
+                with self._stage("release") as stage:
+                    staged = stager.stage(target)
+                    stage['success'] = staged['success']
+                if not staged['success']:
+                    logger.error(f"Release {target[:8]} rejected ({staged['reason']}); active release unchanged")
+                    if staged['reason'] != 'checkout failed':
+                        # The commit itself is broken; don't stage it again on every poll
+                        self._reject_commit(target)
+                    return False
+                if not self._run_test_gate(staged['path'], self._changed_paths(self.last_commit, target)):
+                    self._reject_commit(target)
+                    return False
+            command = ['git', 'pull', '--quiet']
+            if tracked:
+                remote, branch = tracked
+                command = ['git', 'merge', '--quiet', f'refs/remotes/{remote}/{branch}']
             result = subprocess.run(
-                ['git', 'pull', '--quiet'],
+                command,
                 cwd=self.repo_path,
                 capture_output=True,
                 text=True,
@@ -236,33 +523,375 @@ class FieldElevateAutoUpdater:
             if result.returncode == 0:
                 new_commit = self._get_current_commit()
                 if new_commit and new_commit != self.last_commit:
-                    logger.info(f"Successfully updated Field-Elevate-Hub from {self.last_commit[:8]} to {new_commit[:8]}")
+                    logger.info(
+                        f"Successfully updated Field-Elevate-Hub from {self.last_commit[:8]} to {new_commit[:8]}",
+                        extra={'commit': new_commit}
+                    )
+                    self.last_changes = self._changed_paths(self.last_commit, new_commit)
+                    # The release that was running is the rollback point until the new one passes its health checks
+                    self.release_state.update(known_good=self.last_commit, snapshot=self.last_snapshot,
+                                              pending=new_commit, merged_target=target)
+                    if stager is None and not self._run_test_gate(self.repo_path, self.last_changes):
+                        # Nothing was restarted yet; put the running code back on disk
+                        self._rollback_to(self.last_commit)
+                        self._reject_commit(new_commit, target)
+                        return False
+                    self._save_release_state()
                     self.last_commit = new_commit
-                    
-                    # Update configuration
-                    self.config["last_update"] = datetime.now().isoformat()
-                    self.config["update_count"] += 1
-                    self.save_config()
-                    
+                    updater_metrics.COMMITS_BEHIND.labels(repo=self.metrics_label).set(0)
+                    if stager is not None:
+                        # Only swap once the control checkout agrees, so a failed merge never leaves it live
+                        stager.activate(staged['path'])
+                        stager.prune()
                     return True
                 else:
                     logger.info("No new commits to pull")
                     return False
             else:
                 logger.error(f"Git pull failed: {result.stderr}")
+                if stager is not None and tracked:
+                    logger.error(f"Release {target[:8]} staged but not activated; active release unchanged")
                 return False
                 
         except Exception as e:
             logger.error(f"Error pulling updates: {e}")
             return False
     
+    def _run_test_gate(self, root: Path, changed: Optional[List[str]]) -> bool:
+        """Run the tests affected by an update against its checkout; True if it may go live"""
+        if not self.config.get("test_gate_enabled", False):
+            return True
+        if self._impact_gate is None:
+            index = ImpactIndex(
+                self.repo_path / self.config.get("test_gate_index", "logs/test_impact_index.json"),
+                self.config.get("test_gate_roots", ["tests/unit", "tests/api"])
+            )
+            self._impact_gate = ImpactGate(
+                index,
+                shards=self.config.get("test_gate_shards", 4),
+                timeout=self.config.get("test_gate_timeout", 900),
+                commands=self.config.get("test_gate_commands")
+            )
+        with self._stage("test") as stage:
+            try:
+                report = self._impact_gate.run(root, changed)
+            except Exception as e:
+                logger.error(f"Test gate could not run: {e}")
+                report = {'success': False, 'failed': [], 'tests': [], 'full': False, 'duration': 0.0}
+            stage['success'] = report['success']
+        if report['success']:
+            logger.info(
+                f"Test gate passed: {len(report['tests'])} test files "
+                f"({'full run' if report['full'] else 'impacted only'}) in {report['duration']:.1f}s"
+            )
+        else:
+            logger.error(f"Test gate failed: {', '.join(report['failed']) or 'runner error'}; update blocked")
+        return report['success']
+    
+    def _reject_commit(self, *commits: Optional[str]) -> None:
+        """
+        Remember commits that must not go live so later checks skip them
+        
+        Pass the remote-tracking tip that was merged as well as the local
+        HEAD: checks compare against the remote tip, and a checkout with
+        local commits gets a merge commit that upstream never publishes.
+        """
+        bad_commits = self.release_state.get("bad_commits", [])
+        for commit in commits:
+            if commit and commit not in bad_commits:
+                bad_commits = (bad_commits + [commit])[-20:]
+        self.release_state.update(pending=None, merged_target=None, bad_commits=bad_commits)
+        self._save_release_state()
+    
+    def _release_state_path(self) -> Path:
+        return self.journal.path.with_name("release_state.json")
+    
+    def _load_release_state(self) -> Dict[str, Any]:
+        """Known-good commit, its pre-update snapshot, the live update and its upstream tip, and rolled-back commits"""
+        state = {"known_good": None, "snapshot": None, "pending": None, "merged_target": None, "bad_commits": []}
+        try:
+            state.update(json.loads(self._release_state_path().read_text()))
+        except (OSError, ValueError):
+            pass
+        return state
+    
+    def _save_release_state(self) -> None:
+        try:
+            atomic_write_text(self._release_state_path(), json.dumps(self.release_state, indent=2))
+        except Exception as e:
+            logger.error(f"Error saving release state: {e}")
+    
+    def verify_pending_update(self) -> bool:
+        """
+        Run the health probes against a newly live update, rolling back if they fail
+        
+        Returns:
+            True if the live release is healthy or nothing awaited verification
+        """
+        return self._run_exclusive("verifying the update", self._verify_pending_update_locked)
+    
+    def _verify_pending_update_locked(self) -> bool:
+        # Another updater process may have verified or rolled back already
+        self.release_state = self._load_release_state()
+        pending = self.release_state.get("pending")
+        if not pending:
+            return True
+        if pending != self._get_current_commit():
+            # HEAD was moved by hand since; there is nothing of ours to verify
+            self.release_state.update(pending=None, merged_target=None)
+            self._save_release_state()
+            return True
+        
+        with self._stage("health") as stage:
+            report = run_health_checks(
+                self.config.get("health_checks", []),
+                cwd=self.app_root(),
+                timeout=self.config.get("health_check_timeout", 30)
+            )
+            stage['success'] = report['healthy']
+        if report['healthy']:
+            self.release_state.update(known_good=pending, pending=None)
+            self._save_release_state()
+            self._publish_status()
+            return True
+        
+        reason = f"health checks failed: {', '.join(report['failed'])}"
+        logger.error(f"Update to {pending[:8]} is unhealthy ({reason})", extra={'commit': pending})
+        if self.config.get("rollback_on_failure", True):
+            self.rollback(reason)
+        return False
+    
+    def rollback(self, reason: str = "manual") -> bool:
+        """
+        Return to the last known-good commit
+        
+        Only files that differ are rewritten, so the cost follows the size
+        of the bad update. The rolled-back commit is skipped by later checks
+        until upstream moves past it.
+        
+        Args:
+            reason: Why, recorded in the update journal
+        """
+        return self._run_exclusive("rolling back", self._rollback_locked, reason)
+    
+    def _rollback_locked(self, reason: str) -> bool:
+        target = self.release_state.get("known_good")
+        bad_commit = self._get_current_commit()
+        if not target or not bad_commit or target == bad_commit:
+            logger.error("No known-good commit to roll back to")
+            return False
+        
+        changed = self._changed_paths(target, bad_commit)
+        logger.warning(f"Rolling back from {bad_commit[:8]} to {target[:8]}: {reason}", extra={'commit': target})
+        with self._stage("rollback") as stage:
+            stage['success'] = rolled_back = self._rollback_to(target)
+        if rolled_back:
+            self.last_commit = target
+            self.last_changes = changed
+            self._reject_commit(bad_commit, self.release_state.get("merged_target"))
+        
+        try:
+            self.journal.append({
+                'repo': self.metrics_label,
+                'from': bad_commit,
+                'to': target,
+                'outcome': 'rolled_back' if rolled_back else 'rollback_failed',
+                'reason': reason,
+                'duration': round(self.stage_timings.get('rollback', 0.0), 6),
+                'changed_files': len(changed) if changed is not None else None
+            })
+        except Exception as e:
+            logger.error(f"Error writing update journal: {e}")
+        
+        self._publish_status()
+        if rolled_back and self.config.get("auto_restart", False):
+            self._restart_for_changes(changed)
+        if self.config.get("notify_on_update", True):
+            self._show_notification(
+                "Field Elevate Rollback",
+                f"Rolled back to {target[:8]}" if rolled_back else f"Rollback to {target[:8]} failed"
+            )
+        return rolled_back
+    
+    def _run_exclusive(self, action: str, fn, *args) -> bool:
+        """Run fn holding the host update lock, so it never overlaps a check or another rollback"""
+        try:
+            with self._single_flight.exclusive():
+                return fn(*args)
+        except FileLockTimeout:
+            logger.error(f"Timed out waiting for another updater process before {action}")
+            return False
+    
+    def _rollback_to(self, commit: str) -> bool:
+        """Reset the checkout (and active release) to commit and restore untracked runtime files"""
+        try:
+            stager = self._release_stager()
+            if stager is not None:
+                path = stager.release_dir(commit)
+                if stager.release_commit(path) != commit:
+                    staged = stager.stage(commit)
+                    if not staged['success']:
+                        logger.error(f"Could not restage release {commit[:8]}: {staged['reason']}")
+                        return False
+                stager.activate(path)
+            
+            result = subprocess.run(
+                ['git', 'reset', '--hard', '--quiet', commit],
+                cwd=self.repo_path,
+                capture_output=True,
+                text=True,
+                timeout=60
+            )
+            if result.returncode != 0:
+                logger.error(f"Git reset failed: {result.stderr}")
+                return False
+            
+            restored = self._restore_runtime_files()
+            logger.info(f"Rolled back to {commit[:8]} ({restored} untracked files restored)")
+            return True
+        except Exception as e:
+            logger.error(f"Error rolling back: {e}")
+            return False
+    
+    def _restore_runtime_files(self) -> int:
+        """Restore untracked files that changed since the pre-update snapshot"""
+        snapshot_id = self.release_state.get("snapshot")
+        if not snapshot_id:
+            return 0
+        store = SnapshotStore(self.repo_path / "backups")
+        try:
+            files = store.load_manifest(snapshot_id)["files"]
+        except Exception as e:
+            logger.warning(f"Pre-update snapshot {snapshot_id} unavailable, untracked files not restored: {e}")
+            return 0
+        
+        result = subprocess.run(
+            ['git', 'ls-files', '-z'],
+            cwd=self.repo_path,
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+        tracked = set(result.stdout.split('\0')) if result.returncode == 0 else set(files)
+        stale = []
+        for rel, entry in files.items():
+            if rel in tracked:
+                continue
+            try:
+                st = os.stat(self.repo_path / rel)
+            except FileNotFoundError:
+                stale.append(rel)
+                continue
+            if st.st_size != entry["size"] or st.st_mtime_ns != entry["mtime_ns"]:
+                stale.append(rel)
+        return store.restore(snapshot_id, self.repo_path, stale) if stale else 0
+    
+    def _changed_paths(self, old_commit: Optional[str], new_commit: str) -> Optional[List[str]]:
+        """List paths changed between two commits; None if they can't be determined"""
+        if not old_commit:
+            return None
+        try:
+            result = subprocess.run(
+                ['git', 'diff', '--name-only', '--no-renames', old_commit, new_commit],
+                cwd=self.repo_path,
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+            if result.returncode == 0:
+                return [line for line in result.stdout.splitlines() if line]
+        except Exception as e:
+            logger.error(f"Error listing changed files: {e}")
+        return None
+    
+    @contextmanager
+    def _stage(self, name: str):
+        """Time one update stage and record its duration and outcome in the metrics"""
+        outcome = {'success': True}
+        started = time.perf_counter()
+        try:
+            with log_context(repo=self.metrics_label, stage=name):
+                yield outcome
+        except Exception:
+            outcome['success'] = False
+            raise
+        finally:
+            duration = time.perf_counter() - started
+            self.stage_timings[name] = duration
+            logger.info(
+                f"Stage {name} {'succeeded' if outcome['success'] else 'failed'} in {duration:.3f}s",
+                extra={'repo': self.metrics_label, 'stage': name, 'duration': round(duration, 6)}
+            )
+            updater_metrics.STAGE_DURATION.labels(repo=self.metrics_label, stage=name).observe(duration)
+            updater_metrics.STAGE_RESULTS.labels(
+                repo=self.metrics_label, stage=name,
+                outcome='success' if outcome['success'] else 'failure'
+            ).inc()
+    
     def check_and_update(self) -> Dict[str, Any]:
         """
         Check for updates and pull if available
         
+        Calls made while a check is already running, from another thread
+        or another updater process on this host, wait for that check and
+        return its result (with 'shared' set) instead of starting their own.
+        
         Returns:
             Dict with update status information
         """
+        try:
+            result, shared = self._single_flight.run(self._check_and_update_locked)
+        except FileLockTimeout:
+            logger.error("Timed out waiting for another updater process to finish its check")
+            return {
+                'success': False,
+                'updated': False,
+                'message': 'Another update check is still running',
+                'timestamp': datetime.now().isoformat()
+            }
+        if shared:
+            # Another caller did the work; pick up whatever it changed on disk
+            self.last_commit = self._get_current_commit() or self.last_commit
+            self.release_state = self._load_release_state()
+            if result.get('updated'):
+                self.last_changes = result.get('changed_files')
+            self._publish_status()
+            result = dict(result, shared=True)
+        return result
+    
+    def _check_and_update_locked(self) -> Dict[str, Any]:
+        """The single in-flight check: stages, metrics, journal and status"""
+        self.stage_timings = {}
+        # Another updater process may have recorded a rollback since this one last looked
+        self.release_state = self._load_release_state()
+        previous_commit = self.last_commit
+        with self._stage("check") as stage:
+            result = self._run_check()
+            stage['success'] = result['success']
+        if result['success']:
+            updater_metrics.LAST_SUCCESS.labels(repo=self.metrics_label).set(time.time())
+        if 'pull' in self.stage_timings:
+            self._record_update(previous_commit, result)
+        self._publish_status()
+        return result
+    
+    def _record_update(self, previous_commit: Optional[str], result: Dict[str, Any]) -> None:
+        """Append an update attempt to the journal"""
+        try:
+            self.journal.append({
+                'repo': self.metrics_label,
+                'from': previous_commit,
+                'to': result.get('commit') or self.last_remote_tip,
+                'outcome': 'success' if result['updated'] else 'failed',
+                'stages': {name: round(duration, 6) for name, duration in self.stage_timings.items()},
+                'duration': round(self.stage_timings.get('check', 0.0), 6),
+                'changed_files': len(self.last_changes) if result['updated'] and self.last_changes is not None else None
+            })
+        except Exception as e:
+            logger.error(f"Error writing update journal: {e}")
+    
+    def _run_check(self) -> Dict[str, Any]:
+        """Fetch, compare and pull; the body of check_and_update"""
         if not self._is_git_repo():
             return {
                 'success': False,
@@ -280,9 +909,12 @@ class FieldElevateAutoUpdater:
             }
         
         self.last_check = datetime.now()
+        self._clear_stale_git_locks()
         
         # Fetch latest changes
-        if not self._fetch_updates():
+        with self._stage("fetch") as stage:
+            stage['success'] = fetched = self._fetch_updates()
+        if not fetched:
             return {
                 'success': False,
                 'updated': False,
@@ -301,13 +933,19 @@ class FieldElevateAutoUpdater:
             }
         
         # Pull updates
-        if self._pull_updates():
+        with self._stage("pull") as stage:
+            stage['success'] = pulled = self._pull_updates()
+        if pulled:
             return {
                 'success': True,
                 'updated': True,
                 'message': 'Successfully updated Field-Elevate-Hub',
                 'timestamp': self.last_check.isoformat(),
-                'commit': self.last_commit
+                'commit': self.last_commit,
+                'changed_files': self.last_changes,
+                'affected_services': (
+                    sorted(services_for_paths(self.last_changes)) if self.last_changes is not None else None
+                )
             }
         else:
             return {
@@ -317,52 +955,292 @@ class FieldElevateAutoUpdater:
                 'timestamp': self.last_check.isoformat()
             }
     
+    def _clear_stale_git_locks(self) -> None:
+        """Remove an index.lock abandoned by a crashed git process"""
+        repo = self._git_repo()
+        if repo is None:
+            return
+        lock = repo.git_dir / "index.lock"
+        try:
+            age = time.time() - lock.stat().st_mtime
+        except FileNotFoundError:
+            return
+        # This process holds the host update lock, so no other updater is running git here
+        if age > self.config.get("stale_git_lock_age", 600):
+            logger.warning(f"Removing stale {lock} ({age:.0f}s old)")
+            try:
+                lock.unlink()
+            except OSError as e:
+                logger.error(f"Could not remove stale git lock: {e}")
+    
+    def configure_logging(self) -> None:
+        """Start queued, rotating JSON file logging (first call per process wins)"""
+        log_file = self.config.get("log_file")
+        if log_file and not Path(log_file).is_absolute():
+            log_file = self.repo_path / log_file
+        try:
+            configure_logging(
+                str(log_file) if log_file else None,
+                level=self.config.get("log_level", "INFO"),
+                max_bytes=self.config.get("log_max_bytes", 10 * 1024 * 1024),
+                backup_count=self.config.get("log_backup_count", 5),
+                rotate_interval=self.config.get("log_rotate_interval", 86400)
+            )
+        except OSError as e:
+            configure_logging(None)
+            logger.error(f"Could not open log file {log_file}, logging to console only: {e}")
+    
     def start_auto_update(self) -> None:
         """Start automatic update checking in background thread"""
+        self.configure_logging()
         if self.update_thread and self.update_thread.is_alive():
             logger.warning("Auto-update thread already running")
             return
         
         if not self.config.get("enabled", True):
+            # Dashboards get status even when updates are disabled
+            self.status_server = self._start_status_server()
             logger.info("Auto-update is disabled in configuration")
+            self._publish_status()
             return
         
+        self.start_servers()
+        self.scheduler = self._create_scheduler()
         self.running = True
         self.update_thread = threading.Thread(target=self._auto_update_loop, daemon=True)
         self.update_thread.start()
-        logger.info(f"Field Elevate auto-update started (checking every {self.check_interval} seconds)")
+        self._publish_status()
+        logger.info(f"Field Elevate auto-update started (checking every {self.scheduler.interval} seconds)")
+    
+    def start_servers(self, on_push: Optional[Callable[[], None]] = None,
+                      taken_ports: Optional[Set[int]] = None) -> None:
+        """
+        Start the status, metrics and webhook endpoints and the fleet mirror, but not the poll loop
+        
+        Used by start_auto_update() and by an UpdateManager that polls on this updater's behalf.
+        
+        Args:
+            on_push: Called for a verified push webhook (default: check_now)
+            taken_ports: Ports already served by other updaters in this process; endpoints
+                configured on one of them are skipped, and the ports bound here are added
+        """
+        taken = taken_ports if taken_ports is not None else set()
+        
+        def claim(key: str) -> bool:
+            port = self.config.get(key)
+            if port in taken:
+                logger.info(f"{key} {port} is already served in this process; not starting another")
+                return False
+            if port:
+                taken.add(port)
+            return True
+        
+        if claim("status_port"):
+            self.status_server = self._start_status_server()
+        
+        metrics_port = self.config.get("metrics_port")
+        if metrics_port:
+            try:
+                updater_metrics.start_metrics_server(int(metrics_port))
+            except OSError as e:
+                logger.error(f"Could not start metrics server on port {metrics_port}: {e}")
+        
+        if not self.config.get("webhook_enabled", False) or claim("webhook_port"):
+            self.webhook = self._start_webhook(on_push)
+        self.fleet = self._start_fleet_mirror()
     
     def stop_auto_update(self) -> None:
         """Stop automatic update checking"""
         self.running = False
+        if self.webhook is not None:
+            self.webhook.stop()
+            self.webhook = None
+        if self.fleet is not None:
+            self.fleet.stop()
+            self.fleet = None
+        if self.scheduler is not None:
+            self.scheduler.stop()
         if self.update_thread:
             self.update_thread.join(timeout=5)
+        if self.status_server is not None:
+            self.status_server.stop()
+            self.status_server = None
+        if self._repo is not None:
+            self._repo.close()
         logger.info("Field Elevate auto-update stopped")
     
+    def _start_webhook(self, on_push: Optional[Callable[[], None]] = None) -> Optional[WebhookListener]:
+        """Start the push webhook listener if configured; polling continues either way"""
+        if not self.config.get("webhook_enabled", False):
+            return None
+        secret = os.environ.get("FIELD_ELEVATE_WEBHOOK_SECRET") or self.config.get("webhook_secret")
+        if not secret:
+            logger.error("Webhook enabled but no secret configured; falling back to polling")
+            return None
+        tracked = self._tracked_branch()
+        try:
+            listener = WebhookListener(
+                on_push or self.check_now,
+                secret,
+                port=int(self.config.get("webhook_port", 9465)),
+                path=self.config.get("webhook_path", "/webhook"),
+                branch=tracked[1] if tracked else None,
+                debounce=self.config.get("webhook_debounce", 5)
+            )
+            listener.start()
+            return listener
+        except OSError as e:
+            logger.error(f"Could not start webhook listener: {e}")
+            return None
+    
+    def _start_status_server(self) -> Optional[StatusServer]:
+        """Serve the cached status snapshot over HTTP if a status port is configured"""
+        port = self.config.get("status_port")
+        if port is None or port is False:
+            return None
+        self._publish_status()
+        try:
+            server = StatusServer(
+                self.status,
+                port=int(port),
+                host=self.config.get("status_host", "127.0.0.1"),
+                allowed_origins=self.config.get("status_allowed_origins")
+            )
+            server.start()
+            return server
+        except OSError as e:
+            logger.error(f"Could not start status server on port {port}: {e}")
+            return None
+    
+    def _publish_status(self) -> None:
+        """Refresh the snapshot served to dashboards; called whenever updater state changes"""
+        try:
+            self.status.publish(self.get_status())
+        except Exception as e:
+            logger.error(f"Error publishing status: {e}")
+    
+    def _create_scheduler(self) -> PollScheduler:
+        """Build the poll scheduler from configuration"""
+        interval = self.check_interval
+        if self.webhook is not None:
+            # Pushes trigger checks; polling is only a safety net
+            interval = max(interval, self.config.get("webhook_fallback_interval", 7200))
+        return PollScheduler(
+            interval,
+            jitter=self.config.get("poll_jitter", 0.1),
+            failure_backoff_base=self.config.get("failure_backoff_base", 60),
+            failure_backoff_max=self.config.get("failure_backoff_max", 3600),
+            boost_interval=self.config.get("boost_interval", 60),
+            boost_duration=self.config.get("boost_duration", 600),
+            on_schedule=self._publish_status
+        )
+    
+    def check_now(self) -> None:
+        """Wake the background loop so it checks immediately"""
+        if self.scheduler is not None:
+            self.scheduler.trigger()
+    
     def _auto_update_loop(self) -> None:
         """Background loop for automatic updates"""
         while self.running:
             try:
                 result = self.check_and_update()
+                self.scheduler.record(result['success'], result['updated'])
                 
                 if result['success'] and result['updated']:
-                    logger.info(f"Field Elevate auto-update: {result['message']}")
-                    
-                    # Show notification if enabled
-                    if self.config.get("notify_on_update", True):
-                        self._show_notification("Field Elevate Update", "Field-Elevate-Hub updated successfully!")
-                    
-                    # Auto-restart if enabled
-                    if self.config.get("auto_restart", False):
-                        logger.info("Auto-restart enabled, restarting Field Elevate application...")
-                        self._restart_application()
-                
-                # Wait for next check
-                time.sleep(self.check_interval)
+                    self._handle_update(result)
                 
             except Exception as e:
                 logger.error(f"Error in auto-update loop: {e}")
-                time.sleep(60)  # Wait 1 minute before retrying
+                self.scheduler.record(False)
+            
+            # Wait for next check, a "check now" trigger, or stop
+            if self.scheduler.wait() == STOPPED:
+                break
+    
+    def _handle_update(self, result: Dict[str, Any]) -> None:
+        """Notify and optionally restart after a successful update"""
+        logger.info(f"Field Elevate auto-update: {result['message']}")
+        
+        # Show notification if enabled
+        if self.config.get("notify_on_update", True):
+            self._show_notification("Field Elevate Update", "Field-Elevate-Hub updated successfully!")
+        
+        # Auto-restart if enabled; without a restart the new code is verified when the launcher next starts
+        if not self.config.get("auto_restart", False):
+            return
+        
+        self._restart_for_changes(result.get('changed_files'))
+        self.verify_pending_update()
+    
+    def _restart_for_changes(self, changed: Optional[List[str]]) -> bool:
+        """Restart whatever the changed paths require under the configured restart mode"""
+        mode = self.config.get("restart_mode", "partial")
+        affected = services_for_paths(changed) if changed is not None else None
+        if affected is not None and mode == "blue_green" and "hub" not in affected and LAUNCHER not in affected:
+            logger.info("Update does not affect the Hub server; no restart needed")
+            return True
+        
+        with self._stage("restart") as stage:
+            if affected is not None and mode == "partial" and self.supervisor is not None:
+                stage['success'] = self._restart_affected_services(changed)
+            elif affected is not None and mode == "blue_green" and LAUNCHER in affected:
+                # A blue/green swap only reloads the Hub; the updater itself needs a new process
+                logger.info("Launcher code changed, restarting Field Elevate application...")
+                stage['success'] = self._reexec_launcher()
+            else:
+                logger.info("Auto-restart enabled, restarting Field Elevate application...")
+                stage['success'] = self._restart_application()
+        return stage['success']
+    
+    def _restart_affected_services(self, changed_paths: List[str]) -> bool:
+        """Reinstall and restart only the services touched by the update"""
+        affected = services_for_paths(changed_paths)
+        if LAUNCHER in affected:
+            logger.info("Launcher code changed, restarting Field Elevate application...")
+            return self._restart_application()
+        
+        running = [name for name in affected if name in self.supervisor.specs]
+        if not running:
+            logger.info("Update does not affect any running service; no restart needed")
+            return True
+        
+        success = True
+        reinstall = [name for name in running if lockfile_changed(name, changed_paths)]
+        if reinstall:
+            report = InstallCache(self.app_root()).install(reinstall)
+            if not report['success']:
+                logger.error(f"Dependency install failed for {', '.join(report['failed'])}; not restarting them")
+                running = [name for name in running if name not in report['failed']]
+                success = False
+        
+        # Services that run from dist/ would otherwise restart into the stale build
+        failed_builds = self._build_services(running)
+        if failed_builds:
+            logger.error(f"Build failed for {', '.join(failed_builds)}; not restarting them")
+            running = [name for name in running if name not in failed_builds]
+            success = False
+        
+        logger.info(f"Restarting affected services: {', '.join(running)}")
+        for name, ok in self.supervisor.restart_services(running).items():
+            if not ok:
+                logger.error(f"Service {name} failed to become ready after restart")
+                success = False
+        return success
+    
+    def _build_services(self, names: List[str]) -> List[str]:
+        """
+        Run the build step of services that have one
+        
+        Returns:
+            Names of the services whose build failed
+        """
+        return build_services(
+            self.app_root(),
+            names,
+            overrides=self.config.get("service_overrides"),
+            timeout=self.config.get("build_timeout", 600)
+        )['failed']
     
     def _show_notification(self, title: str, message: str) -> None:
         """Show desktop notification"""
@@ -378,13 +1256,32 @@ class FieldElevateAutoUpdater:
         except Exception as e:
             logger.error(f"Error showing notification: {e}")
     
-    def _restart_application(self) -> None:
+    def _restart_application(self) -> bool:
         """Restart the application"""
         try:
+            if self.config.get("restart_mode", "partial") == "blue_green" and self.blue_green is not None:
+                if not self.blue_green.restart():
+                    logger.error("Blue/green restart failed; previous instance is still serving")
+                    return False
+                return True
+            return self._reexec_launcher()
+        except Exception as e:
+            logger.error(f"Error restarting application: {e}")
+        return False
+    
+    def _reexec_launcher(self) -> bool:
+        """Replace this process with a fresh launcher; only returns on failure"""
+        try:
+            # Stop supervised services and the Hub pair so the new launcher can bind their ports
+            if self.supervisor is not None:
+                self.supervisor.stop()
+            if self.blue_green is not None:
+                self.blue_green.stop()
             python = sys.executable
             os.execl(python, python, *sys.argv)
         except Exception as e:
             logger.error(f"Error restarting application: {e}")
+        return False
     
     def get_status(self) -> Dict[str, Any]:
         """Get current auto-update status"""
@@ -392,10 +1289,20 @@ class FieldElevateAutoUpdater:
             'running': self.running,
             'enabled': self.config.get("enabled", True),
             'last_check': self.last_check.isoformat() if self.last_check else None,
-            'last_update': self.config.get("last_update"),
-            'update_count': self.config.get("update_count", 0),
+            'last_update': self.journal.last_update,
+            'update_count': self.journal.update_count,
+            'mean_update_seconds': self.journal.mean_duration(),
+            'rollback_count': self.journal.summary()["outcomes"].get("rolled_back", 0),
             'last_commit': self.last_commit,
+            'known_good_commit': self.release_state.get("known_good"),
+            'resource_regressions': self.sampler.regressions() if self.sampler else [],
             'check_interval': self.check_interval,
+            'webhook_port': self.webhook.port if self.webhook else None,
+            'status_port': self.status_server.port if self.status_server else None,
+            'next_check_at': (
+                datetime.fromtimestamp(self.scheduler.next_check_at).isoformat()
+                if self.scheduler and self.scheduler.next_check_at else None
+            ),
             'repo_path': str(self.repo_path),
             'remote_url': self._get_remote_url(),
             'is_git_repo': self._is_git_repo(),
@@ -409,6 +1316,7 @@ class FieldElevateAutoUpdater:
                 self.config[key] = value
         
         self.save_config()
+        self._publish_status()
         logger.info(f"Field Elevate configuration updated: {kwargs}")
 
 
@@ -418,6 +1326,7 @@ def main():
     print("=" * 50)
     
     updater = FieldElevateAutoUpdater()
+    updater.configure_logging()
     
     if not updater._is_git_repo():
         print("❌ Not a Git repository")
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Zero-downtime blue/green restarts for the Field-Elevate-Hub server
+A small local TCP proxy owns the public port; each restart starts a new
+server.js instance on a spare port, waits for /health, switches the proxy
+over and only then drains and stops the old instance
+"""
+
+import os
+import time
+import socket
+import select
+import logging
+import threading
+import subprocess
+import socketserver
+import urllib.request
+from pathlib import Path
+from typing import Optional, Dict, List, Callable, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def find_free_port(host: str = '127.0.0.1') -> int:
+    """Ask the OS for an unused TCP port"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_http(url: str, timeout: float, process: Optional[subprocess.Popen] = None) -> bool:
+    """Poll an HTTP endpoint until it returns 2xx, the process dies or timeout expires"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            return False
+        try:
+            with urllib.request.urlopen(url, timeout=2) as response:
+                if 200 <= response.status < 300:
+                    return True
+        except Exception:
+            pass
+        time.sleep(0.1)
+    return False
+
+
+class _ProxyHandler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        proxy: 'TrafficProxy' = self.server.proxy
+        # Pick the backend and count the connection in one step, so a drain
+        # never sees zero while this connection is still being opened
+        port = proxy._acquire_backend()
+        try:
+            try:
+                upstream = socket.create_connection((proxy.backend_host, port), timeout=5)
+            except OSError as e:
+                logger.error(f"Proxy could not reach backend on port {port}: {e}")
+                return
+            upstream.settimeout(None)
+            try:
+                self._pipe(self.request, upstream)
+            finally:
+                upstream.close()
+        finally:
+            proxy._track(port, -1)
+
+    @staticmethod
+    def _pipe(client: socket.socket, upstream: socket.socket) -> None:
+        peers = {client: upstream, upstream: client}
+        open_reads = [client, upstream]
+        while open_reads:
+            readable, _, _ = select.select(open_reads, [], [], 1.0)
+            for sock in readable:
+                try:
+                    data = sock.recv(65536)
+                except OSError:
+                    return
+                if data:
+                    try:
+                        peers[sock].sendall(data)
+                    except OSError:
+                        return
+                else:
+                    # Propagate the half-close and keep reading the other direction
+                    open_reads.remove(sock)
+                    try:
+                        peers[sock].shutdown(socket.SHUT_WR)
+                    except OSError:
+                        pass
+
+
+class _ThreadingTCPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class TrafficProxy:
+    """Threaded TCP proxy whose backend port can be switched atomically"""
+
+    def __init__(self, listen_port: int, backend_port: int, listen_host: str = '0.0.0.0',
+                 backend_host: str = '127.0.0.1'):
+        self.listen_host = listen_host
+        self.listen_port = listen_port
+        self.backend_host = backend_host
+        self.backend_port = backend_port
+        self._connections: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    def _track(self, port: int, delta: int) -> None:
+        with self._lock:
+            self._connections[port] = self._connections.get(port, 0) + delta
+
+    def _acquire_backend(self) -> int:
+        with self._lock:
+            port = self.backend_port
+            self._connections[port] = self._connections.get(port, 0) + 1
+            return port
+
+    def active_connections(self, port: int) -> int:
+        """Open client connections currently routed to a backend port"""
+        with self._lock:
+            return self._connections.get(port, 0)
+
+    def set_backend(self, port: int) -> None:
+        """Route new connections to another backend port"""
+        with self._lock:
+            self.backend_port = port
+
+    def start(self) -> None:
+        """Bind the public port and start accepting connections"""
+        self._server = _ThreadingTCPServer((self.listen_host, self.listen_port), _ProxyHandler)
+        self._server.proxy = self
+        self.listen_port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop accepting connections"""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+class BlueGreenServer:
+    """Runs the Hub server behind a TrafficProxy and restarts it without refusing connections"""
+
+    def __init__(self, root: Path, port: int = 3000, command: Optional[List[str]] = None,
+                 health_path: str = '/health', health_timeout: float = 60, drain_timeout: float = 30,
+                 prepare: Optional[Callable[[], bool]] = None, env: Optional[Dict[str, str]] = None):
+        """
+        Initialize blue/green server
+
+        Args:
+            root: Directory the server command runs in
+            port: Public port owned by the proxy
+            command: Server command; the backend port is passed as PORT
+            health_path: HTTP path that returns 2xx once the instance is ready
+            health_timeout: Seconds to wait for a new instance to become healthy
+            drain_timeout: Seconds to let old connections finish before stopping
+            prepare: Optional hook run before each new instance (e.g. installs)
+            env: Extra environment variables for the server
+        """
+        self.root = Path(root)
+        self.port = port
+        self.command = command or ['node', 'server.js']
+        self.health_path = health_path
+        self.health_timeout = health_timeout
+        self.drain_timeout = drain_timeout
+        self.prepare = prepare
+        self.env = env or {}
+        self.proxy = None
+        self.process: Optional[subprocess.Popen] = None
+        self.backend_port: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _spawn(self) -> Optional[Tuple[subprocess.Popen, int]]:
+        backend_port = find_free_port()
+        env = dict(os.environ, **self.env)
+        env['PORT'] = str(backend_port)
+        process = subprocess.Popen(self.command, cwd=self.root, env=env)
+        url = f"http://127.0.0.1:{backend_port}{self.health_path}"
+        if wait_for_http(url, self.health_timeout, process):
+            return process, backend_port
+        logger.error(f"New server instance failed its health check on port {backend_port}")
+        self._terminate(process)
+        return None
+
+    def _terminate(self, process: subprocess.Popen, timeout: float = 10) -> None:
+        if process.poll() is not None:
+            return
+        process.terminate()
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    def start(self) -> bool:
+        """Start the first instance and the proxy in front of it"""
+        with self._lock:
+            spawned = self._spawn()
+            if spawned is None:
+                return False
+            self.process, self.backend_port = spawned
+            self.proxy = TrafficProxy(self.port, self.backend_port)
+            self.proxy.start()
+            self.port = self.proxy.listen_port
+            logger.info(f"Field-Elevate-Hub serving on port {self.port} (backend {self.backend_port})")
+            return True
+
+    def restart(self) -> bool:
+        """
+        Replace the running instance without dropping the public port
+
+        The old instance keeps serving until the new one is healthy; if the
+        new one never becomes healthy the old one stays live.
+        """
+        with self._lock:
+            if self.prepare is not None and not self.prepare():
+                logger.error("Restart aborted: prepare step failed")
+                return False
+
+            spawned = self._spawn()
+            if spawned is None:
+                return False
+
+            old_process, old_port = self.process, self.backend_port
+            self.process, self.backend_port = spawned
+            self.proxy.set_backend(self.backend_port)
+            logger.info(f"Traffic switched from port {old_port} to {self.backend_port}")
+
+            deadline = time.monotonic() + self.drain_timeout
+            while self.proxy.active_connections(old_port) > 0 and time.monotonic() < deadline:
+                time.sleep(0.1)
+            self._terminate(old_process)
+            logger.info(f"Old server instance on port {old_port} drained and stopped")
+            return True
+
+    def pids(self) -> Dict[str, int]:
+        """PID of the live server instance, keyed like ProcessSupervisor.pids"""
+        process = self.process
+        return {"hub": process.pid} if process is not None and process.poll() is None else {}
+
+    def stop(self) -> None:
+        """Stop the proxy and the running instance"""
+        with self._lock:
+            if self.proxy:
+                self.proxy.stop()
+            if self.process:
+                self._terminate(self.process)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Cross-process file locking and atomic writes for Field-Elevate-Hub state files
+Uses flock on POSIX and msvcrt byte-range locks on Windows
+"""
+
+import os
+import time
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional, Union
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLockTimeout(Exception):
+    """Raised when a lock could not be acquired in time"""
+
+
+class FileLock:
+    """Exclusive lock on a separate ``.lock`` file, across threads and processes"""
+
+    def __init__(self, path: Union[str, Path], timeout: Optional[float] = 30, poll_interval: float = 0.05):
+        """
+        Initialize file lock
+
+        Args:
+            path: Lock file path (created if missing)
+            timeout: Seconds to wait in acquire(); None waits forever
+            poll_interval: Delay between attempts while waiting
+        """
+        self.path = Path(path)
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._fd: Optional[int] = None
+        self._thread_lock = threading.Lock()
+
+    def _try_lock(self, fd: int) -> bool:
+        try:
+            if os.name == 'nt':
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            return False
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """
+        Take the lock
+
+        Returns:
+            True once held; False if non-blocking and another process holds it
+
+        Raises:
+            FileLockTimeout: If blocking and the timeout expires
+        """
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        # Threads sharing this object queue here; flock alone doesn't exclude them
+        if not blocking:
+            acquired = self._thread_lock.acquire(blocking=False)
+        else:
+            acquired = self._thread_lock.acquire(timeout=-1 if self.timeout is None else self.timeout)
+        if not acquired:
+            if not blocking:
+                return False
+            raise FileLockTimeout(f"Timed out waiting for lock {self.path}")
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError:
+            self._thread_lock.release()
+            raise
+        while not self._try_lock(fd):
+            if not blocking or (deadline is not None and time.monotonic() >= deadline):
+                os.close(fd)
+                self._thread_lock.release()
+                if not blocking:
+                    return False
+                raise FileLockTimeout(f"Timed out waiting for lock {self.path}")
+            time.sleep(self.poll_interval)
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        """Drop the lock"""
+        if self._fd is None:
+            return
+        try:
+            if os.name == 'nt':
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+            self._thread_lock.release()
+
+    @property
+    def locked(self) -> bool:
+        return self._fd is not None
+
+    def __enter__(self) -> 'FileLock':
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+def atomic_write_text(path: Union[str, Path], text: str) -> None:
+    """Write a file so readers see either the old or the new content, never a partial one"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Fleet mirror for Field-Elevate-Hub updaters
+One node, elected through a renewable lease, keeps a bare mirror of the
+upstream repository current and pings the other nodes' webhook listeners
+when it advances; every node then fetches from the mirror, not upstream
+"""
+
+import os
+import json
+import time
+import socket
+import logging
+import threading
+import subprocess
+import urllib.request
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Callable
+
+from file_lock import FileLock, atomic_write_text
+from webhook_listener import SIGNATURE_HEADER, EVENT_HEADER, sign_payload
+
+logger = logging.getLogger(__name__)
+
+
+class MirrorLease:
+    """Time-limited leadership recorded in a lease file shared by the fleet"""
+
+    def __init__(self, path: Path, node_id: str, ttl: float = 30):
+        """
+        Initialize mirror lease
+
+        Args:
+            path: Lease file on storage every candidate node can reach
+            node_id: This node's identity in the lease
+            ttl: Seconds a lease stays valid without renewal
+        """
+        self.path = Path(path)
+        self.node_id = node_id
+        self.ttl = ttl
+        self._lock = FileLock(self.path.with_name(self.path.name + ".lock"), timeout=5)
+
+    def _read(self) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def holder(self) -> Optional[str]:
+        """Node currently holding an unexpired lease"""
+        lease = self._read()
+        if lease and lease.get("expires", 0) > time.time():
+            return lease.get("node")
+        return None
+
+    def try_acquire(self) -> bool:
+        """Take or renew the lease; False while another node holds a live one"""
+        with self._lock:
+            lease = self._read()
+            now = time.time()
+            if lease and lease.get("node") != self.node_id and lease.get("expires", 0) > now:
+                return False
+            atomic_write_text(self.path, json.dumps({"node": self.node_id, "expires": now + self.ttl}))
+            return True
+
+    def release(self) -> None:
+        """Give up the lease if this node holds it"""
+        with self._lock:
+            lease = self._read()
+            if lease and lease.get("node") == self.node_id:
+                self.path.unlink()
+
+
+class RepositoryMirror:
+    """Bare ``git clone --mirror`` of the upstream repository"""
+
+    def __init__(self, path: Path, upstream_url: str):
+        self.path = Path(path)
+        self.upstream_url = upstream_url
+        self._daemon: Optional[subprocess.Popen] = None
+
+    def _git(self, *args: str, timeout: int = 300) -> subprocess.CompletedProcess:
+        return subprocess.run(['git', *args], cwd=self.path, capture_output=True, text=True, timeout=timeout)
+
+    def ensure(self) -> bool:
+        """Create the mirror on first use"""
+        if (self.path / "HEAD").exists():
+            return True
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        result = subprocess.run(
+            ['git', 'clone', '--quiet', '--mirror', self.upstream_url, str(self.path)],
+            capture_output=True, text=True, timeout=1800
+        )
+        if result.returncode != 0:
+            logger.error(f"Could not create mirror of {self.upstream_url}: {result.stderr.strip()}")
+            return False
+        # Followers may use blobless partial clones
+        self._git('config', 'uploadpack.allowFilter', 'true')
+        logger.info(f"Created mirror of {self.upstream_url} at {self.path}")
+        return True
+
+    def refs(self) -> Dict[str, str]:
+        """Branch name -> commit for every branch in the mirror"""
+        result = self._git('for-each-ref', '--format=%(refname) %(objectname)', 'refs/heads')
+        if result.returncode != 0:
+            return {}
+        refs = {}
+        for line in result.stdout.splitlines():
+            name, _, sha = line.partition(' ')
+            refs[name[len('refs/heads/'):]] = sha
+        return refs
+
+    def update(self) -> Optional[Dict[str, str]]:
+        """
+        Fetch from upstream
+
+        Returns:
+            Branches that moved (name -> new commit), or None if the fetch failed
+        """
+        before = self.refs()
+        result = self._git('fetch', '--quiet', '--prune', 'origin')
+        if result.returncode != 0:
+            logger.error(f"Mirror fetch failed: {result.stderr.strip()}")
+            return None
+        after = self.refs()
+        return {name: sha for name, sha in after.items() if before.get(name) != sha}
+
+    def serve(self, port: int, host: str = '0.0.0.0') -> bool:
+        """Export the mirror over git:// with ``git daemon``"""
+        if self._daemon is not None and self._daemon.poll() is None:
+            return True
+        self._daemon = subprocess.Popen(
+            ['git', 'daemon', '--reuseaddr', '--export-all', f'--listen={host}', f'--port={port}',
+             f'--base-path={self.path.parent}', str(self.path.parent)],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        logger.info(f"Serving mirror at git://{host}:{port}/{self.path.name}")
+        return True
+
+    def stop_serving(self) -> None:
+        if self._daemon is not None:
+            self._daemon.terminate()
+            try:
+                self._daemon.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._daemon.kill()
+            self._daemon = None
+
+
+def notify_followers(urls: List[str], secret: str, branch: str, commit: str, timeout: float = 5) -> Dict[str, bool]:
+    """Send a signed push webhook for one branch to every follower"""
+    body = json.dumps({"ref": f"refs/heads/{branch}", "after": commit, "mirror": True}).encode()
+    headers = {
+        "Content-Type": "application/json",
+        EVENT_HEADER: "push",
+        SIGNATURE_HEADER: sign_payload(secret, body),
+    }
+    delivered = {}
+    for url in urls:
+        try:
+            request = urllib.request.Request(url, data=body, headers=headers, method='POST')
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                delivered[url] = 200 <= response.status < 300
+        except Exception as e:
+            logger.warning(f"Could not notify follower {url}: {e}")
+            delivered[url] = False
+    return delivered
+
+
+class FleetMirror:
+    """Runs on every node; whichever node holds the lease maintains the mirror"""
+
+    def __init__(self, lease: MirrorLease, mirror: RepositoryMirror, followers: Optional[List[str]] = None,
+                 secret: Optional[str] = None, interval: float = 60, serve_port: Optional[int] = None,
+                 on_advance: Optional[Callable[[Dict[str, str]], None]] = None):
+        """
+        Initialize fleet mirror
+
+        Args:
+            lease: Leadership lease shared by the fleet
+            mirror: Mirror this node maintains while leader
+            followers: Webhook URLs notified when the mirror advances
+            secret: Webhook secret used to sign notifications
+            interval: Seconds between upstream fetches while leader
+            serve_port: Export the mirror with git daemon on this port while leader
+            on_advance: Called with the moved branches (e.g. the local updater's check_now)
+        """
+        self.lease = lease
+        self.mirror = mirror
+        self.followers = followers or []
+        self.secret = secret
+        self.interval = interval
+        self.serve_port = serve_port
+        self.on_advance = on_advance
+        self.is_leader = False
+        self.last_sync: Optional[float] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def sync_once(self, fetch: bool = True) -> Optional[Dict[str, str]]:
+        """
+        Renew leadership and, if leader, refresh the mirror
+
+        Args:
+            fetch: False only renews the lease
+
+        Returns:
+            Branches that advanced, or None when not leader, not fetching or the fetch failed
+        """
+        leader = self.lease.try_acquire()
+        if leader != self.is_leader:
+            logger.info(f"{'Became' if leader else 'No longer'} fleet mirror leader ({self.lease.node_id})")
+            self.is_leader = leader
+            if not leader:
+                self.mirror.stop_serving()
+        if not leader or not fetch or not self.mirror.ensure():
+            return None
+        if self.serve_port:
+            self.mirror.serve(self.serve_port)
+
+        moved = self.mirror.update()
+        if moved is None:
+            return None
+        self.last_sync = time.time()
+        if moved:
+            logger.info(f"Mirror advanced: {', '.join(f'{b}@{c[:8]}' for b, c in moved.items())}")
+            if self.followers and self.secret:
+                for branch, commit in moved.items():
+                    notify_followers(self.followers, self.secret, branch, commit)
+            if self.on_advance is not None:
+                self.on_advance(moved)
+        return moved
+
+    def _loop(self) -> None:
+        # Renew (or contend for) the lease well within its TTL; fetch every interval
+        tick = min(self.interval, self.lease.ttl / 3)
+        next_fetch = 0.0
+        while not self._stop.is_set():
+            fetch = time.monotonic() >= next_fetch
+            try:
+                self.sync_once(fetch=fetch)
+            except Exception as e:
+                logger.error(f"Fleet mirror sync failed: {e}")
+            if fetch or not self.is_leader:
+                next_fetch = time.monotonic() + self.interval if self.is_leader else 0.0
+            self._stop.wait(tick)
+
+    def start(self) -> None:
+        """Contend for leadership and sync in a background thread"""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop syncing and hand the lease back"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=10)
+        self.mirror.stop_serving()
+        if self.is_leader:
+            self.lease.release()
+            self.is_leader = False
+
+
+def default_node_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+In-process Git backend for the Field-Elevate-Hub auto-updater
+Reads HEAD, refs and config straight from .git and keeps one long-lived
+``git cat-file --batch`` helper for object lookups, so routine checks
+don't fork a git process each time
+"""
+
+import os
+import logging
+import subprocess
+import threading
+from pathlib import Path
+from typing import Optional, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Commit walks longer than this fall back to `git rev-list --count`
+MAX_WALK_COMMITS = 5000
+
+
+def _stat_key(path: Path) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def redact_url(url: Optional[str]) -> Optional[str]:
+    """Drop user and password/token from a remote URL so it is safe to display or serve"""
+    if not url or '://' not in url:
+        # scp-style "git@host:path" names only the SSH user
+        return url
+    scheme, _, rest = url.partition('://')
+    netloc, slash, path = rest.partition('/')
+    return f"{scheme}://{netloc.rpartition('@')[2]}{slash}{path}"
+
+
+def _parse_config(text: str) -> Dict[str, str]:
+    """Parse a git config file into ``section[.subsection].key`` -> value"""
+    values: Dict[str, str] = {}
+    section = None
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line or line[0] in '#;':
+            continue
+        if line.startswith('['):
+            header = line[1:line.index(']')]
+            if '"' in header:
+                name, _, sub = header.partition(' ')
+                sub = sub.strip().strip('"')
+                section = f"{name.lower()}.{sub}"
+            else:
+                # Legacy [section.subsection] syntax
+                name, _, sub = header.partition('.')
+                section = f"{name.lower()}.{sub}" if sub else name.lower()
+            continue
+        if section is None:
+            continue
+        key, sep, value = line.partition('=')
+        key = key.strip().lower()
+        value = value.strip() if sep else 'true'
+        for marker in (' #', ' ;', '\t#', '\t;'):
+            if marker in value and not value.startswith('"'):
+                value = value[:value.index(marker)].rstrip()
+        if len(value) >= 2 and value[0] == value[-1] == '"':
+            value = value[1:-1]
+        values[f"{section}.{key}"] = value
+    return values
+
+
+class CatFileBatch:
+    """Long-lived ``git cat-file --batch`` process shared by all object reads"""
+
+    def __init__(self, repo_path: Path):
+        self.repo_path = Path(repo_path)
+        self._process = None
+        self._lock = threading.Lock()
+
+    def _ensure_process(self) -> subprocess.Popen:
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                ['git', 'cat-file', '--batch'],
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        return self._process
+
+    def read_object(self, rev: str) -> Optional[Tuple[str, bytes]]:
+        """Return (type, content) for an object, or None if it is missing"""
+        with self._lock:
+            process = self._ensure_process()
+            try:
+                process.stdin.write(rev.encode() + b'\n')
+                process.stdin.flush()
+                header = process.stdout.readline().decode().split()
+                if len(header) != 3:
+                    return None
+                _, obj_type, size = header
+                content = process.stdout.read(int(size))
+                process.stdout.read(1)
+                return obj_type, content
+            except (OSError, ValueError) as e:
+                logger.warning(f"git cat-file helper failed, restarting: {e}")
+                self._terminate()
+                return None
+
+    def _terminate(self) -> None:
+        if self._process is not None:
+            try:
+                self._process.stdin.close()
+                self._process.wait(timeout=5)
+            except Exception:
+                self._process.kill()
+            self._process = None
+
+    def close(self) -> None:
+        """Stop the helper process"""
+        with self._lock:
+            self._terminate()
+
+
+class GitRepository:
+    """Read-only view of a repository's refs and config without forking git"""
+
+    def __init__(self, work_tree: Path, git_dir: Path, common_dir: Path):
+        self.work_tree = Path(work_tree)
+        self.git_dir = Path(git_dir)
+        self.common_dir = Path(common_dir)
+        self._packed_refs: Dict[str, str] = {}
+        self._packed_refs_key = None
+        self._config: Dict[str, str] = {}
+        self._config_key = None
+        self._cat_file = None
+        self._reftable = (self.common_dir / "reftable").is_dir()
+
+    @classmethod
+    def discover(cls, path: Path) -> Optional['GitRepository']:
+        """Locate the repository containing path, like ``git rev-parse --git-dir``"""
+        path = Path(path).resolve()
+        for candidate in (path, *path.parents):
+            dot_git = candidate / ".git"
+            if dot_git.is_dir():
+                git_dir = dot_git
+            elif dot_git.is_file():
+                # Linked worktree or submodule: ".git" holds "gitdir: <path>"
+                try:
+                    content = dot_git.read_text().strip()
+                except OSError:
+                    return None
+                if not content.startswith('gitdir:'):
+                    return None
+                git_dir = (candidate / content[len('gitdir:'):].strip()).resolve()
+            else:
+                continue
+            if not (git_dir / "HEAD").exists():
+                return None
+            common_dir = git_dir
+            commondir_file = git_dir / "commondir"
+            if commondir_file.exists():
+                common_dir = (git_dir / commondir_file.read_text().strip()).resolve()
+            return cls(candidate, git_dir, common_dir)
+        return None
+
+    def is_valid(self) -> bool:
+        """Cheap check that the repository still exists on disk"""
+        return (self.git_dir / "HEAD").exists()
+
+    def _git(self, *args: str, timeout: int = 10) -> Optional[str]:
+        result = subprocess.run(
+            ['git', *args],
+            cwd=self.work_tree,
+            capture_output=True,
+            text=True,
+            timeout=timeout
+        )
+        return result.stdout.strip() if result.returncode == 0 else None
+
+    def _load_packed_refs(self) -> Dict[str, str]:
+        path = self.common_dir / "packed-refs"
+        key = _stat_key(path)
+        if key != self._packed_refs_key:
+            refs = {}
+            if key is not None:
+                with open(path, 'r') as f:
+                    for line in f:
+                        if line.startswith('#') or line.startswith('^'):
+                            continue
+                        parts = line.split()
+                        if len(parts) == 2:
+                            refs[parts[1]] = parts[0]
+            self._packed_refs = refs
+            self._packed_refs_key = key
+        return self._packed_refs
+
+    def _read_ref_file(self, ref: str) -> Optional[str]:
+        base = self.git_dir if ref == "HEAD" or '/' not in ref else self.common_dir
+        try:
+            with open(base / ref, 'r') as f:
+                return f.read().strip()
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def resolve_ref(self, ref: str, depth: int = 0) -> Optional[str]:
+        """Resolve a full ref name (``HEAD``, ``refs/heads/main``) to a commit hash"""
+        if depth > 5:
+            return None
+        if self._reftable:
+            return self._git('rev-parse', '--verify', '--quiet', ref)
+        content = self._read_ref_file(ref)
+        if content is None:
+            return self._load_packed_refs().get(ref)
+        if content.startswith('ref:'):
+            return self.resolve_ref(content[4:].strip(), depth + 1)
+        return content or None
+
+    def head(self) -> Tuple[Optional[str], Optional[str]]:
+        """Return (symbolic ref or None when detached, commit hash)"""
+        content = self._read_ref_file("HEAD")
+        if content is None:
+            return None, None
+        if content.startswith('ref:'):
+            target = content[4:].strip()
+            return target, self.resolve_ref(target)
+        return None, content
+
+    def head_commit(self) -> Optional[str]:
+        """Commit hash HEAD points to"""
+        return self.head()[1]
+
+    def current_branch(self) -> Optional[str]:
+        """Short branch name, or None on a detached HEAD"""
+        ref, _ = self.head()
+        if ref and ref.startswith('refs/heads/'):
+            return ref[len('refs/heads/'):]
+        return None
+
+    def config(self) -> Dict[str, str]:
+        """Parsed repository config, re-read only when the file changes"""
+        path = self.common_dir / "config"
+        key = _stat_key(path)
+        if key != self._config_key:
+            try:
+                self._config = _parse_config(path.read_text())
+            except OSError:
+                self._config = {}
+            self._config_key = key
+        return self._config
+
+    def config_get(self, key: str) -> Optional[str]:
+        """Look up ``section[.subsection].key`` in the repository config"""
+        section, _, name = key.rpartition('.')
+        head, dot, sub = section.partition('.')
+        normalized = f"{head.lower()}{dot}{sub}.{name.lower()}"
+        return self.config().get(normalized)
+
+    def upstream(self, branch: str) -> Tuple[str, str]:
+        """Return (remote name, remote branch) tracked by a local branch"""
+        remote = self.config_get(f"branch.{branch}.remote") or "origin"
+        merge = self.config_get(f"branch.{branch}.merge") or f"refs/heads/{branch}"
+        if merge.startswith('refs/heads/'):
+            merge = merge[len('refs/heads/'):]
+        return remote, merge
+
+    def remote_tip(self, remote: str, branch: str, timeout: int = 15) -> Optional[str]:
+        """
+        Ask the remote for its advertised tip of one branch (``git ls-remote``)
+
+        Only the ref advertisement is exchanged; no objects are negotiated.
+        """
+        output = self._git('ls-remote', '--heads', remote, f'refs/heads/{branch}', timeout=timeout)
+        if not output:
+            return None
+        return output.split()[0]
+
+    def object_store_size(self) -> int:
+        """Total bytes of packs and loose objects, used to measure fetch volume"""
+        objects = self.common_dir / "objects"
+        total = 0
+        try:
+            entries = list(os.scandir(objects))
+        except OSError:
+            return 0
+        for entry in entries:
+            if entry.name == 'pack' or (len(entry.name) == 2 and entry.is_dir()):
+                for item in os.scandir(entry.path):
+                    if item.is_file():
+                        total += item.stat().st_size
+        return total
+
+    def cat_file(self) -> CatFileBatch:
+        """Shared ``git cat-file --batch`` helper, started on first use"""
+        if self._cat_file is None:
+            self._cat_file = CatFileBatch(self.work_tree)
+        return self._cat_file
+
+    def commit_parents(self, commit: str) -> Optional[List[str]]:
+        """Parent hashes of a commit, or None if it cannot be read"""
+        obj = self.cat_file().read_object(commit)
+        if obj is None or obj[0] != 'commit':
+            return None
+        parents = []
+        for line in obj[1].split(b'\n'):
+            if not line:
+                break
+            if line.startswith(b'parent '):
+                parents.append(line[7:].decode())
+        return parents
+
+    def count_commits_between(self, base: str, tip: str) -> Optional[int]:
+        """
+        Count commits reachable from tip but not from base (``base..tip``)
+
+        Walks back from tip and stops at base. If any path reaches a root
+        commit without meeting base, or the walk gets long, the exact
+        answer needs a full graph walk, so it is delegated to git.
+        """
+        if base == tip:
+            return 0
+        seen = set()
+        stack = [tip]
+        while stack:
+            commit = stack.pop()
+            if commit == base or commit in seen:
+                continue
+            seen.add(commit)
+            if len(seen) > MAX_WALK_COMMITS:
+                break
+            parents = self.commit_parents(commit)
+            if not parents:
+                break
+            stack.extend(parents)
+        else:
+            return len(seen)
+
+        count = self._git('rev-list', '--count', f'{base}..{tip}')
+        return int(count) if count is not None else None
+
+    def close(self) -> None:
+        """Release the cat-file helper"""
+        if self._cat_file is not None:
+            self._cat_file.close()
+            self._cat_file = None
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Post-update health probes for Field-Elevate-Hub
+Each probe is a small dict from the updater config: an HTTP URL that must
+return 2xx, a TCP port that must accept connections, or a command that
+must exit 0
+"""
+
+import time
+import logging
+import subprocess
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List
+
+from blue_green import wait_for_http
+from process_supervisor import wait_for_tcp
+
+logger = logging.getLogger(__name__)
+
+
+def probe_name(probe: Dict[str, Any]) -> str:
+    return probe.get("name") or probe.get("url") or str(probe.get("port") or probe.get("command"))
+
+
+def run_probe(probe: Dict[str, Any], cwd: Optional[Path] = None, timeout: float = 30) -> bool:
+    """
+    Run one probe, retrying until it passes or its timeout expires
+
+    Args:
+        probe: {"url": ...}, {"port": ..., "host": ...} or {"command": [...]},
+            optionally with "name" and a per-probe "timeout"
+        cwd: Working directory for command probes
+        timeout: Seconds allowed when the probe sets none
+    """
+    timeout = probe.get("timeout", timeout)
+    if "url" in probe:
+        return wait_for_http(probe["url"], timeout)
+    if "port" in probe:
+        return wait_for_tcp(int(probe["port"]), timeout, host=probe.get("host", "127.0.0.1"))
+    if "command" in probe:
+        try:
+            result = subprocess.run(probe["command"], cwd=cwd, capture_output=True, text=True, timeout=timeout)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.error(f"Health probe {probe_name(probe)} could not run: {e}")
+            return False
+        if result.returncode != 0:
+            logger.error(f"Health probe {probe_name(probe)} failed: {(result.stderr or result.stdout).strip()[-500:]}")
+        return result.returncode == 0
+    logger.error(f"Health probe {probe_name(probe)} has no url, port or command")
+    return False
+
+
+def run_health_checks(probes: List[Dict[str, Any]], cwd: Optional[Path] = None,
+                      timeout: float = 30) -> Dict[str, Any]:
+    """
+    Run all probes concurrently
+
+    Returns:
+        Dict with healthy, per-probe results, the failed probe names and duration
+    """
+    started = time.perf_counter()
+    results: Dict[str, bool] = {}
+    if probes:
+        with ThreadPoolExecutor(max_workers=min(len(probes), 8)) as pool:
+            outcomes = pool.map(lambda probe: run_probe(probe, cwd, timeout), probes)
+            for probe, ok in zip(probes, outcomes):
+                results[probe_name(probe)] = ok
+    failed = [name for name, ok in results.items() if not ok]
+    return {
+        "healthy": not failed,
+        "results": results,
+        "failed": failed,
+        "duration": time.perf_counter() - started,
+    }
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Service layout of the Field-Elevate-Hub monorepo
+Maps each independently deployable service to its directory
+"""
+
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterable
+
+# Service name -> directory relative to the repository root.
+# "hub" is the root Express server (server.js).
+HUB_SERVICES: Dict[str, str] = {
+    "hub": ".",
+    "ai-coo": "ai-coo",
+    "mcp-hub": "mcp-hub",
+    "risk-analyzer": "risk-analyzer",
+    "data-hub": "data-hub",
+    "bot-concierge": "bot-concierge",
+    "ops-console": "ops-console",
+    "frontend": "frontend",
+}
+
+
+def service_paths(root: Path) -> Dict[str, Path]:
+    """Return absolute directories for every known service under root"""
+    root = Path(root)
+    return {name: (root / directory).resolve() for name, directory in HUB_SERVICES.items()}
+
+
+# How each runnable service is started. Ports match the services' own
+# defaults; "depends_on" services must be ready before a service starts.
+# "build" compiles services that run from dist/ (TypeScript) before a restart.
+# frontend, bot-concierge and ops-console have no standalone entry point.
+SERVICE_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "hub": {
+        "command": ["node", "server.js"],
+        "env": {"PORT": "3000"},
+        "ready_url": "http://127.0.0.1:3000/health",
+        "depends_on": [],
+    },
+    "data-hub": {
+        "command": ["node", "src/index.js"],
+        "env": {"DATA_HUB_PORT": "8001"},
+        "ready_url": "http://127.0.0.1:8001/health",
+        "depends_on": [],
+    },
+    "mcp-hub": {
+        "command": ["node", "dist/api-server.js"],
+        "build": ["npm", "run", "build"],
+        "env": {"MCP_HUB_PORT": "8000"},
+        "ready_url": "http://127.0.0.1:8000/health",
+        "depends_on": [],
+    },
+    "risk-analyzer": {
+        "command": ["node", "src/index.js"],
+        "env": {"RISK_ANALYZER_PORT": "8004"},
+        "ready_url": "http://127.0.0.1:8004/health",
+        "depends_on": ["data-hub"],
+    },
+    "ai-coo": {
+        "command": ["node", "dist/orchestrator.js"],
+        "build": ["npm", "run", "build"],
+        "env": {"AI_COO_PORT": "8002"},
+        "ready_url": "http://127.0.0.1:8002/health",
+        "depends_on": ["data-hub", "mcp-hub", "risk-analyzer"],
+    },
+}
+
+
+# Top-level paths outside service directories that the root "hub" server loads
+HUB_ROOT_PATHS = ("server.js", "package.json", "package-lock.json", "public/", "src/")
+
+# Shared code imported by several services
+SHARED_PATHS: Dict[str, List[str]] = {
+    "shared/": ["bot-concierge", "ops-console"],
+}
+
+# Pseudo-service for the Python launcher/updater itself; changes need a full restart
+LAUNCHER = "launcher"
+
+
+def services_for_paths(paths: Iterable[str]) -> Dict[str, List[str]]:
+    """
+    Map changed repository paths to the services they affect
+
+    Paths under a service directory belong to that service, root-level
+    server files to "hub" and top-level Python files to LAUNCHER. Anything
+    else (docs, dashboards, tests, deployment notes) affects nothing.
+
+    Returns:
+        Service name -> changed paths for that service
+    """
+    directories = sorted(
+        ((name, directory.rstrip('/') + '/') for name, directory in HUB_SERVICES.items() if directory != '.'),
+        key=lambda item: len(item[1]),
+        reverse=True
+    )
+    affected: Dict[str, List[str]] = {}
+    for path in paths:
+        owners: List[str] = []
+        for name, prefix in directories:
+            if path.startswith(prefix):
+                owners = [name]
+                break
+        else:
+            if '/' not in path and path.endswith('.py'):
+                owners = [LAUNCHER]
+            elif path in HUB_ROOT_PATHS or any(
+                    path.startswith(p) for p in HUB_ROOT_PATHS if p.endswith('/')):
+                owners = ["hub"]
+            else:
+                for prefix, services in SHARED_PATHS.items():
+                    if path.startswith(prefix):
+                        owners = services
+        for owner in owners:
+            affected.setdefault(owner, []).append(path)
+    return affected
+
+
+def lockfile_changed(service: str, paths: Iterable[str]) -> bool:
+    """True if a service's package-lock.json is among the changed paths"""
+    directory = HUB_SERVICES.get(service, service)
+    lockfile = "package-lock.json" if directory == "." else f"{directory}/package-lock.json"
+    return lockfile in paths
+
+
+def build_command(service: str, overrides: Optional[Dict[str, Dict[str, Any]]] = None) -> Optional[List[str]]:
+    """Command that compiles a service before it runs, or None if it runs from source"""
+    settings = dict(SERVICE_DEFAULTS.get(service, {}), **(overrides or {}).get(service, {}))
+    return settings.get("build")
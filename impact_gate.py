@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Impact-based test gate for Field-Elevate-Hub updates
+Keeps a cached index of which test files depend (transitively) on which
+source files, so after a pull only the tests reached by the changed paths
+run, split into parallel shards
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import logging
+import argparse
+import posixpath
+import subprocess
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Iterable, Set
+
+from file_lock import atomic_write_text
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+JS_EXTENSIONS = ('.js', '.ts', '.tsx', '.jsx', '.mjs', '.cjs')
+RESOLVE_EXTENSIONS = JS_EXTENSIONS + ('.json',)
+JS_TEST_PATTERN = re.compile(r'\.(test|spec)\.(js|ts|tsx|jsx|mjs|cjs)$')
+PY_TEST_PATTERN = re.compile(r'^(test_.*|.*_test)\.py$')
+
+JS_IMPORT_PATTERNS = (
+    re.compile(r'''require\(\s*['"]([^'"]+)['"]\s*\)'''),
+    re.compile(r'''^\s*import\s+(?:[^'";]+?\s+from\s+)?['"]([^'"]+)['"]''', re.MULTILINE),
+    re.compile(r'''^\s*export\s+[^'";]*?\s+from\s+['"]([^'"]+)['"]''', re.MULTILINE),
+    re.compile(r'''import\(\s*['"]([^'"]+)['"]\s*\)'''),
+)
+PY_IMPORT_PATTERN = re.compile(r'^\s*(?:from\s+([\w.]+)\s+import|import\s+([\w., ]+))', re.MULTILINE)
+
+# Inputs every test depends on without importing them; a change means the
+# index can't say what is affected
+GLOBAL_INPUTS = {
+    'package.json', 'package-lock.json', 'jest.config.js', 'tsconfig.json',
+    'babel.config.js', '.babelrc', 'requirements.txt', 'pytest.ini', 'setup.cfg', 'pyproject.toml',
+}
+
+DEFAULT_COMMANDS = {
+    'jest': ['npx', 'jest', '--ci', '--runTestsByPath'],
+    'pytest': [sys.executable, '-m', 'pytest', '-q'],
+}
+
+
+def runner_for(path: str) -> Optional[str]:
+    """Test runner for a test file path, or None if it is not a test file"""
+    name = posixpath.basename(path)
+    if JS_TEST_PATTERN.search(name):
+        return 'jest'
+    if PY_TEST_PATTERN.match(name):
+        return 'pytest'
+    return None
+
+
+def parse_imports(path: str, text: str) -> List[str]:
+    """Raw import specifiers in a source file (resolved later against the tree)"""
+    if path.endswith('.py'):
+        modules = []
+        for from_module, names in PY_IMPORT_PATTERN.findall(text):
+            if from_module:
+                modules.append(from_module)
+            else:
+                modules.extend(n.split(' as ')[0].strip() for n in names.split(','))
+        return sorted({m for m in modules if m and not m.startswith('.')})
+    specs = set()
+    for pattern in JS_IMPORT_PATTERNS:
+        specs.update(spec for spec in pattern.findall(text) if spec.startswith('.'))
+    return sorted(specs)
+
+
+def _resolve(importer: str, spec: str, files: Set[str]) -> Optional[str]:
+    if importer.endswith('.py'):
+        top = spec.split('.')[0]
+        for candidate in (posixpath.join(posixpath.dirname(importer), f"{top}.py"), f"{top}.py",
+                          f"{top}/__init__.py"):
+            if candidate in files:
+                return candidate
+        return None
+    base = posixpath.normpath(posixpath.join(posixpath.dirname(importer), spec))
+    candidates = [base] + [base + ext for ext in RESOLVE_EXTENSIONS] + \
+                 [posixpath.join(base, 'index' + ext) for ext in RESOLVE_EXTENSIONS]
+    for candidate in candidates:
+        if candidate in files:
+            return candidate
+    return None
+
+
+class ImpactIndex:
+    """Source path -> dependent test files, rebuilt incrementally from per-file import lists"""
+
+    def __init__(self, path: Path, test_roots: Iterable[str] = ('tests',)):
+        """
+        Initialize impact index
+
+        Args:
+            path: Index cache file
+            test_roots: Directories (relative to the repository) whose test files are indexed
+        """
+        self.path = Path(path)
+        self.test_roots = [root.rstrip('/') + '/' for root in test_roots]
+        self.data: Optional[Dict[str, Any]] = None
+
+    def load(self) -> bool:
+        """Read the cached index; False when missing, unreadable or from another version"""
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return False
+        if data.get('version') != INDEX_VERSION or data.get('test_roots') != self.test_roots:
+            return False
+        self.data = data
+        return True
+
+    def is_test(self, path: str) -> bool:
+        return runner_for(path) is not None and any(path.startswith(root) for root in self.test_roots)
+
+    @staticmethod
+    def _tree(root: Path) -> Dict[str, str]:
+        """Path -> blob id for every tracked source file at HEAD"""
+        result = subprocess.run(['git', 'ls-tree', '-r', '-z', 'HEAD'], cwd=root,
+                                capture_output=True, text=True, timeout=60)
+        if result.returncode != 0:
+            raise RuntimeError(f"git ls-tree failed: {result.stderr.strip()}")
+        tree = {}
+        for record in result.stdout.split('\0'):
+            meta, _, path = record.partition('\t')
+            parts = meta.split()
+            if len(parts) == 3 and parts[1] == 'blob':
+                tree[path] = parts[2]
+        return tree
+
+    def refresh(self, root: Path) -> Dict[str, int]:
+        """
+        Bring the index up to date with the checkout at root
+
+        Only files whose blob changed since the last refresh are re-read.
+
+        Returns:
+            Dict with counts of parsed files and indexed tests
+        """
+        tree = self._tree(Path(root))
+        previous = (self.data or {}).get('imports', {})
+        imports: Dict[str, Dict[str, Any]] = {}
+        parsed = 0
+        for path, blob in tree.items():
+            if not path.endswith(JS_EXTENSIONS + ('.py',)):
+                continue
+            cached = previous.get(path)
+            if cached and cached['blob'] == blob:
+                imports[path] = cached
+                continue
+            try:
+                text = (Path(root) / path).read_text(errors='replace')
+            except OSError:
+                # Outside a sparse checkout; nothing here can import it
+                continue
+            imports[path] = {'blob': blob, 'imports': parse_imports(path, text)}
+            parsed += 1
+
+        files = set(tree)
+        graph = {
+            path: {dep for dep in (_resolve(path, spec, files) for spec in entry['imports']) if dep}
+            for path, entry in imports.items()
+        }
+        tests_by_source: Dict[str, List[str]] = {}
+        tests = sorted(path for path in imports if self.is_test(path))
+        for test in tests:
+            seen = {test}
+            if test.endswith('.py'):
+                # pytest loads conftest.py files above each test module
+                directory = posixpath.dirname(test)
+                while directory:
+                    conftest = posixpath.join(directory, 'conftest.py')
+                    if conftest in graph:
+                        seen.add(conftest)
+                    directory = posixpath.dirname(directory)
+            stack = list(seen)
+            while stack:
+                for dep in graph.get(stack.pop(), ()):
+                    if dep not in seen:
+                        seen.add(dep)
+                        stack.append(dep)
+            for source in seen:
+                tests_by_source.setdefault(source, []).append(test)
+
+        self.data = {
+            'version': INDEX_VERSION,
+            'test_roots': self.test_roots,
+            'built': time.time(),
+            'imports': imports,
+            'tests': tests,
+            'tests_by_source': tests_by_source,
+        }
+        atomic_write_text(self.path, json.dumps(self.data, separators=(',', ':')))
+        return {'parsed': parsed, 'tests': len(tests)}
+
+    @property
+    def tests(self) -> List[str]:
+        return list((self.data or {}).get('tests', []))
+
+    def impacted(self, changed_paths: Iterable[str]) -> Optional[List[str]]:
+        """
+        Tests reached by the changed paths
+
+        Returns:
+            Sorted test paths, or None when only a full run is safe
+            (no index yet, or a global input such as package.json changed)
+        """
+        if self.data is None:
+            return None
+        by_source = self.data['tests_by_source']
+        impacted: Set[str] = set()
+        for path in changed_paths:
+            if posixpath.basename(path) in GLOBAL_INPUTS:
+                return None
+            impacted.update(by_source.get(path, ()))
+            if self.is_test(path) and path in self.data['tests']:
+                impacted.add(path)
+        return sorted(impacted)
+
+
+def make_shards(tests: List[str], shards: int) -> List[Dict[str, Any]]:
+    """Split tests per runner into at most `shards` groups, round-robin"""
+    by_runner: Dict[str, List[str]] = {}
+    for test in tests:
+        by_runner.setdefault(runner_for(test), []).append(test)
+    result = []
+    for runner, files in sorted(by_runner.items()):
+        count = max(1, min(shards, len(files)))
+        for i in range(count):
+            result.append({'runner': runner, 'tests': files[i::count]})
+    return result
+
+
+class ImpactGate:
+    """Runs the tests a change can affect before it goes live"""
+
+    def __init__(self, index: ImpactIndex, shards: int = 4, timeout: float = 900,
+                 commands: Optional[Dict[str, List[str]]] = None):
+        """
+        Initialize impact gate
+
+        Args:
+            index: Cached dependency index
+            shards: Parallel test processes per runner
+            timeout: Seconds allowed for each shard
+            commands: Runner name -> command prefix that takes test paths
+                (defaults to jest --runTestsByPath and pytest)
+        """
+        self.index = index
+        self.shards = shards
+        self.timeout = timeout
+        self.commands = {**DEFAULT_COMMANDS, **(commands or {})}
+
+    def _run_shard(self, root: Path, shard: Dict[str, Any]) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            result = subprocess.run(self.commands[shard['runner']] + shard['tests'], cwd=root,
+                                    capture_output=True, text=True, timeout=self.timeout)
+            passed = result.returncode == 0
+            output = (result.stdout + result.stderr).strip()[-2000:]
+        except (OSError, subprocess.TimeoutExpired) as e:
+            passed, output = False, str(e)
+        return {**shard, 'passed': passed, 'output': output, 'duration': time.perf_counter() - started}
+
+    def run(self, root: Path, changed_paths: Optional[List[str]]) -> Dict[str, Any]:
+        """
+        Run the impacted tests against the checkout at root
+
+        Args:
+            root: Checkout holding the new code (a staged release or the repository)
+            changed_paths: Paths changed by the update; None forces a full run
+
+        Returns:
+            Dict with success, whether it was a full run, tests run, failed shards and duration
+        """
+        started = time.perf_counter()
+        stale = not self.index.load()
+        self.index.refresh(root)
+        tests = None if stale or changed_paths is None else self.index.impacted(changed_paths)
+        full = tests is None
+        if full:
+            tests = self.index.tests
+        logger.info(f"Test gate: {'full run of' if full else 'running'} {len(tests)} test files")
+
+        shards = make_shards(tests, self.shards)
+        results = []
+        if shards:
+            with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+                results = list(pool.map(lambda shard: self._run_shard(Path(root), shard), shards))
+        failed = [r for r in results if not r['passed']]
+        for shard in failed:
+            logger.error(f"Test shard failed ({shard['runner']}: {', '.join(shard['tests'])}):\n{shard['output']}")
+        return {
+            'success': not failed,
+            'full': full,
+            'tests': tests,
+            'shards': len(results),
+            'failed': [test for shard in failed for test in shard['tests']],
+            'duration': time.perf_counter() - started,
+        }
+
+
+def main():
+    """List (or run) the tests impacted by changes since a revision"""
+    parser = argparse.ArgumentParser(description="Impact-based test selection for Field-Elevate-Hub")
+    parser.add_argument("--since", default="HEAD~1", help="Revision to diff against")
+    parser.add_argument("--roots", default="tests/unit,tests/api", help="Comma-separated test directories")
+    parser.add_argument("--index", default="logs/test_impact_index.json", help="Index cache file")
+    parser.add_argument("--run", action="store_true", help="Run the impacted tests")
+    args = parser.parse_args()
+
+    root = Path.cwd()
+    index = ImpactIndex(root / args.index, [r for r in args.roots.split(",") if r])
+    diff = subprocess.run(['git', 'diff', '--name-only', '--no-renames', args.since, 'HEAD'],
+                          cwd=root, capture_output=True, text=True)
+    changed = diff.stdout.splitlines() if diff.returncode == 0 else None
+    if args.run:
+        report = ImpactGate(index, shards=os.cpu_count() or 4).run(root, changed)
+        print(f"{'✅' if report['success'] else '❌'} {len(report['tests'])} test files in "
+              f"{report['shards']} shards ({report['duration']:.1f}s){' [full run]' if report['full'] else ''}")
+        sys.exit(0 if report['success'] else 1)
+
+    index.load()
+    stats = index.refresh(root)
+    tests = index.impacted(changed) if changed is not None else None
+    print(f"📇 Indexed {stats['tests']} test files ({stats['parsed']} files re-parsed)")
+    if tests is None:
+        print("🔁 Impact unknown: full run needed")
+    else:
+        print(f"🎯 {len(tests)} impacted test files")
+        for test in tests:
+            print(f"  {test}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Lockfile-keyed dependency installs for Field-Elevate-Hub services
+Skips ``npm ci`` when a service's node_modules already matches its
+package-lock.json and runs the remaining installs in parallel against a
+shared, content-addressed npm cache. build_services() then compiles the
+services that run from dist/
+"""
+
+import os
+import time
+import shutil
+import hashlib
+import functools
+import logging
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterable
+
+from hub_services import service_paths, build_command
+
+logger = logging.getLogger(__name__)
+
+LOCKFILE = "package-lock.json"
+STAMP_FILE = ".field-elevate-install"
+
+
+def default_cache_dir() -> Path:
+    """Shared npm cache used by every service and worktree on this host"""
+    override = os.environ.get("FIELD_ELEVATE_NPM_CACHE")
+    if override:
+        return Path(override)
+    return Path.home() / ".cache" / "field-elevate" / "npm"
+
+
+@functools.lru_cache(maxsize=1)
+def node_version() -> str:
+    """Installed Node.js version, mixed into install hashes (native modules are ABI-specific)"""
+    try:
+        result = subprocess.run(['node', '--version'], capture_output=True, text=True, timeout=10)
+        return result.stdout.strip() if result.returncode == 0 else ""
+    except Exception:
+        return ""
+
+
+def lockfile_hash(service_dir: Path, extra_key: str = "") -> Optional[str]:
+    """Hash a service's lockfile (plus e.g. the Node version); None if it has none"""
+    lockfile = Path(service_dir) / LOCKFILE
+    if not lockfile.exists():
+        return None
+    digest = hashlib.sha256(lockfile.read_bytes())
+    digest.update(extra_key.encode())
+    return digest.hexdigest()
+
+
+class InstallCache:
+    """Decides which services need ``npm ci`` and runs those installs in parallel"""
+
+    def __init__(self, root: Path, services: Optional[Dict[str, Path]] = None,
+                 cache_dir: Optional[Path] = None, max_workers: int = 4,
+                 command: Optional[List[str]] = None, extra_key: Optional[str] = None):
+        """
+        Initialize install cache
+
+        Args:
+            root: Repository root (or release worktree) holding the services
+            services: Service name -> directory; defaults to every Hub service
+            cache_dir: Shared npm cache directory (see default_cache_dir)
+            max_workers: Maximum number of installs run at once
+            command: Install command; defaults to ``npm ci`` against cache_dir
+            extra_key: Mixed into the hash; defaults to ``node --version``
+        """
+        self.root = Path(root)
+        self.services = services if services is not None else service_paths(self.root)
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.max_workers = max(1, max_workers)
+        self.command = command or [
+            shutil.which('npm') or 'npm', 'ci',
+            '--prefer-offline', '--no-audit', '--no-fund',
+            '--cache', str(self.cache_dir)
+        ]
+        self.extra_key = node_version() if extra_key is None else extra_key
+
+    def _stamp_path(self, service_dir: Path) -> Path:
+        return service_dir / "node_modules" / STAMP_FILE
+
+    def needs_install(self, service_dir: Path) -> bool:
+        """True if the service has a lockfile and node_modules doesn't match it"""
+        digest = lockfile_hash(service_dir, self.extra_key)
+        if digest is None:
+            return False
+        stamp = self._stamp_path(service_dir)
+        try:
+            return stamp.read_text().strip() != digest
+        except OSError:
+            return True
+
+    def install_service(self, name: str, service_dir: Path) -> Dict[str, Any]:
+        """Install one service's dependencies unless they are already current"""
+        started = time.perf_counter()
+        if not self.needs_install(service_dir):
+            return {'service': name, 'status': 'skipped', 'duration': 0.0}
+
+        logger.info(f"Installing dependencies for {name}...")
+        try:
+            result = subprocess.run(
+                self.command,
+                cwd=service_dir,
+                capture_output=True,
+                text=True,
+                timeout=900
+            )
+        except Exception as e:
+            logger.error(f"Error installing dependencies for {name}: {e}")
+            return {'service': name, 'status': 'failed', 'duration': time.perf_counter() - started,
+                    'message': str(e)}
+
+        duration = time.perf_counter() - started
+        if result.returncode != 0:
+            logger.error(f"Dependency install failed for {name}: {result.stderr.strip()[-500:]}")
+            return {'service': name, 'status': 'failed', 'duration': duration,
+                    'message': result.stderr.strip()[-500:]}
+
+        stamp = self._stamp_path(service_dir)
+        stamp.parent.mkdir(parents=True, exist_ok=True)
+        stamp.write_text(lockfile_hash(service_dir, self.extra_key))
+        logger.info(f"Installed dependencies for {name} in {duration:.1f}s")
+        return {'service': name, 'status': 'installed', 'duration': duration}
+
+    def install(self, names: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Bring every selected service's node_modules in line with its lockfile
+
+        Returns:
+            Report with per-service results, total duration and whether the
+            start was ``warm`` (nothing installed), ``cold`` (everything
+            installed) or ``partial``
+        """
+        started = time.perf_counter()
+        selected = {
+            name: path for name, path in self.services.items()
+            if (names is None or name in names) and (path / LOCKFILE).exists()
+        }
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {name: pool.submit(self.install_service, name, path) for name, path in selected.items()}
+            results = {name: future.result() for name, future in futures.items()}
+
+        installed = [name for name, r in results.items() if r['status'] == 'installed']
+        skipped = [name for name, r in results.items() if r['status'] == 'skipped']
+        failed = [name for name, r in results.items() if r['status'] == 'failed']
+        if not installed and not failed:
+            mode = 'warm'
+        elif not skipped:
+            mode = 'cold'
+        else:
+            mode = 'partial'
+
+        return {
+            'success': not failed,
+            'mode': mode,
+            'installed': installed,
+            'skipped': skipped,
+            'failed': failed,
+            'results': results,
+            'duration': time.perf_counter() - started
+        }
+
+
+def build_services(root: Path, names: Optional[Iterable[str]] = None,
+                   overrides: Optional[Dict[str, Dict[str, Any]]] = None, timeout: float = 600) -> Dict[str, Any]:
+    """
+    Run the build step of every selected service that has one
+
+    A skipped ``npm ci`` never runs the ``prepare`` script, and dist/ is
+    not tracked, so services like mcp-hub have nothing to start until built.
+
+    Args:
+        root: Repository root or release worktree
+        names: Services to build (default: all present under root)
+        overrides: Per-service settings, as in the launcher's service_overrides
+        timeout: Seconds allowed per build
+
+    Returns:
+        Report with success, built and failed service names and duration
+    """
+    started = time.perf_counter()
+    built, failed = [], []
+    for name, service_dir in service_paths(root).items():
+        command = build_command(name, overrides)
+        if not command or (names is not None and name not in names) or not service_dir.is_dir():
+            continue
+        logger.info(f"Building {name}...")
+        try:
+            result = subprocess.run(command, cwd=service_dir, capture_output=True, text=True, timeout=timeout)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.error(f"Could not build {name}: {e}")
+            failed.append(name)
+            continue
+        if result.returncode != 0:
+            logger.error(f"Build of {name} failed: {(result.stderr or result.stdout).strip()[-500:]}")
+            failed.append(name)
+        else:
+            built.append(name)
+    return {
+        'success': not failed,
+        'built': built,
+        'failed': failed,
+        'duration': time.perf_counter() - started
+    }
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Partial-clone and sparse-checkout support for Field-Elevate-Hub nodes
+A node that runs only some services keeps a blobless clone (file contents
+are fetched on demand) and checks out only those services' directories
+"""
+
+import sys
+import logging
+import argparse
+import subprocess
+from pathlib import Path
+from typing import Optional, List, Iterable
+
+from hub_services import HUB_SERVICES, HUB_ROOT_PATHS, SHARED_PATHS
+
+logger = logging.getLogger(__name__)
+
+BLOB_FILTER = "blob:none"
+
+
+def sparse_directories(services: Iterable[str]) -> List[str]:
+    """
+    Top-level directories a set of services needs
+
+    Root-level files (server.js, the launcher, configs) are always present
+    in cone mode; this adds each service's directory, the hub's own
+    directories and any shared code the services import.
+    """
+    directories = set()
+    for name in services:
+        if name not in HUB_SERVICES:
+            raise ValueError(f"Unknown service '{name}'")
+        directory = HUB_SERVICES[name]
+        if directory == ".":
+            directories.update(p.rstrip('/') for p in HUB_ROOT_PATHS if p.endswith('/'))
+        else:
+            directories.add(directory)
+        for prefix, users in SHARED_PATHS.items():
+            if name in users:
+                directories.add(prefix.rstrip('/'))
+    return sorted(directories)
+
+
+def _git(repo_path: Path, *args: str, timeout: int = 120) -> subprocess.CompletedProcess:
+    return subprocess.run(['git', *args], cwd=repo_path, capture_output=True, text=True, timeout=timeout)
+
+
+def current_sparse_directories(repo_path: Path) -> Optional[List[str]]:
+    """Directories of the active cone-mode sparse checkout, or None for a full checkout"""
+    enabled = _git(repo_path, 'config', '--bool', 'core.sparseCheckout')
+    if enabled.stdout.strip() != 'true':
+        return None
+    result = _git(repo_path, 'sparse-checkout', 'list')
+    if result.returncode != 0:
+        return None
+    return sorted(line for line in result.stdout.splitlines() if line)
+
+
+def apply_sparse_checkout(repo_path: Path, directories: List[str]) -> bool:
+    """Restrict the working tree to directories (cone mode); no-op if already applied"""
+    directories = sorted(directories)
+    if current_sparse_directories(repo_path) == directories:
+        return True
+    result = _git(repo_path, 'sparse-checkout', 'set', '--cone', '--', *directories)
+    if result.returncode != 0:
+        logger.error(f"git sparse-checkout set failed: {result.stderr.strip()}")
+        return False
+    logger.info(f"Sparse checkout set to: {', '.join(directories) or '(root files only)'}")
+    return True
+
+
+def enable_partial_clone(repo_path: Path, remote: str = "origin", blob_filter: str = BLOB_FILTER) -> bool:
+    """
+    Mark a remote as a promisor so fetches skip file contents
+
+    Blobs that are already present stay; new ones are fetched lazily
+    when a checkout or merge needs them.
+    """
+    settings = (
+        (f'remote.{remote}.promisor', 'true'),
+        (f'remote.{remote}.partialclonefilter', blob_filter),
+        ('extensions.partialclone', remote),
+    )
+    for key, value in settings:
+        if _git(repo_path, 'config', key, value).returncode != 0:
+            logger.error(f"Could not set {key} for partial clone")
+            return False
+    return True
+
+
+def clone_partial(url: str, dest: Path, services: Iterable[str], branch: Optional[str] = None) -> bool:
+    """
+    Provision a node: blobless clone checked out to only the given services
+
+    Args:
+        url: Repository URL (local paths need a file:// URL for filtering)
+        dest: Directory to clone into
+        services: Services this node runs
+        branch: Branch to check out (remote default if None)
+    """
+    command = ['git', 'clone', '--quiet', f'--filter={BLOB_FILTER}', '--sparse']
+    if branch:
+        command += ['--branch', branch]
+    result = subprocess.run(command + [url, str(dest)], capture_output=True, text=True, timeout=600)
+    if result.returncode != 0:
+        logger.error(f"Partial clone failed: {result.stderr.strip()}")
+        return False
+    return apply_sparse_checkout(Path(dest), sparse_directories(services))
+
+
+def main():
+    """Create a partial, sparse clone for a node running a subset of services"""
+    parser = argparse.ArgumentParser(description="Clone Field-Elevate-Hub for a subset of services")
+    parser.add_argument("url", help="Repository URL")
+    parser.add_argument("dest", help="Target directory")
+    parser.add_argument("--services", default="hub", help="Comma-separated services this node runs")
+    parser.add_argument("--branch", help="Branch to check out")
+    args = parser.parse_args()
+
+    services = [s.strip() for s in args.services.split(",") if s.strip()]
+    print(f"📥 Cloning {args.url} for: {', '.join(services)}")
+    if not clone_partial(args.url, Path(args.dest), services, args.branch):
+        print("❌ Partial clone failed")
+        sys.exit(1)
+    print(f"✅ Checked out {', '.join(sparse_directories(services)) or 'root files only'} into {args.dest}")
+    print('Set "partial_clone": true and "sparse_services" in the node\'s config to keep it this way')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Adaptive poll scheduler for the Field-Elevate-Hub auto-updater
+Waits on an event so stop and "check now" take effect immediately, adds
+jitter, backs off on repeated failures and polls faster after an update
+"""
+
+import time
+import random
+import threading
+from typing import Optional, Callable
+
+# Reasons returned by PollScheduler.wait()
+TIMEOUT = "timeout"
+TRIGGERED = "triggered"
+STOPPED = "stopped"
+
+
+class PollScheduler:
+    """Decides when the next update check runs and lets callers interrupt the wait"""
+
+    def __init__(self, interval: float, jitter: float = 0.1, failure_backoff_base: float = 60,
+                 failure_backoff_max: float = 3600, boost_interval: float = 60,
+                 boost_duration: float = 600, rng: Optional[random.Random] = None,
+                 on_schedule: Optional[Callable[[], None]] = None):
+        """
+        Initialize poll scheduler
+
+        Args:
+            interval: Normal seconds between checks
+            jitter: Fraction of each delay randomized (+/-) so nodes drift apart
+            failure_backoff_base: Delay after the first failed check; doubles per failure
+            failure_backoff_max: Upper bound on the failure delay
+            boost_interval: Faster interval used for a while after a real update
+            boost_duration: Seconds the faster interval stays in effect
+            rng: Random source (for tests)
+            on_schedule: Called whenever next_check_at is set or cleared
+        """
+        self.interval = interval
+        self.jitter = jitter
+        self.failure_backoff_base = failure_backoff_base
+        self.failure_backoff_max = failure_backoff_max
+        self.boost_interval = boost_interval
+        self.boost_duration = boost_duration
+        self.consecutive_failures = 0
+        self.boost_until = 0.0
+        self.next_check_at: Optional[float] = None
+        self._rng = rng or random.Random()
+        self.on_schedule = on_schedule
+        self._wake = threading.Event()
+        self._stopped = False
+
+    def record(self, success: bool, updated: bool = False) -> None:
+        """Feed back the outcome of a check"""
+        if success:
+            self.consecutive_failures = 0
+            if updated:
+                self.boost_until = time.monotonic() + self.boost_duration
+        else:
+            self.consecutive_failures += 1
+
+    def base_delay(self) -> float:
+        """Delay before the next check, before jitter"""
+        if self.consecutive_failures:
+            backoff = self.failure_backoff_base * (2 ** (self.consecutive_failures - 1))
+            return min(backoff, self.failure_backoff_max)
+        if time.monotonic() < self.boost_until:
+            return min(self.interval, self.boost_interval)
+        return self.interval
+
+    def next_delay(self) -> float:
+        """Delay before the next check, with jitter applied"""
+        delay = self.base_delay()
+        if self.jitter:
+            delay *= self._rng.uniform(1 - self.jitter, 1 + self.jitter)
+        return max(0.0, delay)
+
+    def wait(self, delay: Optional[float] = None) -> str:
+        """
+        Sleep until the next check is due, trigger() or stop()
+
+        Returns:
+            TIMEOUT, TRIGGERED or STOPPED
+        """
+        if self._stopped:
+            return STOPPED
+        delay = self.next_delay() if delay is None else delay
+        self.next_check_at = time.time() + delay
+        if self.on_schedule is not None:
+            self.on_schedule()
+        woke = self._wake.wait(delay)
+        self._wake.clear()
+        self.next_check_at = None
+        if self.on_schedule is not None:
+            self.on_schedule()
+        if self._stopped:
+            return STOPPED
+        return TRIGGERED if woke else TIMEOUT
+
+    def trigger(self) -> None:
+        """Run the next check now"""
+        self._wake.set()
+
+    def stop(self) -> None:
+        """Wake the waiter and make every later wait return STOPPED"""
+        self._stopped = True
+        self._wake.set()
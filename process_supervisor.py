@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Process supervisor for the Field-Elevate-Hub Node services
+Starts services concurrently in dependency order, gates dependents on
+readiness probes and restarts crashed children with exponential backoff
+"""
+
+import os
+import time
+import socket
+import logging
+import threading
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterable
+
+from blue_green import wait_for_http
+from hub_services import HUB_SERVICES, SERVICE_DEFAULTS
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ServiceSpec:
+    """How to run and probe one service"""
+    name: str
+    command: List[str]
+    cwd: Path
+    env: Dict[str, str] = field(default_factory=dict)
+    depends_on: List[str] = field(default_factory=list)
+    ready_url: Optional[str] = None
+    ready_port: Optional[int] = None
+    ready_timeout: float = 60
+
+
+def wait_for_tcp(port: int, timeout: float, process: Optional[subprocess.Popen] = None,
+                 host: str = '127.0.0.1') -> bool:
+    """Poll a TCP port until it accepts connections, the process dies or timeout expires"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            return False
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return True
+        except OSError:
+            time.sleep(0.1)
+    return False
+
+
+def default_specs(root: Path, names: Iterable[str],
+                  overrides: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, ServiceSpec]:
+    """
+    Build specs for the named services plus everything they depend on
+
+    Args:
+        root: Repository root (or active release directory)
+        names: Services to run
+        overrides: Per-service settings merged over SERVICE_DEFAULTS
+    """
+    overrides = overrides or {}
+    specs: Dict[str, ServiceSpec] = {}
+    pending = list(names)
+    while pending:
+        name = pending.pop()
+        if name in specs:
+            continue
+        settings = dict(SERVICE_DEFAULTS.get(name, {}), **overrides.get(name, {}))
+        if "command" not in settings:
+            raise ValueError(f"No command configured for service '{name}'")
+        specs[name] = ServiceSpec(
+            name=name,
+            command=list(settings["command"]),
+            cwd=Path(root) / settings.get("cwd", HUB_SERVICES.get(name, name)),
+            env=dict(settings.get("env", {})),
+            depends_on=list(settings.get("depends_on", [])),
+            ready_url=settings.get("ready_url"),
+            ready_port=settings.get("ready_port"),
+            ready_timeout=settings.get("ready_timeout", 60),
+        )
+        pending.extend(specs[name].depends_on)
+    return specs
+
+
+class ProcessSupervisor:
+    """Starts, probes and restarts a set of service processes"""
+
+    def __init__(self, specs: Dict[str, ServiceSpec], backoff_base: float = 1.0,
+                 backoff_max: float = 60.0, stable_after: float = 60.0):
+        """
+        Initialize process supervisor
+
+        Args:
+            specs: Service name -> spec
+            backoff_base: First restart delay in seconds; doubles per crash
+            backoff_max: Upper bound on the restart delay
+            stable_after: Seconds of uptime after which the crash count resets
+        """
+        self.specs = specs
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.stable_after = stable_after
+        self.processes: Dict[str, subprocess.Popen] = {}
+        self.state: Dict[str, Dict[str, Any]] = {
+            name: {'status': 'stopped', 'restarts': 0, 'crashes': 0, 'start_latency': None}
+            for name in specs
+        }
+        self._ready = {name: threading.Event() for name in specs}
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._monitor = None
+        self._check_dependencies()
+
+    def _check_dependencies(self) -> None:
+        """Reject unknown dependencies and dependency cycles"""
+        visiting, done = set(), set()
+
+        def visit(name: str, chain: List[str]) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle: {' -> '.join(chain + [name])}")
+            if name not in self.specs:
+                raise ValueError(f"Unknown dependency '{name}' of {chain[-1]}")
+            visiting.add(name)
+            for dependency in self.specs[name].depends_on:
+                visit(dependency, chain + [name])
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.specs:
+            visit(name, [])
+
+    def _spawn(self, spec: ServiceSpec) -> subprocess.Popen:
+        env = dict(os.environ, **spec.env)
+        return subprocess.Popen(spec.command, cwd=spec.cwd, env=env)
+
+    def _probe(self, spec: ServiceSpec, process: subprocess.Popen) -> bool:
+        if spec.ready_url:
+            return wait_for_http(spec.ready_url, spec.ready_timeout, process)
+        if spec.ready_port:
+            return wait_for_tcp(spec.ready_port, spec.ready_timeout, process)
+        # No probe configured: ready once it survives a moment
+        time.sleep(0.2)
+        return process.poll() is None
+
+    def _launch(self, name: str) -> bool:
+        """Spawn one service and wait for its readiness probe"""
+        spec = self.specs[name]
+        started = time.perf_counter()
+        state = self.state[name]
+        state['status'] = 'starting'
+        try:
+            process = self._spawn(spec)
+        except OSError as e:
+            logger.error(f"Failed to start {name}: {e}")
+            state['status'] = 'failed'
+            return False
+
+        with self._lock:
+            self.processes[name] = process
+        state['pid'] = process.pid
+        state['started_at'] = time.time()
+
+        if not self._probe(spec, process):
+            logger.error(f"{name} did not become ready within {spec.ready_timeout}s")
+            self._terminate(name)
+            state['status'] = 'failed'
+            return False
+
+        state['status'] = 'ready'
+        state['start_latency'] = time.perf_counter() - started
+        self._ready[name].set()
+        logger.info(f"{name} ready in {state['start_latency']:.2f}s (pid {process.pid})")
+        return True
+
+    def _start_when_ready(self, name: str, started: float) -> None:
+        spec = self.specs[name]
+        for dependency in spec.depends_on:
+            self._ready[dependency].wait()
+            if self.state[dependency]['status'] != 'ready':
+                self.state[name]['status'] = 'blocked'
+                self._ready[name].set()
+                return
+        if self._stopping.is_set():
+            return
+        if not self._launch(name):
+            self._ready[name].set()
+        self.state[name]['ready_at'] = time.perf_counter() - started
+
+    def start_all(self) -> Dict[str, Any]:
+        """
+        Start every service, each as soon as its dependencies are ready
+
+        Returns:
+            Report with per-service status and start latency; the total
+            duration follows the dependency critical path
+        """
+        started = time.perf_counter()
+        self._stopping.clear()
+        for event in self._ready.values():
+            event.clear()
+
+        threads = [
+            threading.Thread(target=self._start_when_ready, args=(name, started), daemon=True)
+            for name in self.specs
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if self._monitor is None or not self._monitor.is_alive():
+            self._monitor = threading.Thread(target=self._monitor_loop, daemon=True)
+            self._monitor.start()
+
+        services = {
+            name: {
+                'status': state['status'],
+                'start_latency': state['start_latency'],
+                'ready_at': state.get('ready_at')
+            }
+            for name, state in self.state.items()
+        }
+        return {
+            'success': all(s['status'] == 'ready' for s in services.values()),
+            'services': services,
+            'duration': time.perf_counter() - started
+        }
+
+    def _backoff(self, crashes: int) -> float:
+        return min(self.backoff_base * (2 ** max(crashes - 1, 0)), self.backoff_max)
+
+    def _schedule_retry(self, name: str) -> None:
+        """Hand a service that failed to come back to the monitor, which retries it after a backoff"""
+        if self._stopping.is_set():
+            return
+        state = self.state[name]
+        state['status'] = 'crashed'
+        state['crashes'] += 1
+        state['restart_at'] = time.monotonic() + self._backoff(state['crashes'])
+
+    def _relaunch(self, name: str) -> None:
+        self.state[name]['restarts'] += 1
+        if not self._launch(name):
+            self._schedule_retry(name)
+
+    def _monitor_loop(self) -> None:
+        """Restart crashed children with exponential backoff"""
+        while not self._stopping.wait(0.2):
+            now = time.monotonic()
+            for name in self.specs:
+                state = self.state[name]
+                if state['status'] == 'crashed' and now >= state.get('restart_at', now):
+                    # Checked first: a failed relaunch has already dropped the process entry
+                    state['status'] = 'starting'
+                    threading.Thread(target=self._relaunch, args=(name,), daemon=True).start()
+                    continue
+
+                with self._lock:
+                    process = self.processes.get(name)
+                if process is None:
+                    continue
+
+                if state['status'] == 'ready' and process.poll() is not None:
+                    uptime = time.time() - state.get('started_at', time.time())
+                    state['crashes'] = 1 if uptime >= self.stable_after else state['crashes'] + 1
+                    delay = self._backoff(state['crashes'])
+                    state['status'] = 'crashed'
+                    state['restart_at'] = now + delay
+                    self._ready[name].clear()
+                    logger.warning(f"{name} exited with code {process.returncode}; restarting in {delay:.1f}s")
+
+    def _terminate(self, name: str, timeout: float = 10) -> None:
+        with self._lock:
+            process = self.processes.pop(name, None)
+        if process is None or process.poll() is not None:
+            return
+        process.terminate()
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    def restart_service(self, name: str) -> bool:
+        """Stop and start one service, waiting for it to become ready again"""
+        state = self.state[name]
+        state['status'] = 'restarting'
+        self._ready[name].clear()
+        self._terminate(name)
+        state['restarts'] += 1
+        if not self._launch(name):
+            # Left as 'failed' the monitor would never touch it again
+            self._schedule_retry(name)
+            return False
+        return True
+
+    def restart_services(self, names: Iterable[str]) -> Dict[str, bool]:
+        """Restart the named services that this supervisor runs, dependencies first"""
+        wanted = {name for name in names if name in self.specs}
+        ordered: List[str] = []
+
+        def visit(name: str) -> None:
+            if name in ordered:
+                return
+            for dependency in self.specs[name].depends_on:
+                visit(dependency)
+            ordered.append(name)
+
+        for name in self.specs:
+            visit(name)
+        return {name: self.restart_service(name) for name in ordered if name in wanted}
+
+    def pids(self) -> Dict[str, int]:
+        """PIDs of the running children"""
+        with self._lock:
+            return {name: p.pid for name, p in self.processes.items() if p.poll() is None}
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Per-service status, restart counts and start latency"""
+        return {name: dict(state) for name, state in self.state.items()}
+
+    def stop(self) -> None:
+        """Stop every child, dependents first"""
+        self._stopping.set()
+        stopped = set()
+
+        def stop(name: str) -> None:
+            if name in stopped:
+                return
+            stopped.add(name)
+            for other, spec in self.specs.items():
+                if name in spec.depends_on:
+                    stop(other)
+            self._terminate(name)
+            self.state[name]['status'] = 'stopped'
+
+        for name in self.specs:
+            stop(name)
+        if self._monitor is not None:
+            self._monitor.join(timeout=5)
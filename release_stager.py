@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Pre-staged releases for Field-Elevate-Hub
+Each new commit is checked out into its own git worktree under releases/,
+dependencies are installed, services are built and a smoke check runs
+there, and only then is the ``current`` symlink swapped to it in one
+atomic rename
+"""
+
+import os
+import time
+import shutil
+import logging
+import subprocess
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Callable
+
+from git_backend import GitRepository
+from hub_services import service_paths
+from install_cache import InstallCache, build_services, lockfile_hash
+
+logger = logging.getLogger(__name__)
+
+CURRENT_LINK = "current"
+
+
+def _default_installer(root: Path) -> Dict[str, Any]:
+    return InstallCache(root).install()
+
+
+class ReleaseStager:
+    """Stages commits in side worktrees and switches the active release atomically"""
+
+    def __init__(self, repo_path: Path, releases_dir: Optional[Path] = None, keep: int = 3,
+                 smoke_command: Optional[List[str]] = None, smoke_timeout: float = 120,
+                 installer: Optional[Callable[[Path], Dict[str, Any]]] = None,
+                 builder: Optional[Callable[[Path], Dict[str, Any]]] = None):
+        """
+        Initialize release stager
+
+        Args:
+            repo_path: Main checkout that owns the worktrees
+            releases_dir: Directory holding release worktrees and the ``current`` link
+            keep: Inactive releases kept for quick rollback
+            smoke_command: Command run in a staged release; non-zero exit rejects it
+            smoke_timeout: Seconds allowed for the smoke command
+            installer: Installs dependencies in a release root; returns an
+                InstallCache-style report (defaults to InstallCache)
+            builder: Builds the services that run from dist/ in a release root;
+                returns a build_services()-style report (defaults to build_services)
+        """
+        self.repo_path = Path(repo_path)
+        self.releases_dir = Path(releases_dir) if releases_dir else self.repo_path / "releases"
+        self.current_link = self.releases_dir / CURRENT_LINK
+        self.keep = keep
+        self.smoke_command = smoke_command
+        self.smoke_timeout = smoke_timeout
+        self.installer = installer or _default_installer
+        self.builder = builder or build_services
+
+    def _git(self, *args: str, timeout: int = 300) -> subprocess.CompletedProcess:
+        return subprocess.run(['git', *args], cwd=self.repo_path, capture_output=True, text=True, timeout=timeout)
+
+    def release_dir(self, commit: str) -> Path:
+        return self.releases_dir / commit[:12]
+
+    def current(self) -> Optional[Path]:
+        """Directory the ``current`` link points to, if any"""
+        if not self.current_link.is_symlink():
+            return None
+        target = self.current_link.resolve()
+        return target if target.is_dir() else None
+
+    @staticmethod
+    def release_commit(path: Path) -> Optional[str]:
+        """Commit checked out in a release worktree"""
+        repo = GitRepository.discover(path)
+        return repo.head_commit() if repo and repo.work_tree == Path(path).resolve() else None
+
+    def current_commit(self) -> Optional[str]:
+        current = self.current()
+        return self.release_commit(current) if current else None
+
+    def _checkout(self, commit: str, path: Path) -> bool:
+        if path.exists():
+            if self.release_commit(path) == commit:
+                return True
+            # Left over from an interrupted stage; start it again from scratch
+            self._remove_worktree(path)
+        self.releases_dir.mkdir(parents=True, exist_ok=True)
+        result = self._git('worktree', 'add', '--detach', '--force', str(path), commit)
+        if result.returncode != 0:
+            logger.error(f"Could not create release worktree for {commit[:8]}: {result.stderr.strip()}")
+            return False
+        return True
+
+    def _seed_dependencies(self, path: Path) -> int:
+        """
+        Hard-link node_modules from the active release where the lockfile is unchanged
+
+        The install step then finds them current and skips ``npm ci``.
+        """
+        current = self.current()
+        if current is None or current == path.resolve():
+            return 0
+        seeded = 0
+        new_services = service_paths(path)
+        for name, old_dir in service_paths(current).items():
+            new_dir = new_services[name]
+            old_modules, new_modules = old_dir / "node_modules", new_dir / "node_modules"
+            if not old_modules.is_dir() or new_modules.exists():
+                continue
+            if lockfile_hash(old_dir) is None or lockfile_hash(old_dir) != lockfile_hash(new_dir):
+                continue
+            try:
+                shutil.copytree(old_modules, new_modules, symlinks=True, copy_function=os.link)
+                seeded += 1
+            except OSError as e:
+                logger.warning(f"Could not reuse node_modules for {name}, installing instead: {e}")
+                shutil.rmtree(new_modules, ignore_errors=True)
+        return seeded
+
+    def _smoke_check(self, path: Path) -> bool:
+        if not self.smoke_command:
+            return True
+        try:
+            result = subprocess.run(self.smoke_command, cwd=path, capture_output=True, text=True,
+                                    timeout=self.smoke_timeout)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.error(f"Smoke check could not run: {e}")
+            return False
+        if result.returncode != 0:
+            logger.error(f"Smoke check failed: {(result.stderr or result.stdout).strip()[-500:]}")
+            return False
+        return True
+
+    def stage(self, commit: str) -> Dict[str, Any]:
+        """
+        Check out, install and smoke-test a commit without touching the live release
+
+        Returns:
+            Dict with success, release path, step timings and a failure reason
+        """
+        path = self.release_dir(commit)
+        timings: Dict[str, float] = {}
+        report = {'success': False, 'commit': commit, 'path': path, 'timings': timings}
+
+        started = time.perf_counter()
+        if not self._checkout(commit, path):
+            report['reason'] = 'checkout failed'
+            return report
+        timings['checkout'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        report['seeded'] = self._seed_dependencies(path)
+        install = self.installer(path)
+        timings['install'] = time.perf_counter() - started
+        if not install.get('success', False):
+            report['reason'] = f"dependency install failed: {', '.join(install.get('failed', []))}"
+            return report
+
+        # Seeded node_modules skip npm ci and its prepare script, so dist/ is built here
+        started = time.perf_counter()
+        build = self.builder(path)
+        timings['build'] = time.perf_counter() - started
+        if not build.get('success', False):
+            report['reason'] = f"build failed: {', '.join(build.get('failed', []))}"
+            return report
+
+        started = time.perf_counter()
+        smoke_ok = self._smoke_check(path)
+        timings['smoke'] = time.perf_counter() - started
+        if not smoke_ok:
+            report['reason'] = 'smoke check failed'
+            return report
+
+        report['success'] = True
+        logger.info(
+            f"Staged release {commit[:8]} in {sum(timings.values()):.1f}s "
+            f"(checkout {timings['checkout']:.1f}s, install {timings['install']:.1f}s, "
+            f"build {timings['build']:.1f}s, smoke {timings['smoke']:.1f}s)"
+        )
+        return report
+
+    def activate(self, path: Path) -> Optional[Path]:
+        """
+        Point ``current`` at a staged release with a single atomic rename
+
+        Returns:
+            The previously active release, if any
+        """
+        previous = self.current()
+        self.releases_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.releases_dir / f".{CURRENT_LINK}.{os.getpid()}.tmp"
+        if tmp.is_symlink() or tmp.exists():
+            tmp.unlink()
+        # Relative target so the releases directory can be moved as a whole
+        os.symlink(os.path.relpath(path, self.releases_dir), tmp, target_is_directory=True)
+        os.replace(tmp, self.current_link)
+        logger.info(f"Active release is now {Path(path).name}")
+        return previous
+
+    def _remove_worktree(self, path: Path) -> None:
+        result = self._git('worktree', 'remove', '--force', str(path))
+        if result.returncode != 0 and path.exists():
+            shutil.rmtree(path, ignore_errors=True)
+        self._git('worktree', 'prune')
+
+    def releases(self) -> List[Path]:
+        """Release worktrees, oldest first"""
+        if not self.releases_dir.exists():
+            return []
+        dirs = [p for p in self.releases_dir.iterdir()
+                if p.is_dir() and not p.is_symlink() and not p.name.startswith('.')]
+        return sorted(dirs, key=lambda p: p.stat().st_mtime)
+
+    def prune(self) -> List[Path]:
+        """Remove all but the active release and the newest `keep` others"""
+        current = self.current()
+        inactive = [p for p in self.releases() if p.resolve() != current]
+        removed = inactive[:-self.keep] if self.keep > 0 else inactive
+        for path in removed:
+            self._remove_worktree(path)
+            logger.info(f"Removed old release {path.name}")
+        return removed
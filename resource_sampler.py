@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Resource sampler for services started by the Field-Elevate-Hub launcher
+Reads RSS, CPU time, open file descriptors and thread count straight from
+/proc, keeps a bounded history per service tagged with the live commit, and
+flags a regression when a new release uses notably more than the previous one
+"""
+
+import os
+import time
+import logging
+import threading
+from collections import deque
+from typing import Optional, Dict, Any, List, Callable, Deque
+
+import updater_metrics
+
+logger = logging.getLogger(__name__)
+
+PROC = "/proc"
+METRICS = ("rss_bytes", "cpu_percent", "fds", "threads")
+_GAUGES = {
+    "rss_bytes": updater_metrics.SERVICE_RSS,
+    "cpu_percent": updater_metrics.SERVICE_CPU,
+    "fds": updater_metrics.SERVICE_FDS,
+    "threads": updater_metrics.SERVICE_THREADS,
+}
+
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def read_process(pid: int, proc: str = PROC) -> Optional[Dict[str, float]]:
+    """
+    One raw reading for a process
+
+    Returns:
+        Dict with rss_bytes, cpu_seconds, fds and threads, or None if the
+        process is gone or /proc is unavailable
+    """
+    try:
+        with open(f"{proc}/{pid}/stat", 'rb') as f:
+            stat = f.read()
+        fds = len(os.listdir(f"{proc}/{pid}/fd"))
+    except OSError:
+        return None
+    # The command name may contain spaces or parentheses; fields follow the last ')'
+    fields = stat[stat.rfind(b')') + 2:].split()
+    return {
+        "rss_bytes": int(fields[21]) * _PAGE_SIZE,
+        "cpu_seconds": (int(fields[11]) + int(fields[12])) / _CLOCK_TICKS,
+        "fds": fds,
+        "threads": int(fields[17]),
+    }
+
+
+class _Aggregate:
+    """Running sums of one service's samples under one commit"""
+
+    def __init__(self):
+        self.count = 0
+        self.sums = dict.fromkeys(METRICS, 0.0)
+
+    def add(self, sample: Dict[str, Any]) -> None:
+        self.count += 1
+        for metric in METRICS:
+            self.sums[metric] += sample[metric]
+
+    def means(self) -> Dict[str, float]:
+        return {metric: total / self.count for metric, total in self.sums.items()} if self.count else {}
+
+
+class ResourceSampler:
+    """Periodically samples the launcher's child processes"""
+
+    def __init__(self, pids: Callable[[], Dict[str, int]], commit: Callable[[], Optional[str]],
+                 interval: float = 15, history: int = 240, regression_ratio: float = 1.5,
+                 min_samples: int = 8, on_regression: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+                 proc: str = PROC):
+        """
+        Initialize resource sampler
+
+        Args:
+            pids: Returns service name -> PID of the running children (e.g. ProcessSupervisor.pids)
+            commit: Returns the commit currently live; read once per new process
+            interval: Seconds between samples
+            history: Samples kept per service
+            regression_ratio: Flag a metric whose mean under the new commit exceeds
+                this multiple of its mean under the previous commit
+            min_samples: Samples needed under both commits before comparing
+            on_regression: Called with newly detected regressions
+            proc: procfs mount point (for tests)
+        """
+        self.pids = pids
+        self.commit = commit
+        self.interval = interval
+        self.history = history
+        self.regression_ratio = regression_ratio
+        self.min_samples = min_samples
+        self.on_regression = on_regression
+        self.proc = proc
+        self.samples: Dict[str, Deque[Dict[str, Any]]] = {}
+        # service -> [(commit, aggregate)], newest last; only the last two commits matter
+        self._aggregates: Dict[str, List[Any]] = {}
+        self._last_pid: Dict[str, Any] = {}  # service -> (pid, cpu seconds, reading time, commit)
+        self._reported = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def sample_once(self) -> Dict[str, Dict[str, Any]]:
+        """Take one sample of every running child; returns the new samples by service"""
+        now = time.monotonic()
+        taken = {}
+        for service, pid in self.pids().items():
+            raw = read_process(pid, self.proc)
+            if raw is None:
+                continue
+            previous = self._last_pid.get(service)
+            if previous is None or previous[0] != pid:
+                # A new process runs whatever commit is live now; CPU% needs a second reading
+                self._last_pid[service] = (pid, raw["cpu_seconds"], now, self.commit())
+                continue
+            _, cpu_before, then, commit = previous
+            self._last_pid[service] = (pid, raw["cpu_seconds"], now, commit)
+            if now <= then:
+                continue
+            sample = {
+                "time": time.time(),
+                "commit": commit,
+                "pid": pid,
+                "rss_bytes": raw["rss_bytes"],
+                "cpu_percent": 100.0 * (raw["cpu_seconds"] - cpu_before) / (now - then),
+                "fds": raw["fds"],
+                "threads": raw["threads"],
+            }
+            with self._lock:
+                self.samples.setdefault(service, deque(maxlen=self.history)).append(sample)
+                aggregates = self._aggregates.setdefault(service, [])
+                if not aggregates or aggregates[-1][0] != commit:
+                    aggregates.append((commit, _Aggregate()))
+                    del aggregates[:-2]
+                aggregates[-1][1].add(sample)
+            taken[service] = sample
+            for metric, gauge in _GAUGES.items():
+                gauge.labels(service=service).set(sample[metric])
+
+        new = [r for r in self.regressions() if (r["service"], r["metric"], r["commit"]) not in self._reported]
+        for regression in new:
+            self._reported.add((regression["service"], regression["metric"], regression["commit"]))
+            updater_metrics.RESOURCE_REGRESSION.labels(
+                service=regression["service"], metric=regression["metric"]).set(regression["ratio"])
+            logger.warning(
+                f"{regression['service']} {regression['metric']} is {regression['ratio']:.2f}x the previous release "
+                f"({regression['previous']:.1f} -> {regression['current']:.1f}) since {str(regression['commit'])[:8]}",
+                extra={'commit': regression['commit']}
+            )
+        if new and self.on_regression is not None:
+            self.on_regression(new)
+        return taken
+
+    def regressions(self) -> List[Dict[str, Any]]:
+        """Metrics whose mean under the live commit exceeds the ratio against the previous commit"""
+        found = []
+        with self._lock:
+            pairs = {service: list(aggs) for service, aggs in self._aggregates.items() if len(aggs) == 2}
+        for service, ((previous_commit, previous), (commit, current)) in pairs.items():
+            if previous.count < self.min_samples or current.count < self.min_samples:
+                continue
+            before, after = previous.means(), current.means()
+            for metric in METRICS:
+                if before[metric] > 0 and after[metric] > before[metric] * self.regression_ratio:
+                    found.append({
+                        "service": service,
+                        "metric": metric,
+                        "commit": commit,
+                        "previous_commit": previous_commit,
+                        "previous": before[metric],
+                        "current": after[metric],
+                        "ratio": after[metric] / before[metric],
+                    })
+        return found
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Latest sample and per-commit means for every service"""
+        with self._lock:
+            return {
+                service: {
+                    "latest": dict(self.samples[service][-1]) if self.samples.get(service) else None,
+                    "by_commit": {commit: {"samples": agg.count, **agg.means()}
+                                  for commit, agg in self._aggregates.get(service, [])},
+                }
+                for service in self.samples
+            }
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.sample_once()
+            except Exception as e:
+                logger.error(f"Resource sampling failed: {e}")
+            self._stop.wait(self.interval)
+
+    def start(self) -> bool:
+        """Sample in a background thread; False where /proc is unavailable"""
+        if not os.path.isdir(f"{self.proc}/self"):
+            logger.info("Resource sampling needs /proc; not available on this platform")
+            return False
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
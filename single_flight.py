@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Single-flight coordination for Field-Elevate-Hub update checks
+Callers that arrive while a check is already running, in this process or
+in another updater process on the host, wait for it and share its result
+instead of fetching and pulling a second time. Other work that rewrites
+the checkout (rollbacks, release swaps) holds the same lock via exclusive()
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Dict, Any, Callable, Tuple, Iterator
+
+from file_lock import FileLock, atomic_write_text
+
+logger = logging.getLogger(__name__)
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """At most one run of a function at a time per host; concurrent callers share its result"""
+
+    def __init__(self, lock_path: Optional[Path] = None, timeout: Optional[float] = 1800):
+        """
+        Initialize single-flight coordinator
+
+        Args:
+            lock_path: Host-level lock file; None coordinates threads in this process only
+            timeout: Seconds to wait for another process's run (None waits forever)
+        """
+        self.lock_path = Path(lock_path) if lock_path else None
+        self.result_path = self.lock_path.with_name(self.lock_path.name + ".result.json") if lock_path else None
+        self._host_lock = FileLock(self.lock_path, timeout=timeout) if lock_path else threading.Lock()
+        self._mutex = threading.Lock()
+        self._flight: Optional[_Flight] = None
+        self._owner: Optional[int] = None  # thread holding the host lock
+
+    def run(self, fn: Callable[[], Dict[str, Any]]) -> Tuple[Dict[str, Any], bool]:
+        """
+        Run fn unless a run is already in flight, then share that run's result
+
+        Returns:
+            (result, shared) where shared is True if another caller did the work
+
+        Raises:
+            FileLockTimeout: If another process's run outlasted the timeout
+        """
+        with self._mutex:
+            flight = self._flight
+            leader = flight is None
+            if leader:
+                flight = self._flight = _Flight()
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True
+
+        shared = False
+        try:
+            flight.result, shared = self._run_on_host(fn)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._mutex:
+                self._flight = None
+            flight.done.set()
+        return flight.result, shared
+
+    def _run_on_host(self, fn: Callable[[], Dict[str, Any]]) -> Tuple[Dict[str, Any], bool]:
+        waiting_since = time.time()
+        if not self._host_lock.acquire(blocking=False):
+            logger.info("Another update check or rollback is running on this host; waiting for it")
+            self._host_lock.acquire()
+            shared = self._result_since(waiting_since)
+            if shared is not None:
+                self._host_lock.release()
+                return shared, True
+        self._owner = threading.get_ident()
+        try:
+            result = fn()
+            if self.result_path is not None:
+                try:
+                    atomic_write_text(self.result_path, json.dumps(
+                        {"finished": time.time(), "pid": os.getpid(), "result": result}, default=str))
+                except OSError as e:
+                    logger.warning(f"Could not record check result for other processes: {e}")
+            return result, False
+        finally:
+            self._owner = None
+            self._host_lock.release()
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        """
+        Hold the host lock without sharing anything, for work that must not overlap a run
+
+        Re-entrant for the thread already holding the lock, so code called
+        from inside a run may use it too.
+
+        Raises:
+            FileLockTimeout: If another process held the lock past the timeout
+        """
+        if self._owner == threading.get_ident():
+            yield
+            return
+        self._host_lock.acquire()
+        self._owner = threading.get_ident()
+        try:
+            yield
+        finally:
+            self._owner = None
+            self._host_lock.release()
+
+    def _result_since(self, since: float) -> Optional[Dict[str, Any]]:
+        """Result written by a run that finished after since, if any"""
+        if self.result_path is None:
+            return None
+        try:
+            record = json.loads(self.result_path.read_text())
+        except (OSError, ValueError):
+            return None
+        return record.get("result") if record.get("finished", 0) >= since else None
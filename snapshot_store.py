@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Content-addressed snapshot store for Field-Elevate-Hub backups
+Stores each file once by SHA-256; every snapshot is a small JSON manifest
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import logging
+from pathlib import Path
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, List, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXCLUDES = ('.git', 'backups', 'logs', 'releases', '__pycache__', '.pytest_cache', 'node_modules')
+
+_HASH_CHUNK = 1024 * 1024
+
+
+class SnapshotStore:
+    """Deduplicated, incremental snapshots of a working tree"""
+
+    def __init__(self, root: Path, excludes: Iterable[str] = DEFAULT_EXCLUDES):
+        """
+        Initialize snapshot store
+
+        Args:
+            root: Directory holding the store (``objects/`` and ``snapshots/``)
+            excludes: Directory or file names skipped at any depth
+        """
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.snapshots_dir = self.root / "snapshots"
+        self.excludes = set(excludes)
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def _walk(self, source: Path) -> Iterable[Tuple[str, os.stat_result]]:
+        """Yield (relative posix path, stat) for every regular file under source"""
+        stack = [source]
+        while stack:
+            current = stack.pop()
+            try:
+                entries = list(os.scandir(current))
+            except OSError as e:
+                logger.warning(f"Skipping unreadable directory {current}: {e}")
+                continue
+            for entry in entries:
+                if entry.name in self.excludes or entry.is_symlink():
+                    continue
+                if entry.is_dir():
+                    stack.append(Path(entry.path))
+                elif entry.is_file():
+                    rel = Path(entry.path).relative_to(source).as_posix()
+                    yield rel, entry.stat()
+
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _store_blob(self, path: Path, digest: str) -> bool:
+        """Copy a file into the object store; returns False if the blob already existed"""
+        target = self._object_path(digest)
+        if target.exists():
+            return False
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        shutil.copyfile(path, tmp)
+        os.replace(tmp, target)
+        # Blobs are shared between snapshots and restores; keep them read-only
+        os.chmod(target, 0o444)
+        return True
+
+    def list_snapshots(self) -> List[str]:
+        """Return snapshot ids, oldest first"""
+        if not self.snapshots_dir.exists():
+            return []
+        return sorted(p.stem for p in self.snapshots_dir.glob("*.json"))
+
+    def load_manifest(self, snapshot_id: str) -> Dict[str, Any]:
+        """Load a snapshot manifest"""
+        with open(self.snapshots_dir / f"{snapshot_id}.json", 'r') as f:
+            return json.load(f)
+
+    def latest_manifest(self) -> Optional[Dict[str, Any]]:
+        """Load the newest snapshot manifest, if any"""
+        snapshots = self.list_snapshots()
+        if not snapshots:
+            return None
+        try:
+            return self.load_manifest(snapshots[-1])
+        except Exception as e:
+            logger.warning(f"Could not read latest snapshot manifest: {e}")
+            return None
+
+    def create_snapshot(self, source: Path, label: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Snapshot a directory tree
+
+        Files whose size and mtime match the previous snapshot reuse its hash
+        without being read, so the cost scales with what changed.
+
+        Args:
+            source: Directory to snapshot
+            label: Optional free-form label stored in the manifest (e.g. a commit)
+
+        Returns:
+            Dict with the snapshot id, file count, new blob count and bytes added
+        """
+        source = Path(source)
+        previous = self.latest_manifest()
+        previous_files = previous.get("files", {}) if previous else {}
+
+        files: Dict[str, Dict[str, Any]] = {}
+        new_blobs = 0
+        bytes_added = 0
+        hashed = 0
+
+        for rel, st in self._walk(source):
+            prior = previous_files.get(rel)
+            if prior and prior["size"] == st.st_size and prior["mtime_ns"] == st.st_mtime_ns \
+                    and self._object_path(prior["hash"]).exists():
+                digest = prior["hash"]
+            else:
+                digest = self._hash_file(source / rel)
+                hashed += 1
+                if self._store_blob(source / rel, digest):
+                    new_blobs += 1
+                    bytes_added += st.st_size
+            files[rel] = {
+                "hash": digest,
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+                "mode": st.st_mode & 0o777,
+            }
+
+        created = datetime.now()
+        snapshot_id = created.strftime("%Y%m%d_%H%M%S_%f")
+        manifest = {
+            "id": snapshot_id,
+            "created": created.isoformat(),
+            "label": label,
+            "source": str(source),
+            "files": files,
+        }
+        self.snapshots_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.snapshots_dir / f".{snapshot_id}.json.tmp"
+        with open(tmp, 'w') as f:
+            json.dump(manifest, f, separators=(',', ':'))
+        os.replace(tmp, self.snapshots_dir / f"{snapshot_id}.json")
+
+        return {
+            "id": snapshot_id,
+            "files": len(files),
+            "hashed": hashed,
+            "new_blobs": new_blobs,
+            "bytes_added": bytes_added,
+        }
+
+    def restore(self, snapshot_id: str, target: Path, paths: Optional[Iterable[str]] = None) -> int:
+        """
+        Restore files from a snapshot
+
+        Args:
+            snapshot_id: Snapshot to restore from
+            target: Directory to write into
+            paths: Optional subset of relative paths; defaults to every file
+
+        Returns:
+            Number of files written
+        """
+        manifest = self.load_manifest(snapshot_id)
+        files = manifest["files"]
+        selected = files.keys() if paths is None else [p for p in paths if p in files]
+        target = Path(target)
+        restored = 0
+        for rel in selected:
+            entry = files[rel]
+            dest = target / rel
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            tmp = dest.with_name(f".{dest.name}.restore.tmp")
+            shutil.copyfile(self._object_path(entry["hash"]), tmp)
+            os.chmod(tmp, entry.get("mode", 0o644))
+            os.replace(tmp, dest)
+            restored += 1
+        return restored
+
+    def prune(self, keep_last: Optional[int] = None, keep_days: Optional[float] = None) -> Dict[str, int]:
+        """
+        Apply the retention policy and garbage-collect unreferenced blobs
+
+        A snapshot survives if it is among the newest ``keep_last`` or younger
+        than ``keep_days``. The newest snapshot is always kept.
+
+        Returns:
+            Dict with counts of removed snapshots and blobs, and bytes freed
+        """
+        snapshots = self.list_snapshots()
+        if not snapshots:
+            return {"snapshots_removed": 0, "blobs_removed": 0, "bytes_freed": 0}
+
+        keep = {snapshots[-1]}
+        if keep_last is not None:
+            keep.update(snapshots[-keep_last:] if keep_last > 0 else [])
+        if keep_days is not None:
+            cutoff = datetime.now() - timedelta(days=keep_days)
+            for snapshot_id in snapshots:
+                if datetime.strptime(snapshot_id, "%Y%m%d_%H%M%S_%f") >= cutoff:
+                    keep.add(snapshot_id)
+        if keep_last is None and keep_days is None:
+            keep.update(snapshots)
+
+        removed = 0
+        for snapshot_id in snapshots:
+            if snapshot_id not in keep:
+                (self.snapshots_dir / f"{snapshot_id}.json").unlink()
+                removed += 1
+
+        referenced = set()
+        for snapshot_id in keep:
+            try:
+                referenced.update(e["hash"] for e in self.load_manifest(snapshot_id)["files"].values())
+            except Exception as e:
+                # Never collect blobs while a manifest is unreadable
+                logger.error(f"Aborting blob GC, unreadable manifest {snapshot_id}: {e}")
+                return {"snapshots_removed": removed, "blobs_removed": 0, "bytes_freed": 0}
+
+        blobs_removed = 0
+        bytes_freed = 0
+        if self.objects_dir.exists():
+            for bucket in os.scandir(self.objects_dir):
+                if not bucket.is_dir():
+                    continue
+                for blob in os.scandir(bucket.path):
+                    if bucket.name + blob.name in referenced:
+                        continue
+                    bytes_freed += blob.stat().st_size
+                    os.chmod(blob.path, 0o644)
+                    os.unlink(blob.path)
+                    blobs_removed += 1
+
+        return {"snapshots_removed": removed, "blobs_removed": blobs_removed, "bytes_freed": bytes_freed}
@@ -16,7 +16,18 @@ def start_auto_updater():
         from auto_updater import FieldElevateAutoUpdater
         
         updater = FieldElevateAutoUpdater()
+        updater.configure_logging()
         if updater._is_git_repo():
+            if updater.config.get("multi_repo", False):
+                # Watch the Hub checkout plus any separately checked-out services
+                from update_manager import UpdateManager, discover_repositories
+                
+                updater = UpdateManager.from_paths(
+                    discover_repositories(updater.repo_path),
+                    max_concurrency=updater.config.get("max_concurrency", 4),
+                    repo_timeout=updater.config.get("repo_timeout", 120),
+                    check_interval=updater.config.get("check_interval", 1800)
+                )
             updater.start_auto_update()
             print("🔄 Field Elevate auto-updater started successfully")
             return updater
@@ -27,30 +38,126 @@ def start_auto_updater():
         print(f"⚠️ Auto-updater failed to start: {e}")
         return None
 
-def start_field_elevate_app():
-    """Start the Field Elevate Hub application"""
+def install_dependencies(node_version: str = "", root: Path = None) -> bool:
+    """Install service dependencies whose lockfiles changed, in parallel"""
+    from install_cache import InstallCache
+    
+    cache = InstallCache(root or Path(__file__).parent, extra_key=node_version)
+    report = cache.install()
+    
+    for name, result in report['results'].items():
+        if result['status'] == 'installed':
+            print(f"  ✅ {name}: installed in {result['duration']:.1f}s")
+        elif result['status'] == 'failed':
+            print(f"  ❌ {name}: install failed")
+    if not report['success']:
+        print(f"❌ Dependency install failed for: {', '.join(report['failed'])}")
+        return False
+    print(f"📦 Dependencies ready ({report['mode']} start: {len(report['installed'])} installed, "
+          f"{len(report['skipped'])} up to date, {report['duration']:.1f}s)")
+    return True
+
+def start_field_elevate_app(updater=None):
+    """Start the Field Elevate Hub application; returns the running app handle or None"""
     try:
         # Check if Node.js is available
         import subprocess
         result = subprocess.run(['node', '--version'], capture_output=True, text=True)
         if result.returncode != 0:
             print("❌ Node.js not found. Please install Node.js to run Field-Elevate-Hub")
-            return False
+            return None
         
-        print("📦 Installing dependencies...")
-        subprocess.run(['npm', 'install'], check=True)
+        root = Path(__file__).parent
+        if hasattr(updater, 'prepare_release'):
+            # In staged_releases mode services run from the active release worktree
+            if not updater.prepare_release():
+                print("❌ Could not stage the current release")
+                return None
+            root = updater.app_root()
         
-        print("🚀 Starting Field-Elevate-Hub server...")
-        # Start the server (adjust the command based on your package.json scripts)
-        subprocess.run(['npm', 'start'], check=True)
+        print("📦 Checking dependencies...")
+        if not install_dependencies(node_version=result.stdout.strip(), root=root):
+            return None
         
-        return True
+        config = getattr(updater, 'config', {})
+        if config.get("restart_mode") == "blue_green":
+            # Serve through a local proxy so auto-update restarts never refuse connections
+            from blue_green import BlueGreenServer
+            
+            node_version = result.stdout.strip()
+            server = BlueGreenServer(
+                root,
+                port=int(os.environ.get('PORT', 3000)),
+                prepare=lambda: install_dependencies(node_version=node_version, root=root)
+            )
+            if not server.start():
+                print("❌ Field-Elevate-Hub server failed its health check")
+                return None
+            if updater:
+                updater.blue_green = server
+            print(f"🚀 Field-Elevate-Hub serving on port {server.port} with blue/green restarts")
+            return server
+        
+        print("🚀 Starting Field-Elevate-Hub services...")
+        from process_supervisor import ProcessSupervisor, default_specs
+        
+        supervisor = ProcessSupervisor(default_specs(
+            root,
+            config.get("services", ["hub"]),
+            config.get("service_overrides")
+        ))
+        report = supervisor.start_all()
+        for name, service in report['services'].items():
+            if service['status'] == 'ready':
+                print(f"  ✅ {name}: ready in {service['start_latency']:.1f}s")
+            else:
+                print(f"  ❌ {name}: {service['status']}")
+        print(f"⏱️ Stack started in {report['duration']:.1f}s")
+        if not report['success']:
+            supervisor.stop()
+            return None
+        
+        if updater:
+            updater.supervisor = supervisor
+        return supervisor
     except subprocess.CalledProcessError as e:
         print(f"❌ Error starting Field-Elevate-Hub: {e}")
-        return False
+        return None
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
-        return False
+        return None
+
+def start_resource_sampler(updater, app):
+    """Sample the launched services' memory, CPU, fds and threads, tagged with the live commit"""
+    config = getattr(updater, 'config', {})
+    if not app or not hasattr(app, 'pids') or not config.get("resource_sampling", True):
+        return None
+    from resource_sampler import ResourceSampler
+    
+    publish = getattr(updater, '_publish_status', None)
+    sampler = ResourceSampler(
+        app.pids,
+        lambda: getattr(updater, 'last_commit', None),
+        interval=config.get("resource_sample_interval", 15),
+        history=config.get("resource_history", 240),
+        regression_ratio=config.get("resource_regression_ratio", 1.5),
+        min_samples=config.get("resource_min_samples", 8),
+        on_regression=(lambda found: publish()) if publish else None
+    )
+    if not sampler.start():
+        return None
+    if updater:
+        updater.sampler = sampler
+    return sampler
+
+def stop_application(updater, app=None, sampler=None) -> None:
+    """Stop the auto-updater, the resource sampler and the running services"""
+    if updater:
+        updater.stop_auto_update()
+    if sampler:
+        sampler.stop()
+    if app:
+        app.stop()
 
 def main():
     """Main startup function"""
@@ -63,10 +170,17 @@ def main():
     # Start the Field Elevate Hub application
     print("🏗️ Starting Field-Elevate-Hub application...")
     
+    app = None
+    sampler = None
     try:
         # Start the application
-        if start_field_elevate_app():
+        app = start_field_elevate_app(updater)
+        if app:
             print("✅ Field-Elevate-Hub application started successfully")
+            # An update applied before this start has not been health-checked yet
+            if hasattr(updater, 'verify_pending_update') and not updater.verify_pending_update():
+                print("⚠️ The last update failed its health checks and was rolled back")
+            sampler = start_resource_sampler(updater, app)
             print("🔄 Auto-updates are running in the background")
             print("\nPress Ctrl+C to stop the application")
             
@@ -75,18 +189,15 @@ def main():
                 time.sleep(1)
         else:
             print("❌ Failed to start Field-Elevate-Hub application")
-            if updater:
-                updater.stop_auto_update()
+            stop_application(updater)
             
     except KeyboardInterrupt:
         print("\n🛑 Shutting down Field-Elevate-Hub...")
-        if updater:
-            updater.stop_auto_update()
+        stop_application(updater, app, sampler)
         print("✅ Application stopped")
     except Exception as e:
         print(f"❌ Application error: {e}")
-        if updater:
-            updater.stop_auto_update()
+        stop_application(updater, app, sampler)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Cached status endpoint for the Field-Elevate-Hub auto-updater
+The updater publishes a status snapshot whenever its state changes; the
+HTTP handler only hands out the pre-serialized body, answering 304 when
+the client already has the current ETag
+"""
+
+import json
+import hashlib
+import logging
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Optional, Dict, Any, Tuple, Iterable
+
+logger = logging.getLogger(__name__)
+
+# Pages allowed to read the status cross-origin: the Hub's own dashboards
+DEFAULT_ALLOWED_ORIGINS = ("http://localhost:3000", "http://127.0.0.1:3000")
+
+
+class StatusSnapshot:
+    """Latest status as ready-to-send JSON bytes plus its ETag"""
+
+    def __init__(self):
+        self._current: Tuple[bytes, str] = (b"{}", '"empty"')
+        self.version = 0
+
+    def publish(self, status: Dict[str, Any]) -> bool:
+        """
+        Replace the snapshot
+
+        Returns:
+            True if the content changed (and so did the ETag)
+        """
+        body = json.dumps(status, default=str, sort_keys=True).encode()
+        etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+        if etag == self._current[1]:
+            return False
+        # A single reference swap, so readers never need a lock
+        self._current = (body, etag)
+        self.version += 1
+        return True
+
+    @property
+    def current(self) -> Tuple[bytes, str]:
+        return self._current
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    candidates = [tag.strip() for tag in header.split(',')]
+    return '*' in candidates or etag in candidates or f'W/{etag}' in candidates
+
+
+class _StatusHandler(BaseHTTPRequestHandler):
+    def _cors_headers(self, server: 'StatusServer') -> None:
+        # Only listed origins; any other web page open in a local browser must not read the status
+        self.send_header("Vary", "Origin")
+        origin = self.headers.get("Origin")
+        if origin and origin in server.allowed_origins:
+            self.send_header("Access-Control-Allow-Origin", origin)
+            self.send_header("Access-Control-Expose-Headers", "ETag")
+
+    def _respond(self, send_body: bool) -> None:
+        server: 'StatusServer' = self.server.status_server
+        if self.path.split('?')[0] != server.path:
+            self.send_error(404)
+            return
+        body, etag = server.snapshot.current
+        if _etag_matches(self.headers.get("If-None-Match"), etag):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self._cors_headers(server)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self._cors_headers(server)
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        self._respond(send_body=True)
+
+    def do_HEAD(self) -> None:
+        self._respond(send_body=False)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class StatusServer:
+    """Local HTTP/JSON endpoint serving a StatusSnapshot"""
+
+    def __init__(self, snapshot: StatusSnapshot, port: int = 9466, host: str = '127.0.0.1',
+                 path: str = '/status', allowed_origins: Optional[Iterable[str]] = None):
+        """
+        Initialize status server
+
+        Args:
+            snapshot: Snapshot the updater publishes to
+            port: Port to listen on (0 picks a free port)
+            host: Interface to bind
+            path: Request path that returns the status
+            allowed_origins: Browser origins that may read the status cross-origin
+                (default: the Hub's dashboards on port 3000)
+        """
+        self.snapshot = snapshot
+        self.port = port
+        self.host = host
+        self.path = path
+        self.allowed_origins = frozenset(DEFAULT_ALLOWED_ORIGINS if allowed_origins is None else allowed_origins)
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def start(self) -> None:
+        """Bind the port and serve on a background thread"""
+        self._server = ThreadingHTTPServer((self.host, self.port), _StatusHandler)
+        self._server.daemon_threads = True
+        self._server.status_server = self
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        logger.info(f"Updater status available at http://{self.host}:{self.port}{self.path}")
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
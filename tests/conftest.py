@@ -0,0 +1,83 @@
+"""
+Shared pytest fixtures for the Python updater and launcher tests
+"""
+
+import os
+import sys
+import subprocess
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+GIT_ENV = {
+    "GIT_AUTHOR_NAME": "Field Elevate Tests",
+    "GIT_AUTHOR_EMAIL": "tests@field-elevate.local",
+    "GIT_COMMITTER_NAME": "Field Elevate Tests",
+    "GIT_COMMITTER_EMAIL": "tests@field-elevate.local",
+    "GIT_CONFIG_NOSYSTEM": "1",
+}
+
+
+def git(cwd, *args) -> str:
+    """Run a git command for test setup and return its stdout"""
+    env = dict(os.environ, **GIT_ENV)
+    result = subprocess.run(
+        ['git', *args], cwd=cwd, env=env, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def commit_file(repo: Path, rel: str, content: str, message: str = None) -> str:
+    """Write a file, commit it and return the new commit hash"""
+    path = Path(repo) / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    git(repo, 'add', rel)
+    git(repo, 'commit', '-q', '-m', message or f"update {rel}")
+    return git(repo, 'rev-parse', 'HEAD')
+
+
+@pytest.fixture(autouse=True)
+def git_identity(monkeypatch):
+    for key, value in GIT_ENV.items():
+        monkeypatch.setenv(key, value)
+
+
+@pytest.fixture
+def remote_and_clone(tmp_path):
+    """A bare 'origin' repository, an upstream working copy and a clone tracking main"""
+    origin = tmp_path / "origin.git"
+    upstream = tmp_path / "upstream"
+    clone = tmp_path / "clone"
+    git(tmp_path, 'init', '-q', '--bare', '-b', 'main', str(origin))
+    git(tmp_path, 'init', '-q', '-b', 'main', str(upstream))
+    commit_file(upstream, 'server.js', "console.log('v1');\n", "initial")
+    git(upstream, 'remote', 'add', 'origin', str(origin))
+    git(upstream, 'push', '-q', 'origin', 'main')
+    git(tmp_path, 'clone', '-q', str(origin), str(clone))
+    return origin, upstream, clone
+
+
+@pytest.fixture
+def make_updater():
+    """Build FieldElevateAutoUpdater instances with config overrides; stopped on teardown"""
+    from auto_updater import FieldElevateAutoUpdater
+    from updater_logging import shutdown_logging
+
+    updaters = []
+
+    def factory(path, **config):
+        updater = FieldElevateAutoUpdater(str(path))
+        # Ephemeral status port so concurrent runs never collide
+        updater.config.update({"status_port": 0, **config})
+        updaters.append(updater)
+        return updater
+
+    yield factory
+    for updater in updaters:
+        updater.stop_auto_update()
+    shutdown_logging()
@@ -0,0 +1,95 @@
+import sys
+import threading
+import urllib.request
+
+import pytest
+
+from blue_green import BlueGreenServer
+
+# Minimal stand-in for server.js: serves /health and reports its pid
+BACKEND = r'''
+import os
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = str(os.getpid()).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+ThreadingHTTPServer(("127.0.0.1", int(os.environ["PORT"])), Handler).serve_forever()
+'''
+
+
+def fetch(port):
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=5) as response:
+        return response.read().decode()
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = BlueGreenServer(tmp_path, port=0, command=[sys.executable, '-c', BACKEND],
+                             health_timeout=10, drain_timeout=2)
+    assert server.start()
+    yield server
+    server.stop()
+
+
+def test_restart_switches_backend_and_stops_old_instance(server):
+    old_process = server.process
+    assert fetch(server.port) == str(old_process.pid)
+
+    assert server.restart()
+
+    assert fetch(server.port) == str(server.process.pid)
+    assert server.process.pid != old_process.pid
+    assert old_process.poll() is not None
+    assert server.pids() == {"hub": server.process.pid}
+
+
+def test_no_refused_connections_during_restart(server):
+    errors = []
+    served = []
+    stop = threading.Event()
+
+    def hammer():
+        while not stop.is_set():
+            try:
+                served.append(fetch(server.port))
+            except Exception as e:
+                errors.append(e)
+
+    worker = threading.Thread(target=hammer)
+    worker.start()
+    try:
+        assert server.restart()
+        assert server.restart()
+    finally:
+        stop.set()
+        worker.join()
+
+    assert errors == []
+    assert len(set(served)) >= 2
+
+
+def test_unhealthy_instance_keeps_old_one_serving(server):
+    old_process = server.process
+    server.command = [sys.executable, '-c', 'import sys; sys.exit(1)']
+
+    assert not server.restart()
+
+    assert server.process is old_process
+    assert fetch(server.port) == str(old_process.pid)
+
+
+def test_failed_prepare_aborts_restart(server):
+    old_process = server.process
+    server.prepare = lambda: False
+
+    assert not server.restart()
+    assert server.process is old_process
@@ -0,0 +1,101 @@
+import time
+
+import pytest
+
+from conftest import git, commit_file
+from fleet_mirror import FleetMirror, MirrorLease, RepositoryMirror
+from webhook_listener import WebhookListener
+
+
+def push_change(upstream, rel, content):
+    commit_file(upstream, rel, content)
+    git(upstream, 'push', '-q', 'origin', 'main')
+    return git(upstream, 'rev-parse', 'HEAD')
+
+
+@pytest.fixture
+def mirror(remote_and_clone, tmp_path):
+    origin, _, _ = remote_and_clone
+    mirror = RepositoryMirror(tmp_path / "mirror" / "hub.git", str(origin))
+    assert mirror.ensure()
+    return mirror
+
+
+def test_lease_is_exclusive_until_released_or_expired(tmp_path):
+    path = tmp_path / "fleet.lease"
+    a = MirrorLease(path, "node-a", ttl=0.3)
+    b = MirrorLease(path, "node-b", ttl=0.3)
+
+    assert a.try_acquire()
+    assert a.try_acquire()
+    assert not b.try_acquire()
+    assert b.holder() == "node-a"
+
+    a.release()
+    assert b.try_acquire()
+    time.sleep(0.4)
+    assert b.holder() is None
+    assert a.try_acquire()
+
+
+def test_leader_sync_reports_moved_branches_and_notifies_followers(remote_and_clone, mirror, tmp_path):
+    _, upstream, _ = remote_and_clone
+    pushes = []
+    listener = WebhookListener(lambda: pushes.append(time.monotonic()), 's3cret', port=0,
+                               host='127.0.0.1', branch='main', debounce=0.05)
+    listener.start()
+    advanced = []
+    fleet = FleetMirror(MirrorLease(tmp_path / "fleet.lease", "leader"), mirror,
+                        followers=[f"http://127.0.0.1:{listener.port}/webhook"], secret='s3cret',
+                        on_advance=advanced.append)
+    try:
+        assert fleet.sync_once() == {}
+        new_tip = push_change(upstream, 'server.js', "console.log('fleet');\n")
+
+        assert fleet.sync_once() == {'main': new_tip}
+        assert fleet.is_leader
+        assert advanced == [{'main': new_tip}]
+        deadline = time.monotonic() + 5
+        while not pushes and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert listener.pushes_received == 1 and pushes
+    finally:
+        fleet.stop()
+        listener.stop()
+    assert fleet.lease.holder() is None
+
+
+def test_follower_sync_does_not_touch_mirror(remote_and_clone, mirror, tmp_path):
+    _, upstream, _ = remote_and_clone
+    lease_path = tmp_path / "fleet.lease"
+    assert MirrorLease(lease_path, "leader").try_acquire()
+    before = mirror.refs()
+    push_change(upstream, 'server.js', "console.log('ignored');\n")
+
+    follower = FleetMirror(MirrorLease(lease_path, "follower"), mirror)
+    assert follower.sync_once() is None
+    assert not follower.is_leader
+    assert mirror.refs() == before
+
+
+def test_updater_fetches_from_mirror(remote_and_clone, mirror, make_updater):
+    _, upstream, clone = remote_and_clone
+    updater = make_updater(clone, backup_before_update=False, fleet_enabled=True,
+                           fleet_mirror_url=f"file://{mirror.path}")
+    new_tip = push_change(upstream, 'server.js', "console.log('via mirror');\n")
+
+    # Upstream moved but the mirror has not fetched yet
+    assert not updater.check_and_update()['updated']
+    assert mirror.update() == {'main': new_tip}
+    assert updater.check_and_update()['updated']
+    assert git(clone, 'rev-parse', 'HEAD') == new_tip
+
+
+def test_updater_falls_back_to_remote_when_mirror_unreachable(remote_and_clone, make_updater, tmp_path):
+    _, upstream, clone = remote_and_clone
+    updater = make_updater(clone, backup_before_update=False, fleet_enabled=True,
+                           fleet_mirror_url=f"file://{tmp_path / 'missing.git'}")
+    new_tip = push_change(upstream, 'server.js', "console.log('fallback');\n")
+
+    assert updater.check_and_update()['updated']
+    assert git(clone, 'rev-parse', 'HEAD') == new_tip
@@ -0,0 +1,58 @@
+import pytest
+
+from conftest import git, commit_file
+from partial_checkout import clone_partial, current_sparse_directories
+
+
+@pytest.fixture
+def partial_node(remote_and_clone, tmp_path):
+    """A node clone holding only data-hub, from an origin that allows filtering"""
+    origin, upstream, _ = remote_and_clone
+    git(origin, 'config', 'uploadpack.allowFilter', 'true')
+    commit_file(upstream, 'data-hub/src/index.js', "module.exports = 1;\n")
+    commit_file(upstream, 'frontend/app.js', "render(1);\n")
+    git(upstream, 'push', '-q', 'origin', 'main')
+    node = tmp_path / "node"
+    assert clone_partial(f"file://{origin}", node, ["data-hub"])
+    return upstream, node
+
+
+def missing_objects(repo):
+    output = git(repo, 'rev-list', '--objects', '--missing=print', 'refs/remotes/origin/main')
+    return {line[1:] for line in output.splitlines() if line.startswith('?')}
+
+
+def test_clone_checks_out_only_node_services(partial_node):
+    _, node = partial_node
+    assert (node / 'server.js').exists()
+    assert (node / 'data-hub/src/index.js').exists()
+    assert not (node / 'frontend').exists()
+    assert current_sparse_directories(node) == ['data-hub']
+
+
+def test_update_fetches_only_needed_blobs(partial_node, make_updater):
+    upstream, node = partial_node
+    updater = make_updater(node, backup_before_update=False, partial_clone=True,
+                           sparse_services=["data-hub"])
+    commit_file(upstream, 'data-hub/src/index.js', "module.exports = 2;\n")
+    commit_file(upstream, 'frontend/app.js', "render(2);\n")
+    git(upstream, 'push', '-q', 'origin', 'main')
+    frontend_blob = git(upstream, 'rev-parse', 'HEAD:frontend/app.js')
+
+    result = updater.check_and_update()
+
+    assert result['updated']
+    assert (node / 'data-hub/src/index.js').read_text() == "module.exports = 2;\n"
+    assert not (node / 'frontend').exists()
+    assert frontend_blob in missing_objects(node)
+
+
+def test_sparse_services_applied_to_existing_full_clone(remote_and_clone, make_updater):
+    _, upstream, clone = remote_and_clone
+    commit_file(upstream, 'frontend/app.js', "render(1);\n")
+    git(upstream, 'push', '-q', 'origin', 'main')
+    updater = make_updater(clone, backup_before_update=False, sparse_services=["data-hub"])
+
+    assert updater.check_and_update()['updated']
+    assert (clone / 'server.js').exists()
+    assert not (clone / 'frontend').exists()
@@ -0,0 +1,178 @@
+import sys
+import time
+
+import pytest
+
+from blue_green import find_free_port
+from process_supervisor import ProcessSupervisor, ServiceSpec, default_specs
+
+# Stand-in service: waits DELAY seconds, then serves /health on PORT
+SERVICE = r'''
+import os, time
+from http.server import HTTPServer, BaseHTTPRequestHandler
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+time.sleep(float(os.environ.get("DELAY", "0")))
+HTTPServer(("127.0.0.1", int(os.environ["PORT"])), Handler).serve_forever()
+'''
+
+
+def spec(tmp_path, name, delay=0.0, depends_on=(), command=None):
+    port = find_free_port()
+    return ServiceSpec(
+        name=name,
+        command=command or [sys.executable, '-c', SERVICE],
+        cwd=tmp_path,
+        env={"PORT": str(port), "DELAY": str(delay)},
+        depends_on=list(depends_on),
+        ready_url=f"http://127.0.0.1:{port}/health",
+        ready_timeout=10,
+    )
+
+
+@pytest.fixture
+def supervisors():
+    started = []
+    yield started
+    for supervisor in started:
+        supervisor.stop()
+
+
+def test_start_follows_dependency_critical_path(tmp_path, supervisors):
+    specs = {
+        "data-hub": spec(tmp_path, "data-hub", delay=0.5),
+        "mcp-hub": spec(tmp_path, "mcp-hub", delay=0.5),
+        "ai-coo": spec(tmp_path, "ai-coo", delay=0.5, depends_on=["data-hub", "mcp-hub"]),
+    }
+    supervisor = ProcessSupervisor(specs)
+    supervisors.append(supervisor)
+
+    report = supervisor.start_all()
+
+    assert report['success']
+    services = report['services']
+    assert services["ai-coo"]['ready_at'] > max(services["data-hub"]['ready_at'], services["mcp-hub"]['ready_at'])
+    assert all(s['start_latency'] >= 0.5 for s in services.values())
+    assert report['duration'] < 1.45
+
+
+def test_failed_dependency_blocks_dependents(tmp_path, supervisors):
+    broken = spec(tmp_path, "data-hub", command=[sys.executable, '-c', 'import sys; sys.exit(1)'])
+    specs = {
+        "data-hub": broken,
+        "risk-analyzer": spec(tmp_path, "risk-analyzer", depends_on=["data-hub"]),
+    }
+    supervisor = ProcessSupervisor(specs)
+    supervisors.append(supervisor)
+
+    report = supervisor.start_all()
+
+    assert not report['success']
+    assert report['services']["data-hub"]['status'] == 'failed'
+    assert report['services']["risk-analyzer"]['status'] == 'blocked'
+
+
+def test_crashed_service_is_restarted_with_backoff(tmp_path, supervisors):
+    supervisor = ProcessSupervisor({"hub": spec(tmp_path, "hub")}, backoff_base=0.1)
+    supervisors.append(supervisor)
+    supervisor.start_all()
+    first_pid = supervisor.pids()["hub"]
+
+    supervisor.processes["hub"].kill()
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        if supervisor.state["hub"]['status'] == 'ready' and supervisor.pids().get("hub") not in (None, first_pid):
+            break
+        time.sleep(0.05)
+
+    assert supervisor.pids()["hub"] != first_pid
+    assert supervisor.state["hub"]['restarts'] == 1
+
+
+def test_failed_relaunch_is_retried(tmp_path, supervisors, monkeypatch):
+    supervisor = ProcessSupervisor({"hub": spec(tmp_path, "hub")}, backoff_base=0.1)
+    supervisors.append(supervisor)
+    supervisor.start_all()
+    first_pid = supervisor.pids()["hub"]
+    real_spawn = supervisor._spawn
+    spawns = []
+
+    def flaky_spawn(service):
+        spawns.append(service.name)
+        if len(spawns) == 1:
+            # Exits before becoming ready, so the relaunch drops the process entry
+            return real_spawn(ServiceSpec(name=service.name, command=[sys.executable, '-c', 'import sys; sys.exit(1)'],
+                                          cwd=service.cwd, ready_url=service.ready_url, ready_timeout=5))
+        return real_spawn(service)
+
+    monkeypatch.setattr(supervisor, '_spawn', flaky_spawn)
+    supervisor.processes["hub"].kill()
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        if supervisor.state["hub"]['status'] == 'ready' and supervisor.pids().get("hub") not in (None, first_pid):
+            break
+        time.sleep(0.05)
+
+    assert len(spawns) == 2
+    assert supervisor.state["hub"]['status'] == 'ready'
+    assert supervisor.state["hub"]['restarts'] == 2
+
+
+def test_restart_service_replaces_process(tmp_path, supervisors):
+    supervisor = ProcessSupervisor({"hub": spec(tmp_path, "hub")})
+    supervisors.append(supervisor)
+    supervisor.start_all()
+    first_pid = supervisor.pids()["hub"]
+
+    assert supervisor.restart_service("hub")
+    assert supervisor.pids()["hub"] != first_pid
+
+
+def test_dependency_cycles_are_rejected(tmp_path):
+    specs = {
+        "a": spec(tmp_path, "a", depends_on=["b"]),
+        "b": spec(tmp_path, "b", depends_on=["a"]),
+    }
+    with pytest.raises(ValueError, match="cycle"):
+        ProcessSupervisor(specs)
+
+
+def test_default_specs_pull_in_dependencies(tmp_path):
+    specs = default_specs(tmp_path, ["ai-coo"], overrides={"mcp-hub": {"ready_timeout": 5}})
+
+    assert set(specs) == {"ai-coo", "data-hub", "mcp-hub", "risk-analyzer"}
+    assert specs["mcp-hub"].ready_timeout == 5
+    assert specs["ai-coo"].cwd == tmp_path / "ai-coo"
+
+
+def test_failed_restart_service_is_retried(tmp_path, supervisors, monkeypatch):
+    supervisor = ProcessSupervisor({"hub": spec(tmp_path, "hub")}, backoff_base=0.5)
+    supervisors.append(supervisor)
+    supervisor.start_all()
+    real_spawn = supervisor._spawn
+    spawns = []
+
+    def flaky_spawn(service):
+        spawns.append(service.name)
+        if len(spawns) == 1:
+            return real_spawn(ServiceSpec(name=service.name, command=[sys.executable, '-c', 'import sys; sys.exit(1)'],
+                                          cwd=service.cwd, ready_url=service.ready_url, ready_timeout=5))
+        return real_spawn(service)
+
+    monkeypatch.setattr(supervisor, '_spawn', flaky_spawn)
+    assert not supervisor.restart_service("hub")
+    assert supervisor.state["hub"]['status'] == 'crashed'
+
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline and supervisor.state["hub"]['status'] != 'ready':
+        time.sleep(0.05)
+
+    assert supervisor.state["hub"]['status'] == 'ready' and "hub" in supervisor.pids()
+    assert len(spawns) == 2
@@ -0,0 +1,104 @@
+import os
+import sys
+
+import pytest
+
+from conftest import git, commit_file
+from install_cache import build_services
+from release_stager import ReleaseStager
+
+SMOKE = [sys.executable, '-c', "import os, sys; sys.exit(0 if 'broken' not in open('server.js').read() else 1)"]
+
+
+def ok_installer(root):
+    return {'success': True, 'failed': []}
+
+
+@pytest.fixture
+def stager(remote_and_clone):
+    _, upstream, _ = remote_and_clone
+    return ReleaseStager(upstream, keep=1, smoke_command=SMOKE, installer=ok_installer)
+
+
+def test_stage_and_activate(remote_and_clone, stager):
+    _, upstream, _ = remote_and_clone
+    head = git(upstream, 'rev-parse', 'HEAD')
+
+    staged = stager.stage(head)
+    assert staged['success']
+    assert stager.current() is None
+    assert stager.activate(staged['path']) is None
+
+    assert stager.current_commit() == head
+    assert (stager.current_link / 'server.js').read_text() == "console.log('v1');\n"
+    assert not os.path.isabs(os.readlink(stager.current_link))
+
+
+def test_failed_smoke_check_leaves_active_release(remote_and_clone, stager):
+    _, upstream, _ = remote_and_clone
+    first = git(upstream, 'rev-parse', 'HEAD')
+    stager.activate(stager.stage(first)['path'])
+    broken = commit_file(upstream, 'server.js', "broken(\n")
+
+    staged = stager.stage(broken)
+
+    assert not staged['success'] and staged['reason'] == 'smoke check failed'
+    assert stager.current_commit() == first
+
+
+def test_unchanged_lockfile_reuses_node_modules(remote_and_clone, stager):
+    _, upstream, _ = remote_and_clone
+    first = commit_file(upstream, 'data-hub/package-lock.json', '{"lockfileVersion": 3}\n')
+    release = stager.stage(first)['path']
+    module = release / 'data-hub' / 'node_modules' / 'dep' / 'index.js'
+    module.parent.mkdir(parents=True)
+    module.write_text("module.exports = 1;\n")
+    stager.activate(release)
+
+    second = commit_file(upstream, 'data-hub/src/index.js', "require('dep');\n")
+    staged = stager.stage(second)
+
+    assert staged['seeded'] == 1
+    reused = staged['path'] / 'data-hub' / 'node_modules' / 'dep' / 'index.js'
+    assert reused.stat().st_ino == module.stat().st_ino
+
+
+def test_prune_keeps_active_and_recent_releases(remote_and_clone, stager):
+    _, upstream, _ = remote_and_clone
+    paths = []
+    for n in range(3):
+        commit = commit_file(upstream, 'server.js', f"console.log({n});\n")
+        paths.append(stager.stage(commit)['path'])
+    stager.activate(paths[0])
+
+    removed = stager.prune()
+
+    assert removed == [paths[1]]
+    assert [p.name for p in stager.releases()] == [paths[0].name, paths[2].name]
+    assert paths[1].name not in git(upstream, 'worktree', 'list')
+
+
+def test_stage_builds_dist_services_before_smoke_check(remote_and_clone):
+    _, upstream, _ = remote_and_clone
+    compile_ts = [sys.executable, '-c', "import os; os.makedirs('dist'); open('dist/api-server.js', 'w').close()"]
+    stager = ReleaseStager(
+        upstream, smoke_command=[sys.executable, '-c', "open('mcp-hub/dist/api-server.js')"], installer=ok_installer,
+        builder=lambda root: build_services(root, overrides={"mcp-hub": {"build": compile_ts}})
+    )
+    commit = commit_file(upstream, 'mcp-hub/src/api-server.ts', "export {};\n")
+
+    staged = stager.stage(commit)
+
+    assert staged['success'] and 'build' in staged['timings']
+    assert (staged['path'] / 'mcp-hub' / 'dist' / 'api-server.js').exists()
+
+
+def test_failed_build_rejects_release(remote_and_clone):
+    _, upstream, _ = remote_and_clone
+    stager = ReleaseStager(upstream, installer=ok_installer, builder=lambda root: build_services(
+        root, overrides={"ai-coo": {"build": [sys.executable, '-c', 'import sys; sys.exit(1)']}}))
+    commit = commit_file(upstream, 'ai-coo/src/orchestrator.ts', "export {};\n")
+
+    staged = stager.stage(commit)
+
+    assert not staged['success'] and staged['reason'] == 'build failed: ai-coo'
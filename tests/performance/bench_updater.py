@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the Python auto-updater and launcher hot paths
+Builds synthetic local repositories of increasing size, times the updater
+and supervisor operations and compares the best of several runs against a
+stored baseline
+
+    python tests/performance/bench_updater.py                  # run and compare
+    python tests/performance/bench_updater.py --sizes small    # quick run
+    python tests/performance/bench_updater.py --update-baseline
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import socket
+import logging
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Any, List, Callable, Optional
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+BASELINE_FILE = Path(__file__).with_name("updater_baseline.json")
+
+# files, commits of history, service directories
+SIZES = {
+    "small": {"files": 50, "history": 20, "services": 1},
+    "medium": {"files": 500, "history": 200, "services": 3},
+    "large": {"files": 2000, "history": 1000, "services": 5},
+}
+
+# Operations are compared on their fastest run: scheduling, page cache and
+# GC noise only ever add time, so the minimum is far more stable than the
+# median. Some operations (fsync-heavy backups) still shift between runs,
+# so the baseline is measured in several rounds and keeps the slowest of
+# the rounds' minimums as each operation's reference. A regression is a
+# minimum this many times that reference and at least MIN_DELTA seconds
+# and NOISE_FLOOR of it slower
+DEFAULT_THRESHOLD = 1.5
+MIN_DELTA = 0.005
+NOISE_FLOOR = 0.25
+DEFAULT_REPEAT = 15
+DEFAULT_WARMUP = 3
+BASELINE_ROUNDS = 3
+
+GIT_ENV = {
+    "GIT_AUTHOR_NAME": "Field Elevate Bench",
+    "GIT_AUTHOR_EMAIL": "bench@field-elevate.local",
+    "GIT_COMMITTER_NAME": "Field Elevate Bench",
+    "GIT_COMMITTER_EMAIL": "bench@field-elevate.local",
+    "GIT_CONFIG_NOSYSTEM": "1",
+}
+
+# Minimal service: listen on PORT and accept connections until killed
+SERVICE_SCRIPT = (
+    "import os, socket\n"
+    "s = socket.socket(); s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)\n"
+    "s.bind(('127.0.0.1', int(os.environ['PORT']))); s.listen()\n"
+    "while True: s.accept()[0].close()\n"
+)
+
+
+def git(cwd: Path, *args: str, stdin: Optional[bytes] = None) -> str:
+    result = subprocess.run(['git', *args], cwd=cwd, input=stdin, capture_output=True, check=True)
+    return result.stdout.decode().strip()
+
+
+def build_repository(path: Path, files: int, history: int, services: int) -> None:
+    """Create a repository with `files` files over `services` directories and `history` commits"""
+    from hub_services import HUB_SERVICES
+
+    directories = ["."] + [d for d in HUB_SERVICES.values() if d != "."][:max(services - 1, 0)]
+    paths = [f"{directories[i % len(directories)]}/src/module_{i}.js".lstrip("./") for i in range(files)]
+
+    # One fast-import stream: an initial tree, then one small change per commit
+    stream = []
+    timestamp = 1700000000
+
+    def blob(content: str) -> None:
+        data = content.encode()
+        stream.append(f"data {len(data)}\n".encode() + data + b"\n")
+
+    for n in range(history):
+        stream.append(b"commit refs/heads/main\n")
+        stream.append(f"committer Bench <bench@field-elevate.local> {timestamp + n} +0000\n".encode())
+        blob(f"commit {n}")
+        if n == 0:
+            for i, rel in enumerate(paths):
+                stream.append(f"M 100644 inline {rel}\n".encode())
+                blob(f"module.exports = {{ id: {i}, version: 0 }};\n")
+        else:
+            rel = paths[n % len(paths)]
+            stream.append(f"M 100644 inline {rel}\n".encode())
+            blob(f"module.exports = {{ id: {n % len(paths)}, version: {n} }};\n")
+    stream.append(b"done\n")
+
+    git(path.parent, 'init', '-q', '-b', 'main', str(path))
+    git(path, 'fast-import', '--quiet', '--done', stdin=b"".join(stream))
+    git(path, 'reset', '-q', '--hard', 'main')
+
+
+class Scenario:
+    """An origin, a working copy that pushes to it and a clone the updater manages"""
+
+    def __init__(self, workdir: Path, size: Dict[str, int]):
+        self.workdir = workdir
+        self.size = size
+        self.origin = workdir / "origin.git"
+        self.upstream = workdir / "upstream"
+        self.clone = workdir / "clone"
+        build_repository(self.upstream, **size)
+        git(workdir, 'clone', '-q', '--bare', str(self.upstream), str(self.origin))
+        git(self.upstream, 'remote', 'add', 'origin', str(self.origin))
+        git(self.upstream, 'fetch', '-q', 'origin')
+        git(self.upstream, 'branch', '-q', '-u', 'origin/main')
+        git(workdir, 'clone', '-q', str(self.origin), str(self.clone))
+        self.pushes = 0
+
+    def push_change(self) -> None:
+        self.pushes += 1
+        (self.upstream / "CHANGELOG.md").write_text(f"release {self.pushes}\n")
+        git(self.upstream, 'add', 'CHANGELOG.md')
+        git(self.upstream, 'commit', '-q', '-m', f"release {self.pushes}")
+        git(self.upstream, 'push', '-q', 'origin', 'main')
+
+    def updater(self, **config):
+        from auto_updater import FieldElevateAutoUpdater
+
+        updater = FieldElevateAutoUpdater(str(self.clone))
+        updater.config.update({"backup_before_update": False, "metrics_port": None}, **config)
+        return updater
+
+
+def measure(fn: Callable[[], Any], repeat: int, setup: Optional[Callable[[], Any]] = None,
+            warmup: int = DEFAULT_WARMUP) -> Dict[str, Any]:
+    """Time fn `repeat` times after `warmup` untimed calls, running the untimed setup before each call"""
+    for _ in range(warmup):
+        if setup is not None:
+            setup()
+        fn()
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return {
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "min": min(samples),
+        "max": max(samples),
+        "runs": len(samples),
+    }
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def bench_launcher(workdir: Path, services: int, repeat: int) -> Dict[str, Any]:
+    """Start-to-ready time of a supervisor running `services` TCP services in a dependency chain"""
+    from process_supervisor import ProcessSupervisor, ServiceSpec
+
+    def run() -> None:
+        specs = {}
+        for i in range(services):
+            port = free_port()
+            name = f"svc{i}"
+            specs[name] = ServiceSpec(
+                name=name,
+                command=[sys.executable, '-c', SERVICE_SCRIPT],
+                cwd=workdir,
+                env={"PORT": str(port)},
+                depends_on=[f"svc{i - 1}"] if i else [],
+                ready_port=port,
+                ready_timeout=30,
+            )
+        supervisor = ProcessSupervisor(specs)
+        try:
+            report = supervisor.start_all()
+            if not report['success']:
+                raise RuntimeError(f"launcher benchmark services failed: {report['services']}")
+        finally:
+            supervisor.stop()
+
+    # Each run starts fresh processes; one warm-up loads the interpreter into the page cache
+    return measure(run, repeat, warmup=1)
+
+
+def bench_size(name: str, size: Dict[str, int], repeat: int) -> Dict[str, Any]:
+    workdir = Path(tempfile.mkdtemp(prefix=f"fe-bench-{name}-"))
+    try:
+        scenario = Scenario(workdir, size)
+        updater = scenario.updater()
+        results = {}
+
+        results["check_and_update_idle"] = measure(updater.check_and_update, repeat)
+        results["check_and_update_update"] = measure(updater.check_and_update, repeat,
+                                                     setup=scenario.push_change)
+
+        def fetch_after_push() -> None:
+            scenario.push_change()
+            updater._fetch_updates()
+
+        results["pull_updates"] = measure(updater._pull_updates, repeat, setup=fetch_after_push)
+
+        backup_updater = scenario.updater(backup_before_update=True)
+        backups = scenario.clone / "backups"
+        results["create_backup_cold"] = measure(backup_updater._create_backup, repeat,
+                                                setup=lambda: shutil.rmtree(backups, ignore_errors=True))
+        # Warm-up runs also fill the blob store, so every timed run finds it populated
+        results["create_backup_warm"] = measure(backup_updater._create_backup, repeat)
+
+        results["get_status"] = measure(updater.get_status, repeat * 10)
+        results["launcher_start_to_ready"] = bench_launcher(workdir, size["services"], repeat)
+
+        updater.stop_auto_update()
+        backup_updater.stop_auto_update()
+        return {"size": size, "results": results}
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float, min_delta: float,
+            noise_floor: float = NOISE_FLOOR) -> List[Dict[str, Any]]:
+    """List operations whose fastest run regressed beyond the threshold"""
+    regressions = []
+    for size, data in current["sizes"].items():
+        base_results = baseline.get("sizes", {}).get(size, {}).get("results", {})
+        for op, stats in data["results"].items():
+            base = base_results.get(op)
+            if not base:
+                continue
+            before, after = base.get("slowest_min", base["min"]), stats["min"]
+            ratio = after / before if before else float("inf")
+            if ratio > threshold and after - before > max(min_delta, noise_floor * before):
+                regressions.append({
+                    "size": size,
+                    "operation": op,
+                    "baseline": before,
+                    "current": after,
+                    "ratio": ratio,
+                })
+    return regressions
+
+
+def merge_results(first: Dict[str, Any], second: Dict[str, Any]) -> Dict[str, Any]:
+    """Combine two measurements of one operation, keeping the faster run's statistics"""
+    best = dict(min(first, second, key=lambda stats: stats["min"]))
+    best["max"] = max(first["max"], second["max"])
+    best["runs"] = first["runs"] + second["runs"]
+    best["slowest_min"] = max(first.get("slowest_min", first["min"]), second.get("slowest_min", second["min"]))
+    return best
+
+
+def remeasure(report: Dict[str, Any], sizes: List[str], repeat: int) -> None:
+    """Measure sizes again and merge the new runs into report"""
+    for name in sizes:
+        rerun = bench_size(name, SIZES[name], repeat)["results"]
+        results = report["sizes"][name]["results"]
+        for op, stats in rerun.items():
+            results[op] = merge_results(results[op], stats)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Field-Elevate auto-updater and launcher")
+    parser.add_argument("--sizes", default="small,medium,large", help="Comma-separated repo sizes")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per operation")
+    parser.add_argument("--confirm", type=int, default=2,
+                        help="Re-measure a size this many times before reporting its regressions")
+    parser.add_argument("--output", help="Write results JSON here")
+    parser.add_argument("--baseline", default=str(BASELINE_FILE), help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, help="Allowed ratio to the baseline's fastest run before failing")
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the baseline")
+    parser.add_argument("--baseline-rounds", type=int, default=BASELINE_ROUNDS,
+                        help="Full measurement rounds behind a new baseline")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    sizes = [s.strip() for s in args.sizes.split(",") if s.strip()]
+    unknown = [s for s in sizes if s not in SIZES]
+    if unknown:
+        parser.error(f"unknown sizes: {', '.join(unknown)} (choose from {', '.join(SIZES)})")
+
+    os.environ.update(GIT_ENV)
+    report = {
+        "generated": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "git": git(ROOT, '--version'),
+        "repeat": args.repeat,
+        "sizes": {},
+    }
+    for name in sizes:
+        print(f"⏱️ Benchmarking {name} repository {SIZES[name]}...")
+        report["sizes"][name] = bench_size(name, SIZES[name], args.repeat)
+        for op, stats in report["sizes"][name]["results"].items():
+            print(f"  {op:28s} min {stats['min'] * 1000:9.2f} ms  median {stats['median'] * 1000:9.2f} ms")
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        for round_number in range(2, args.baseline_rounds + 1):
+            print(f"🔁 Baseline round {round_number} of {args.baseline_rounds}...")
+            remeasure(report, sizes, args.repeat)
+        existing = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+        report["rounds"] = max(args.baseline_rounds, 1)
+        report["threshold"] = existing.get("threshold", DEFAULT_THRESHOLD)
+        report["min_delta"] = existing.get("min_delta", MIN_DELTA)
+        report["noise_floor"] = existing.get("noise_floor", NOISE_FLOOR)
+        baseline_path.write_text(json.dumps(report, indent=2) + "\n")
+        if args.output:
+            Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+        print(f"📌 Baseline updated: {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        print("⚠️ No baseline found; run with --update-baseline to create one")
+        return 0
+
+    baseline = json.loads(baseline_path.read_text())
+    threshold = args.threshold or baseline.get("threshold", DEFAULT_THRESHOLD)
+
+    def regressed() -> List[Dict[str, Any]]:
+        return compare(report, baseline, threshold, baseline.get("min_delta", MIN_DELTA),
+                       baseline.get("noise_floor", NOISE_FLOOR))
+
+    regressions = regressed()
+    for _ in range(args.confirm):
+        if not regressions:
+            break
+        # A real regression survives more runs; a noisy one is absorbed by the faster rerun
+        suspects = sorted({r["size"] for r in regressions})
+        print(f"🔁 Re-measuring {', '.join(suspects)} to rule out noise...")
+        remeasure(report, suspects, args.repeat)
+        regressions = regressed()
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+        print(f"📄 Results written to {args.output}")
+
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) beyond {threshold:.2f}x baseline:")
+        for r in regressions:
+            print(f"  {r['size']}/{r['operation']}: {r['baseline'] * 1000:.2f} ms -> "
+                  f"{r['current'] * 1000:.2f} ms ({r['ratio']:.2f}x)")
+        return 1
+    print(f"✅ No regressions beyond {threshold:.2f}x baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from blue_green import find_free_port
+from health_checks import run_health_checks, run_probe
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200 if self.path == '/health' else 503)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def http_port():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_and_tcp_probes(http_port):
+    assert run_probe({"url": f"http://127.0.0.1:{http_port}/health"}, timeout=2)
+    assert not run_probe({"url": f"http://127.0.0.1:{http_port}/broken"}, timeout=0.3)
+    assert run_probe({"port": http_port}, timeout=2)
+    assert not run_probe({"port": find_free_port()}, timeout=0.3)
+
+
+def test_command_probe_runs_in_cwd(tmp_path):
+    (tmp_path / "ok").write_text("")
+    probe = {"command": [sys.executable, "-c", "import os, sys; sys.exit(not os.path.exists('ok'))"]}
+    assert run_probe(probe, cwd=tmp_path)
+    (tmp_path / "ok").unlink()
+    assert not run_probe(probe, cwd=tmp_path)
+
+
+def test_report_names_failed_probes(http_port):
+    report = run_health_checks([
+        {"name": "hub", "url": f"http://127.0.0.1:{http_port}/health"},
+        {"name": "data-hub", "port": find_free_port(), "timeout": 0.3},
+        {"name": "empty"},
+    ], timeout=2)
+
+    assert not report["healthy"]
+    assert report["results"] == {"hub": True, "data-hub": False, "empty": False}
+    assert report["failed"] == ["data-hub", "empty"]
+    assert run_health_checks([])["healthy"]
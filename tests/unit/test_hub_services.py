@@ -0,0 +1,44 @@
+from hub_services import LAUNCHER, services_for_paths, lockfile_changed, build_command
+
+
+def test_docs_and_dashboards_affect_nothing():
+    assert services_for_paths(["README.md", "deployment/quick-deploy-guide.md",
+                               "dashboard.html", "tests/unit/portfolio.test.js"]) == {}
+
+
+def test_paths_map_to_owning_service():
+    affected = services_for_paths([
+        "data-hub/src/server.js",
+        "frontend/src/App.js",
+        "server.js",
+        "public/index.html",
+        "src/services/coingecko-service.js",
+    ])
+
+    assert affected == {
+        "data-hub": ["data-hub/src/server.js"],
+        "frontend": ["frontend/src/App.js"],
+        "hub": ["server.js", "public/index.html", "src/services/coingecko-service.js"],
+    }
+
+
+def test_shared_code_and_launcher_changes():
+    affected = services_for_paths(["shared/utils/validators.ts", "auto_updater.py"])
+
+    assert affected["bot-concierge"] == ["shared/utils/validators.ts"]
+    assert affected["ops-console"] == ["shared/utils/validators.ts"]
+    assert affected[LAUNCHER] == ["auto_updater.py"]
+
+
+def test_lockfile_changed():
+    paths = ["mcp-hub/package-lock.json", "package-lock.json"]
+
+    assert lockfile_changed("mcp-hub", paths)
+    assert lockfile_changed("hub", paths)
+    assert not lockfile_changed("data-hub", paths)
+
+
+def test_build_command_for_dist_services():
+    assert build_command("ai-coo") == ["npm", "run", "build"]
+    assert build_command("data-hub") is None
+    assert build_command("data-hub", {"data-hub": {"build": ["make"]}}) == ["make"]
@@ -0,0 +1,93 @@
+import sys
+
+import pytest
+
+from conftest import git, commit_file
+from impact_gate import ImpactGate, ImpactIndex, make_shards, parse_imports
+
+# Fails when any test path it is given contains "broken"
+FAKE_RUNNER = [sys.executable, '-c', "import sys; sys.exit(any('broken' in a for a in sys.argv[1:]))"]
+
+
+@pytest.fixture
+def project(tmp_path):
+    repo = tmp_path / "project"
+    git(tmp_path, 'init', '-q', '-b', 'main', str(repo))
+    files = {
+        'lib/money.js': "module.exports = { add: (a, b) => a + b };\n",
+        'lib/portfolio.ts': "import { add } from './money';\nexport const total = add;\n",
+        'server.js': "const { total } = require('./lib/portfolio');\n",
+        'tests/unit/money.test.js': "const money = require('../../lib/money');\n",
+        'tests/unit/server.test.js': "const app = require('../../server');\n",
+        'tests/api/other.test.js': "test('x', () => {});\n",
+        'store.py': "import json\n",
+        'tests/conftest.py': "ROOT = None\n",
+        'tests/unit/test_store.py': "from store import *\n",
+        'README.md': "# docs\n",
+    }
+    for rel, content in files.items():
+        path = repo / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    git(repo, 'add', '.')
+    git(repo, 'commit', '-q', '-m', 'initial')
+    return repo
+
+
+def test_parse_imports():
+    js = "const a = require('./a');\nimport b from '../b';\nimport './c';\nexport * from './d';\nconst e = require('express');\n"
+    assert parse_imports('x/y.js', js) == ['../b', './a', './c', './d']
+    assert parse_imports('t.py', "import os, store as s\n    from conftest import git\n") == ['conftest', 'os', 'store']
+
+
+def test_index_maps_sources_to_transitive_tests(project, tmp_path):
+    index = ImpactIndex(tmp_path / "index.json", ['tests/unit'])
+    assert not index.load()
+    assert index.refresh(project)['tests'] == 3
+
+    assert index.impacted(['lib/money.js']) == ['tests/unit/money.test.js', 'tests/unit/server.test.js']
+    assert index.impacted(['lib/portfolio.ts']) == ['tests/unit/server.test.js']
+    assert index.impacted(['store.py']) == ['tests/unit/test_store.py']
+    assert index.impacted(['tests/conftest.py']) == ['tests/unit/test_store.py']
+    assert index.impacted(['README.md', 'tests/api/other.test.js']) == []
+    assert index.impacted(['package.json']) is None
+
+    cached = ImpactIndex(tmp_path / "index.json", ['tests/unit'])
+    assert cached.load() and cached.tests == index.tests
+
+
+def test_refresh_reparses_only_changed_files(project, tmp_path):
+    index = ImpactIndex(tmp_path / "index.json", ['tests/unit'])
+    index.refresh(project)
+    commit_file(project, 'store.py', "import json\nfrom lib_helpers import x\n")
+    commit_file(project, 'lib_helpers.py', "x = 1\n")
+
+    assert index.refresh(project)['parsed'] == 2
+    assert index.impacted(['lib_helpers.py']) == ['tests/unit/test_store.py']
+
+
+def test_shards_split_per_runner():
+    tests = ['a.test.js', 'b.test.js', 'c.test.js', 'test_d.py']
+    shards = make_shards(tests, 2)
+    assert shards == [
+        {'runner': 'jest', 'tests': ['a.test.js', 'c.test.js']},
+        {'runner': 'jest', 'tests': ['b.test.js']},
+        {'runner': 'pytest', 'tests': ['test_d.py']},
+    ]
+
+
+def test_gate_runs_full_when_stale_then_only_impacted(project, tmp_path):
+    gate = ImpactGate(ImpactIndex(tmp_path / "index.json", ['tests/unit']), shards=2,
+                      commands={'jest': FAKE_RUNNER, 'pytest': FAKE_RUNNER})
+
+    first = gate.run(project, ['lib/money.js'])
+    assert first['success'] and first['full'] and len(first['tests']) == 3
+
+    second = gate.run(project, ['lib/portfolio.ts'])
+    assert not second['full'] and second['tests'] == ['tests/unit/server.test.js'] and second['shards'] == 1
+
+    assert gate.run(project, ['README.md'])['tests'] == []
+
+    commit_file(project, 'tests/unit/broken.test.js', "require('../../lib/money');\n")
+    report = gate.run(project, ['tests/unit/broken.test.js'])
+    assert not report['success'] and report['failed'] == ['tests/unit/broken.test.js']
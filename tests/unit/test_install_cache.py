@@ -0,0 +1,79 @@
+import sys
+import time
+
+from install_cache import InstallCache, STAMP_FILE
+
+# Stand-in for `npm ci`: sleeps briefly and creates node_modules
+FAKE_INSTALL = [sys.executable, '-c',
+                "import os, time; time.sleep(0.3); os.makedirs('node_modules', exist_ok=True)"]
+FAILING_INSTALL = [sys.executable, '-c', "import sys; sys.exit('npm ERR! broken lockfile')"]
+
+
+def make_services(root, names):
+    services = {}
+    for name in names:
+        path = root / name
+        path.mkdir(parents=True)
+        (path / "package-lock.json").write_text('{"lockfileVersion": 3, "name": "%s"}' % name)
+        services[name] = path
+    (root / "docs").mkdir()
+    services["docs"] = root / "docs"
+    return services
+
+
+def test_cold_then_warm_start(tmp_path):
+    services = make_services(tmp_path, ["data-hub", "mcp-hub"])
+    cache = InstallCache(tmp_path, services, cache_dir=tmp_path / "cache", command=FAKE_INSTALL)
+
+    cold = cache.install()
+    warm = cache.install()
+
+    assert cold['mode'] == 'cold' and sorted(cold['installed']) == ["data-hub", "mcp-hub"]
+    assert (services["data-hub"] / "node_modules" / STAMP_FILE).exists()
+    assert warm['mode'] == 'warm' and warm['duration'] < 0.1
+    assert "docs" not in cold['results']
+
+
+def test_installs_run_in_parallel(tmp_path):
+    services = make_services(tmp_path, ["a", "b", "c", "d"])
+    cache = InstallCache(tmp_path, services, cache_dir=tmp_path / "cache",
+                         command=FAKE_INSTALL, max_workers=4)
+
+    started = time.perf_counter()
+    cache.install()
+
+    assert time.perf_counter() - started < 1.0
+
+
+def test_only_changed_lockfiles_reinstall(tmp_path):
+    services = make_services(tmp_path, ["data-hub", "mcp-hub"])
+    cache = InstallCache(tmp_path, services, cache_dir=tmp_path / "cache", command=FAKE_INSTALL)
+    cache.install()
+
+    (services["mcp-hub"] / "package-lock.json").write_text('{"lockfileVersion": 3, "changed": true}')
+    report = cache.install()
+
+    assert report['mode'] == 'partial'
+    assert report['installed'] == ["mcp-hub"]
+
+
+def test_extra_key_invalidates_stamp(tmp_path):
+    services = make_services(tmp_path, ["data-hub"])
+    InstallCache(tmp_path, services, cache_dir=tmp_path / "cache",
+                 command=FAKE_INSTALL, extra_key="v18.19.0").install()
+
+    upgraded = InstallCache(tmp_path, services, cache_dir=tmp_path / "cache",
+                            command=FAKE_INSTALL, extra_key="v20.11.0")
+
+    assert upgraded.needs_install(services["data-hub"])
+
+
+def test_failed_install_is_reported_and_not_stamped(tmp_path):
+    services = make_services(tmp_path, ["data-hub"])
+    cache = InstallCache(tmp_path, services, cache_dir=tmp_path / "cache", command=FAILING_INSTALL)
+
+    report = cache.install()
+
+    assert not report['success'] and report['failed'] == ["data-hub"]
+    assert "broken lockfile" in report['results']["data-hub"]['message']
+    assert cache.needs_install(services["data-hub"])
@@ -0,0 +1,17 @@
+import pytest
+
+from partial_checkout import sparse_directories
+
+
+def test_service_directories_include_shared_code():
+    assert sparse_directories(["data-hub"]) == ["data-hub"]
+    assert sparse_directories(["ops-console", "bot-concierge"]) == ["bot-concierge", "ops-console", "shared"]
+
+
+def test_hub_maps_to_its_root_directories():
+    assert sparse_directories(["hub"]) == ["public", "src"]
+
+
+def test_unknown_service_is_rejected():
+    with pytest.raises(ValueError):
+        sparse_directories(["billing"])
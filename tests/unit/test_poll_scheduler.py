@@ -0,0 +1,49 @@
+import time
+import random
+import threading
+
+from poll_scheduler import PollScheduler, TIMEOUT, TRIGGERED, STOPPED
+
+
+def test_delay_stays_within_jitter_band():
+    scheduler = PollScheduler(100, jitter=0.2, rng=random.Random(1))
+    delays = [scheduler.next_delay() for _ in range(200)]
+    assert all(80 <= d <= 120 for d in delays)
+    assert len(set(delays)) > 1
+
+
+def test_failures_back_off_exponentially_and_reset():
+    scheduler = PollScheduler(1800, jitter=0, failure_backoff_base=60, failure_backoff_max=300)
+    delays = []
+    for _ in range(5):
+        scheduler.record(False)
+        delays.append(scheduler.next_delay())
+    assert delays == [60, 120, 240, 300, 300]
+
+    scheduler.record(True)
+    assert scheduler.next_delay() == 1800
+
+
+def test_update_boosts_poll_rate_for_a_while():
+    scheduler = PollScheduler(1800, jitter=0, boost_interval=60, boost_duration=0.2)
+    scheduler.record(True, updated=True)
+    assert scheduler.next_delay() == 60
+    time.sleep(0.25)
+    assert scheduler.next_delay() == 1800
+
+
+def test_wait_times_out():
+    scheduler = PollScheduler(0.05, jitter=0)
+    assert scheduler.wait() == TIMEOUT
+
+
+def test_trigger_and_stop_interrupt_wait():
+    scheduler = PollScheduler(60, jitter=0)
+    threading.Timer(0.05, scheduler.trigger).start()
+    started = time.monotonic()
+    assert scheduler.wait() == TRIGGERED
+    assert time.monotonic() - started < 5
+
+    threading.Timer(0.05, scheduler.stop).start()
+    assert scheduler.wait() == STOPPED
+    assert scheduler.wait() == STOPPED
@@ -0,0 +1,81 @@
+import os
+import sys
+import subprocess
+
+import pytest
+
+from resource_sampler import ResourceSampler, read_process
+
+pytestmark = pytest.mark.skipif(not os.path.isdir("/proc/self"), reason="needs /proc")
+
+
+class FakeProc:
+    """A procfs tree whose readings the test controls"""
+
+    def __init__(self, root):
+        self.root = root
+
+    def set(self, pid, rss_pages, cpu_ticks, fds, threads):
+        directory = self.root / str(pid)
+        (directory / "fd").mkdir(parents=True, exist_ok=True)
+        for existing in (directory / "fd").iterdir():
+            existing.unlink()
+        for n in range(fds):
+            (directory / "fd" / str(n)).write_text("")
+        fields = ["S"] + ["0"] * 40
+        fields[11], fields[17], fields[21] = str(cpu_ticks), str(threads), str(rss_pages)
+        (directory / "stat").write_text(f"{pid} (node (server)) " + " ".join(fields))
+
+
+def test_reads_a_real_process():
+    reading = read_process(os.getpid())
+    assert reading["rss_bytes"] > 1024 * 1024 and reading["threads"] >= 1 and reading["fds"] >= 3
+    child = subprocess.Popen([sys.executable, "-c", "pass"])
+    child.wait()
+    assert read_process(child.pid) is None
+
+
+def test_samples_are_bounded_and_tagged_with_the_commit_live_at_process_start(tmp_path):
+    proc = FakeProc(tmp_path)
+    live = {"commit": "aaa"}
+    pids = {"hub": 100}
+    sampler = ResourceSampler(lambda: pids, lambda: live["commit"], history=3, proc=str(tmp_path))
+
+    proc.set(100, rss_pages=10, cpu_ticks=0, fds=4, threads=2)
+    assert sampler.sample_once() == {}  # first reading only primes CPU%
+    live["commit"] = "bbb"  # pulled, but the running process is still the old code
+    for _ in range(5):
+        sample = sampler.sample_once()["hub"]
+    assert sample["commit"] == "aaa" and sample["fds"] == 4 and sample["threads"] == 2
+    assert len(sampler.samples["hub"]) == 3
+
+    pids["hub"] = 200  # restarted onto the new commit
+    proc.set(200, rss_pages=10, cpu_ticks=0, fds=4, threads=2)
+    sampler.sample_once()
+    assert sampler.sample_once()["hub"]["commit"] == "bbb"
+
+
+def test_flags_regression_against_previous_release_once(tmp_path):
+    proc = FakeProc(tmp_path)
+    live = {"commit": "old"}
+    pids = {"hub": 100, "data-hub": 101}
+    reported = []
+    sampler = ResourceSampler(lambda: pids, lambda: live["commit"], regression_ratio=1.5, min_samples=3,
+                              on_regression=reported.extend, proc=str(tmp_path))
+    proc.set(100, rss_pages=1000, cpu_ticks=0, fds=10, threads=4)
+    proc.set(101, rss_pages=1000, cpu_ticks=0, fds=10, threads=4)
+    for _ in range(4):
+        sampler.sample_once()
+
+    live["commit"] = "new"
+    pids["hub"] = 200
+    proc.set(200, rss_pages=2000, cpu_ticks=0, fds=12, threads=4)
+    for _ in range(5):
+        sampler.sample_once()
+
+    assert [(r["service"], r["metric"], r["commit"], r["previous_commit"]) for r in reported] == \
+        [("hub", "rss_bytes", "new", "old")]
+    assert reported[0]["ratio"] == pytest.approx(2.0)
+    assert sampler.regressions() == reported
+    summary = sampler.summary()["hub"]
+    assert summary["by_commit"]["new"]["samples"] == 4 and summary["latest"]["pid"] == 200
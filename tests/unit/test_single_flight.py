@@ -0,0 +1,125 @@
+import sys
+import time
+import threading
+import subprocess
+
+import pytest
+
+from conftest import ROOT
+from file_lock import FileLockTimeout
+from single_flight import SingleFlight
+
+
+def test_concurrent_callers_share_one_run(tmp_path):
+    flight = SingleFlight(tmp_path / "update.lock")
+    calls = []
+    release = threading.Event()
+
+    def check():
+        calls.append(1)
+        release.wait(5)
+        return {'updated': True, 'n': len(calls)}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flight.run(check))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.2)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert sorted(shared for _, shared in results) == [False, True, True, True, True]
+    assert all(result == {'updated': True, 'n': 1} for result, _ in results)
+    assert flight.run(check) == ({'updated': True, 'n': 2}, False)
+
+
+def test_followers_see_the_leaders_error():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def boom():
+        started.set()
+        time.sleep(0.2)
+        raise RuntimeError("fetch exploded")
+
+    errors = []
+
+    def follower():
+        started.wait(5)
+        try:
+            flight.run(lambda: pytest.fail("second run"))
+        except RuntimeError as e:
+            errors.append(str(e))
+
+    thread = threading.Thread(target=follower)
+    thread.start()
+    with pytest.raises(RuntimeError):
+        flight.run(boom)
+    thread.join(5)
+    assert errors == ["fetch exploded"]
+
+
+HOLDER = """
+import sys, time
+from single_flight import SingleFlight
+flight = SingleFlight(sys.argv[1])
+def check():
+    print('running', flush=True)
+    time.sleep(float(sys.argv[2]))
+    return {'updated': True, 'commit': 'from-other-process'}
+flight.run(check)
+"""
+
+
+def start_holder(lock, seconds):
+    holder = subprocess.Popen([sys.executable, "-c", HOLDER, str(lock), str(seconds)],
+                              cwd=ROOT, stdout=subprocess.PIPE, text=True)
+    assert holder.stdout.readline().strip() == 'running'
+    return holder
+
+
+def test_other_process_result_is_shared(tmp_path):
+    lock = tmp_path / "update.lock"
+    holder = start_holder(lock, 0.5)
+    try:
+        result, shared = SingleFlight(lock).run(lambda: pytest.fail("ran while another process was checking"))
+    finally:
+        holder.wait(10)
+    assert shared and result == {'updated': True, 'commit': 'from-other-process'}
+
+
+def test_waiting_for_other_process_times_out(tmp_path):
+    lock = tmp_path / "update.lock"
+    holder = start_holder(lock, 3)
+    try:
+        with pytest.raises(FileLockTimeout):
+            SingleFlight(lock, timeout=0.3).run(lambda: {})
+    finally:
+        holder.wait(10)
+
+
+def test_exclusive_blocks_runs_and_is_reentrant(tmp_path):
+    flight = SingleFlight(tmp_path / "update.lock")
+    order = []
+    entered = threading.Event()
+
+    def hold():
+        with flight.exclusive():
+            entered.set()
+            time.sleep(0.3)
+            order.append('rollback')
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    entered.wait(5)
+
+    def check():
+        with flight.exclusive():
+            order.append('check')
+        return {'updated': False}
+
+    assert flight.run(check) == ({'updated': False}, False)
+    thread.join(5)
+    assert order == ['rollback', 'check']
@@ -0,0 +1,74 @@
+import os
+import time
+
+from snapshot_store import SnapshotStore
+
+
+def make_tree(root):
+    (root / "src").mkdir(parents=True)
+    (root / "src" / "app.js").write_text("console.log('app');\n")
+    (root / "README.md").write_text("# readme\n")
+    (root / "node_modules").mkdir()
+    (root / "node_modules" / "dep.js").write_text("ignored\n")
+
+
+def test_snapshot_deduplicates_and_skips_excludes(tmp_path):
+    tree = tmp_path / "tree"
+    make_tree(tree)
+    (tree / "copy.md").write_text("# readme\n")
+    store = SnapshotStore(tmp_path / "store")
+
+    result = store.create_snapshot(tree)
+
+    assert result["files"] == 3
+    assert result["new_blobs"] == 2
+    manifest = store.load_manifest(result["id"])
+    assert "node_modules/dep.js" not in manifest["files"]
+    assert manifest["files"]["README.md"]["hash"] == manifest["files"]["copy.md"]["hash"]
+
+
+def test_incremental_snapshot_only_hashes_changed_files(tmp_path):
+    tree = tmp_path / "tree"
+    make_tree(tree)
+    store = SnapshotStore(tmp_path / "store")
+    store.create_snapshot(tree)
+
+    (tree / "src" / "app.js").write_text("console.log('app v2');\n")
+    second = store.create_snapshot(tree)
+
+    assert second["hashed"] == 1
+    assert second["new_blobs"] == 1
+    assert len(store.list_snapshots()) == 2
+
+
+def test_restore_round_trip(tmp_path):
+    tree = tmp_path / "tree"
+    make_tree(tree)
+    store = SnapshotStore(tmp_path / "store")
+    snapshot = store.create_snapshot(tree)
+
+    (tree / "src" / "app.js").write_text("broken\n")
+    restored = store.restore(snapshot["id"], tree, paths=["src/app.js"])
+
+    assert restored == 1
+    assert (tree / "src" / "app.js").read_text() == "console.log('app');\n"
+    assert os.access(tree / "src" / "app.js", os.W_OK)
+
+
+def test_prune_keeps_last_n_and_collects_unreferenced_blobs(tmp_path):
+    tree = tmp_path / "tree"
+    make_tree(tree)
+    store = SnapshotStore(tmp_path / "store")
+    for version in range(3):
+        (tree / "src" / "app.js").write_text(f"version {version}\n")
+        store.create_snapshot(tree)
+        time.sleep(0.01)
+
+    result = store.prune(keep_last=1)
+
+    assert result["snapshots_removed"] == 2
+    assert result["blobs_removed"] == 2
+    assert len(store.list_snapshots()) == 1
+    restored = tmp_path / "restored"
+    store.restore(store.list_snapshots()[0], restored)
+    assert (restored / "src" / "app.js").read_text() == "version 2\n"
@@ -0,0 +1,73 @@
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from status_server import StatusServer, StatusSnapshot
+
+
+@pytest.fixture
+def served():
+    snapshot = StatusSnapshot()
+    server = StatusServer(snapshot, port=0)
+    server.start()
+    yield snapshot, f"http://127.0.0.1:{server.port}/status"
+    server.stop()
+
+
+def get(url, etag=None, method='GET', origin=None):
+    headers = {'If-None-Match': etag} if etag else {}
+    if origin:
+        headers['Origin'] = origin
+    request = urllib.request.Request(url, headers=headers, method=method)
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, b""
+
+
+def test_publish_changes_etag_only_when_content_changes():
+    snapshot = StatusSnapshot()
+    assert snapshot.publish({'running': True, 'last_commit': 'abc'})
+    body, etag = snapshot.current
+    assert not snapshot.publish({'last_commit': 'abc', 'running': True})
+    assert snapshot.current == (body, etag) and snapshot.version == 1
+    assert snapshot.publish({'running': False, 'last_commit': 'abc'})
+    assert snapshot.current[1] != etag
+
+
+def test_conditional_requests_return_304_until_state_changes(served):
+    snapshot, url = served
+    snapshot.publish({'last_commit': 'abc'})
+
+    status, headers, body = get(url)
+    assert status == 200 and json.loads(body) == {'last_commit': 'abc'}
+    assert 'Access-Control-Allow-Origin' not in headers
+    etag = headers['ETag']
+    assert get(url, etag)[0] == 304
+    assert get(url, f'"other", {etag}')[0] == 304
+
+    snapshot.publish({'last_commit': 'def'})
+    status, headers, body = get(url, etag)
+    assert status == 200 and headers['ETag'] != etag
+    assert json.loads(body) == {'last_commit': 'def'}
+
+
+def test_head_and_unknown_path(served):
+    snapshot, url = served
+    snapshot.publish({'running': True})
+    status, headers, body = get(url, method='HEAD')
+    assert status == 200 and body == b"" and int(headers['Content-Length']) > 0
+    assert get(url.replace('/status', '/other'))[0] == 404
+
+
+def test_only_allowed_origins_may_read_cross_origin(served):
+    snapshot, url = served
+    snapshot.publish({'running': True})
+
+    headers = get(url, origin='http://localhost:3000')[1]
+    assert headers['Access-Control-Allow-Origin'] == 'http://localhost:3000'
+    assert headers['Vary'] == 'Origin'
+    assert 'Access-Control-Allow-Origin' not in get(url, origin='https://evil.example')[1]
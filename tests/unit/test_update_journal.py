@@ -0,0 +1,106 @@
+import sys
+import json
+import subprocess
+import threading
+
+import pytest
+
+from conftest import ROOT
+from file_lock import FileLock, FileLockTimeout, atomic_write_text
+from update_journal import UpdateJournal
+
+
+def entry(n, outcome="success", duration=1.0):
+    return {"from": f"c{n}", "to": f"c{n + 1}", "outcome": outcome, "duration": duration, "stages": {"pull": 0.5}}
+
+
+def test_append_and_query(tmp_path):
+    journal = UpdateJournal(tmp_path / "journal.jsonl")
+    journal.append(entry(0, duration=2.0))
+    journal.append(entry(1, outcome="failed", duration=9.0))
+    journal.append(entry(2, duration=4.0))
+
+    assert journal.update_count == 2
+    assert journal.mean_duration() == 3.0
+    assert journal.mean_duration("failed") == 9.0
+    assert [e["from"] for e in journal.last(2)] == ["c1", "c2"]
+    assert journal.last_update == journal.last(1)[0]["time"]
+
+
+def test_compaction_keeps_totals(tmp_path):
+    journal = UpdateJournal(tmp_path / "journal.jsonl", max_entries=10, keep_entries=4)
+    for n in range(25):
+        journal.append(entry(n, duration=float(n)))
+
+    lines = (tmp_path / "journal.jsonl").read_text().splitlines()
+    assert len(lines) <= 10
+    assert json.loads(lines[-1])["from"] == "c24"
+    assert journal.update_count == 25
+    assert journal.mean_duration() == 12.0
+
+
+def test_summary_catches_up_and_skips_torn_lines(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    journal = UpdateJournal(path)
+    journal.append(entry(0))
+    # A second writer's line whose summary update never happened, then a torn write
+    with open(path, 'a') as f:
+        f.write(json.dumps(entry(1)) + "\n")
+        f.write('{"from": "c2", "outc')
+
+    assert journal.update_count == 2
+    journal.append(entry(3))
+    assert journal.update_count == 3
+    assert [e["from"] for e in journal.last(5)] == ["c0", "c1", "c3"]
+
+
+def test_seed_imports_legacy_counters_once(tmp_path):
+    journal = UpdateJournal(tmp_path / "journal.jsonl")
+    journal.seed(7, "2025-01-01T00:00:00")
+    journal.seed(99, None)
+    journal.append(entry(0))
+
+    assert journal.update_count == 8
+    assert journal.mean_duration() == 1.0
+
+
+def test_concurrent_processes_do_not_lose_entries(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    script = (
+        "import sys\n"
+        "from update_journal import UpdateJournal\n"
+        "journal = UpdateJournal(sys.argv[1])\n"
+        "for n in range(25): journal.append({'outcome': 'success', 'duration': 1.0, 'n': n})\n"
+    )
+    workers = [
+        subprocess.Popen([sys.executable, '-c', script, str(path)], cwd=ROOT)
+        for _ in range(4)
+    ]
+    for worker in workers:
+        assert worker.wait(timeout=60) == 0
+
+    journal = UpdateJournal(path)
+    assert len(path.read_text().splitlines()) == 100
+    assert journal.update_count == 100
+
+
+def test_file_lock_excludes_threads_and_times_out(tmp_path):
+    lock = FileLock(tmp_path / "x.lock", timeout=0.2)
+    other = FileLock(tmp_path / "x.lock", timeout=0.2)
+    with lock:
+        assert not other.acquire(blocking=False)
+        with pytest.raises(FileLockTimeout):
+            other.acquire()
+        held = threading.Event()
+        threading.Thread(target=lambda: held.set() if lock.acquire(blocking=False) else None).start()
+        assert not held.wait(0.1)
+    assert other.acquire(blocking=False)
+    other.release()
+
+
+def test_atomic_write_replaces_content(tmp_path):
+    target = tmp_path / "config.json"
+    atomic_write_text(target, "old")
+    atomic_write_text(target, "new")
+    assert target.read_text() == "new"
+    assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
@@ -0,0 +1,166 @@
+import time
+import threading
+
+import pytest
+
+from conftest import git
+
+
+class FakeUpdater:
+    def __init__(self, delay, updated=False, success=True):
+        self.delay = delay
+        self.updated = updated
+        self.success = success
+        self.handled = []
+
+    def check_and_update(self):
+        time.sleep(self.delay)
+        return {'success': self.success, 'updated': self.updated, 'message': 'done', 'timestamp': ''}
+
+    def _handle_update(self, result):
+        self.handled.append(threading.current_thread().name)
+
+    def start_servers(self, on_push=None, taken_ports=None):
+        self.on_push = on_push
+
+    def stop_auto_update(self):
+        pass
+
+
+class CountingUpdater(FakeUpdater):
+    def __init__(self):
+        super().__init__(0.01)
+        self.checks = 0
+
+    def check_and_update(self):
+        self.checks += 1
+        return super().check_and_update()
+
+
+class ConcurrencyProbe(FakeUpdater):
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def check_and_update(self):
+        with ConcurrencyProbe.lock:
+            ConcurrencyProbe.active += 1
+            ConcurrencyProbe.peak = max(ConcurrencyProbe.peak, ConcurrencyProbe.active)
+        try:
+            return super().check_and_update()
+        finally:
+            with ConcurrencyProbe.lock:
+                ConcurrencyProbe.active -= 1
+
+
+@pytest.fixture
+def update_manager():
+    import update_manager
+    return update_manager
+
+
+def test_cycle_time_tracks_slowest_repo(update_manager):
+    updaters = {f"svc{i}": FakeUpdater(0.2) for i in range(5)}
+    updaters["slow"] = FakeUpdater(0.4, updated=True)
+    manager = update_manager.UpdateManager(updaters, max_concurrency=6)
+
+    cycle = manager.run_cycle_sync()
+
+    assert cycle['success']
+    assert cycle['updated'] == ['slow']
+    # Restarts and health checks run on a worker, not on the event loop
+    assert updaters["slow"].handled[0].startswith("field-elevate-update")
+    assert cycle['duration'] < 0.9
+
+
+def test_semaphore_bounds_concurrency(update_manager):
+    ConcurrencyProbe.peak = 0
+    updaters = {f"svc{i}": ConcurrencyProbe(0.05) for i in range(6)}
+    manager = update_manager.UpdateManager(updaters, max_concurrency=2)
+
+    manager.run_cycle_sync()
+
+    assert ConcurrencyProbe.peak == 2
+
+
+def test_per_repo_timeout_does_not_block_cycle(update_manager):
+    updaters = {"stuck": FakeUpdater(1.0), "ok": FakeUpdater(0.01)}
+    manager = update_manager.UpdateManager(updaters, repo_timeout=0.2)
+
+    cycle = manager.run_cycle_sync()
+
+    assert cycle['failed'] == ['stuck']
+    assert cycle['results']['stuck']['message'].startswith('Timed out')
+    assert cycle['results']['ok']['success']
+    assert cycle['duration'] < 0.8
+
+
+def test_discover_repositories_includes_separate_service_checkouts(update_manager, tmp_path):
+    hub = tmp_path / "hub"
+    git(tmp_path, 'init', '-q', str(hub))
+    git(tmp_path, 'init', '-q', str(hub / "mcp-hub"))
+    (hub / "data-hub").mkdir()
+
+    repos = update_manager.discover_repositories(hub)
+
+    assert set(repos) == {"hub", "mcp-hub"}
+
+
+def test_background_loop_stops_promptly(update_manager):
+    manager = update_manager.UpdateManager({"svc": FakeUpdater(0.01)}, check_interval=60)
+    manager.start_auto_update()
+    time.sleep(0.1)
+
+    started = time.perf_counter()
+    manager.stop_auto_update()
+
+    assert time.perf_counter() - started < 1
+    assert manager.last_cycle is not None
+
+
+def test_launcher_handles_reach_every_updater(update_manager):
+    updaters = {"hub": FakeUpdater(0), "mcp-hub": FakeUpdater(0)}
+    manager = update_manager.UpdateManager(updaters)
+    supervisor = object()
+
+    manager.supervisor = supervisor
+
+    assert manager.supervisor is supervisor
+    assert all(updater.supervisor is supervisor for updater in updaters.values())
+
+
+def test_check_now_starts_a_cycle_early(update_manager):
+    updater = CountingUpdater()
+    manager = update_manager.UpdateManager({"svc": updater}, check_interval=60)
+    manager.start_auto_update()
+    try:
+        deadline = time.monotonic() + 2
+        while updater.checks < 1 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        # A push webhook calls the callback the manager handed to the updater
+        updater.on_push()
+        while updater.checks < 2 and time.monotonic() < deadline:
+            time.sleep(0.02)
+    finally:
+        manager.stop_auto_update()
+
+    assert updater.checks == 2
+
+
+def test_each_status_port_is_served_once(update_manager, remote_and_clone, make_updater, tmp_path):
+    from blue_green import find_free_port
+
+    _, _, clone = remote_and_clone
+    other = tmp_path / "other"
+    git(tmp_path, 'clone', '-q', str(clone), str(other))
+    port = find_free_port()
+    hub = make_updater(clone, status_port=port, metrics_port=None)
+    service = make_updater(other, status_port=port, metrics_port=None)
+    manager = update_manager.UpdateManager({"hub": hub, "mcp-hub": service}, check_interval=60)
+
+    manager.start_auto_update()
+    try:
+        assert hub.status_server is not None and hub.status_server.port == port
+        assert service.status_server is None
+    finally:
+        manager.stop_auto_update()
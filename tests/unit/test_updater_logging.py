@@ -0,0 +1,83 @@
+import sys
+import json
+import time
+import logging
+import subprocess
+
+import pytest
+
+from conftest import ROOT
+from updater_logging import configure_logging, shutdown_logging, log_context, RotatingLogFileHandler
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    path = tmp_path / "logs" / "updater.log"
+    yield path
+    shutdown_logging()
+
+
+def read_records(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_importing_updater_has_no_side_effects(tmp_path):
+    subprocess.run([sys.executable, '-c', 'import auto_updater, logging; assert not logging.getLogger().handlers'],
+                   cwd=tmp_path, env={'PYTHONPATH': str(ROOT)}, check=True)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_records_are_json_with_context_fields(log_file):
+    configure_logging(str(log_file), console=False)
+    logger = logging.getLogger("auto_updater")
+
+    with log_context(repo="hub", stage="pull"):
+        logger.info("merged", extra={'commit': 'abc123', 'duration': 0.25})
+    logger.warning("outside")
+    shutdown_logging()
+
+    merged, outside = read_records(log_file)
+    assert merged['message'] == "merged" and merged['level'] == "INFO"
+    assert (merged['repo'], merged['stage'], merged['commit'], merged['duration']) == ("hub", "pull", "abc123", 0.25)
+    assert 'stage' not in outside
+
+
+def test_exceptions_keep_their_traceback(log_file, capsys):
+    configure_logging(str(log_file))
+    logger = logging.getLogger("auto_updater")
+    try:
+        raise RuntimeError("merge exploded")
+    except RuntimeError:
+        logger.exception("Error pulling updates")
+    shutdown_logging()
+
+    record, = read_records(log_file)
+    assert record['message'] == "Error pulling updates"
+    assert record['exception'].startswith("Traceback") and "RuntimeError: merge exploded" in record['exception']
+    assert "RuntimeError: merge exploded" in capsys.readouterr().err
+
+
+def test_configure_is_idempotent(log_file):
+    first = configure_logging(str(log_file), console=False)
+    assert configure_logging(str(log_file), console=False) is first
+    assert len(logging.getLogger().handlers) == len(set(logging.getLogger().handlers))
+
+
+def test_rotates_by_size(log_file):
+    configure_logging(str(log_file), max_bytes=500, backup_count=2, console=False)
+    logger = logging.getLogger("auto_updater")
+    for i in range(50):
+        logger.info(f"record {i}")
+    shutdown_logging()
+
+    rotated = sorted(p.name for p in log_file.parent.iterdir())
+    assert rotated == ["updater.log", "updater.log.1", "updater.log.2"]
+
+
+def test_rotates_by_age(tmp_path):
+    handler = RotatingLogFileHandler(str(tmp_path / "aged.log"), max_bytes=0, rotate_interval=0.05)
+    record = logging.makeLogRecord({'msg': 'x'})
+    assert not handler.shouldRollover(record)
+    time.sleep(0.1)
+    assert handler.shouldRollover(record)
+    handler.close()
@@ -0,0 +1,46 @@
+import urllib.request
+
+from updater_metrics import Counter, Gauge, Histogram, Registry, start_metrics_server, stop_metrics_server
+
+
+def test_text_format_rendering():
+    registry = Registry()
+    runs = registry.register(Counter("runs_total", "Runs", ("stage", "outcome")))
+    lag = registry.register(Gauge("lag", "Lag"))
+    duration = registry.register(Histogram("duration_seconds", "Duration", ("stage",), buckets=(0.1, 1)))
+
+    runs.labels(stage="fetch", outcome="failure").inc()
+    runs.labels(stage="fetch", outcome="failure").inc(2)
+    lag.set(3)
+    duration.labels(stage="pull").observe(0.05)
+    duration.labels(stage="pull").observe(0.5)
+    text = registry.render()
+
+    assert '# TYPE runs_total counter' in text
+    assert 'runs_total{stage="fetch",outcome="failure"} 3' in text
+    assert 'lag 3' in text
+    assert 'duration_seconds_bucket{stage="pull",le="0.1"} 1' in text
+    assert 'duration_seconds_bucket{stage="pull",le="1"} 2' in text
+    assert 'duration_seconds_bucket{stage="pull",le="+Inf"} 2' in text
+    assert 'duration_seconds_count{stage="pull"} 2' in text
+
+
+def test_label_values_are_escaped():
+    registry = Registry()
+    gauge = registry.register(Gauge("g", "G", ("repo",)))
+    gauge.labels(repo='we"ird\\path').set(1)
+
+    assert 'g{repo="we\\"ird\\\\path"} 1' in registry.render()
+
+
+def test_metrics_endpoint_serves_registry():
+    registry = Registry()
+    registry.register(Counter("hits_total", "Hits")).inc()
+    server = start_metrics_server(0, host='127.0.0.1', registry=registry)
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+            body = response.read().decode()
+        assert 'hits_total 1' in body
+    finally:
+        stop_metrics_server()
@@ -0,0 +1,78 @@
+import json
+import time
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from webhook_listener import WebhookListener, Debouncer, sign_payload, verify_signature
+
+SECRET = "s3cret"
+
+
+@pytest.fixture
+def listener():
+    pushes = []
+    instance = WebhookListener(lambda: pushes.append(time.monotonic()), SECRET, port=0,
+                               host='127.0.0.1', branch='main', debounce=0.2)
+    instance.pushes = pushes
+    instance.start()
+    yield instance
+    instance.stop()
+
+
+def post(listener, payload, event='push', secret=SECRET, path='/webhook'):
+    body = json.dumps(payload).encode()
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{listener.port}{path}", data=body, method='POST',
+        headers={'X-GitHub-Event': event, 'X-Hub-Signature-256': sign_payload(secret, body),
+                 'Content-Type': 'application/json'}
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def test_signature_round_trip():
+    body = b'{"ref": "refs/heads/main"}'
+    assert verify_signature(SECRET, body, sign_payload(SECRET, body))
+    assert not verify_signature(SECRET, body, sign_payload("other", body))
+    assert not verify_signature(SECRET, body, None)
+
+
+def test_burst_of_pushes_triggers_one_check(listener):
+    for _ in range(5):
+        assert post(listener, {'ref': 'refs/heads/main'}) == 202
+    time.sleep(0.6)
+
+    assert listener.pushes_received == 5
+    assert len(listener.pushes) == 1
+
+
+def test_bad_signature_and_other_branches_are_ignored(listener):
+    assert post(listener, {'ref': 'refs/heads/main'}, secret='wrong') == 401
+    assert post(listener, {'ref': 'refs/heads/feature'}) == 202
+    assert post(listener, {'zen': 'hi'}, event='ping') == 200
+    assert post(listener, {}, path='/other') == 404
+    time.sleep(0.4)
+
+    assert listener.rejected == 1
+    assert listener.pushes == []
+
+
+def test_secret_is_required():
+    with pytest.raises(ValueError):
+        WebhookListener(lambda: None, '')
+
+
+def test_steady_stream_still_fires_by_max_delay():
+    fired = threading.Event()
+    debouncer = Debouncer(fired.set, delay=0.2, max_delay=0.4)
+    deadline = time.monotonic() + 1.0
+    while not fired.is_set() and time.monotonic() < deadline:
+        debouncer()
+        time.sleep(0.05)
+    assert fired.is_set()
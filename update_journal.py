@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Append-only update journal for the Field-Elevate-Hub auto-updater
+One JSON line per update attempt, with a small summary file kept alongside
+so counts and averages never require reading the whole history
+"""
+
+import os
+import json
+import logging
+from pathlib import Path
+from datetime import datetime
+from typing import Optional, Dict, Any, List
+
+from file_lock import FileLock, atomic_write_text
+
+logger = logging.getLogger(__name__)
+
+_TAIL_BLOCK = 64 * 1024
+
+
+def _empty_summary() -> Dict[str, Any]:
+    return {
+        "entries": 0,        # lines currently in the journal file
+        "size": 0,           # journal bytes covered by this summary
+        "total": 0,          # every update ever recorded, including compacted ones
+        "outcomes": {},
+        "duration_sum": {},  # per outcome, for mean durations
+        "duration_count": {},
+        "last_update": None,
+        "last_entry": None,
+    }
+
+
+class UpdateJournal:
+    """Locked, append-only JSONL history of updates with periodic compaction"""
+
+    def __init__(self, path: Path, max_entries: int = 2000, keep_entries: int = 500):
+        """
+        Initialize update journal
+
+        Args:
+            path: Journal file (``.jsonl``); the summary and lock live next to it
+            max_entries: Compact once the file holds more lines than this
+            keep_entries: Lines kept by compaction (totals and means are preserved)
+        """
+        self.path = Path(path)
+        self.summary_path = self.path.with_name(self.path.name + ".summary.json")
+        self.max_entries = max_entries
+        self.keep_entries = keep_entries
+        self._lock = FileLock(self.path.with_name(self.path.name + ".lock"))
+
+    def _read_summary(self) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(self.summary_path.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _file_size(self) -> int:
+        try:
+            return self.path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    @staticmethod
+    def _add_to_summary(summary: Dict[str, Any], entry: Dict[str, Any]) -> None:
+        outcome = entry.get("outcome", "unknown")
+        summary["entries"] += 1
+        summary["total"] += 1
+        summary["outcomes"][outcome] = summary["outcomes"].get(outcome, 0) + 1
+        if entry.get("duration") is not None:
+            summary["duration_sum"][outcome] = summary["duration_sum"].get(outcome, 0.0) + entry["duration"]
+            summary["duration_count"][outcome] = summary["duration_count"].get(outcome, 0) + 1
+        if outcome == "success":
+            summary["last_update"] = entry.get("time")
+        summary["last_entry"] = entry
+
+    def _iter_entries(self, offset: int = 0):
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        # A torn final line from a crash mid-append
+                        continue
+        except FileNotFoundError:
+            return
+
+    def _summary_locked(self) -> Dict[str, Any]:
+        """
+        Load the summary, catching up on lines appended after it was written
+
+        Only a crash between appending and saving the summary leaves it
+        behind; a journal smaller than the summary expects is recounted.
+        """
+        summary = self._read_summary()
+        size = self._file_size()
+        if summary is None or summary.get("size", 0) > size:
+            summary, offset = _empty_summary(), 0
+        else:
+            offset = summary.get("size", 0)
+        if offset < size:
+            for entry in self._iter_entries(offset):
+                self._add_to_summary(summary, entry)
+            summary["size"] = size
+        return summary
+
+    def append(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Record one update attempt
+
+        Args:
+            entry: Fields such as from/to commits, stages, duration and outcome
+
+        Returns:
+            The stored entry (with a timestamp added if missing)
+        """
+        entry = {"time": datetime.now().isoformat(), **entry}
+        line = json.dumps(entry, separators=(',', ':'), default=str) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            summary = self._summary_locked()
+            with open(self.path, 'ab') as f:
+                if f.tell() > 0:
+                    # Terminate a torn line left by a crash so this entry stays parseable
+                    with open(self.path, 'rb') as reader:
+                        reader.seek(-1, os.SEEK_END)
+                        if reader.read(1) != b"\n":
+                            f.write(b"\n")
+                f.write(line.encode())
+                f.flush()
+                os.fsync(f.fileno())
+                summary["size"] = f.tell()
+            self._add_to_summary(summary, entry)
+            if summary["entries"] > self.max_entries:
+                self._compact_locked(summary)
+            atomic_write_text(self.summary_path, json.dumps(summary))
+        return entry
+
+    def _compact_locked(self, summary: Dict[str, Any]) -> None:
+        kept = self.last(self.keep_entries)
+        atomic_write_text(self.path, "".join(json.dumps(e, separators=(',', ':'), default=str) + "\n" for e in kept))
+        summary["entries"] = len(kept)
+        summary["size"] = self._file_size()
+        logger.info(f"Compacted update journal to {len(kept)} entries")
+
+    def compact(self) -> None:
+        """Drop all but the newest keep_entries lines; totals and means are kept"""
+        with self._lock:
+            summary = self._summary_locked()
+            self._compact_locked(summary)
+            atomic_write_text(self.summary_path, json.dumps(summary))
+
+    def seed(self, update_count: int, last_update: Optional[str]) -> None:
+        """Carry over counters kept in the config file before the journal existed"""
+        with self._lock:
+            if self.summary_path.exists() or self._file_size():
+                return
+            summary = _empty_summary()
+            summary["total"] = update_count
+            summary["outcomes"] = {"success": update_count} if update_count else {}
+            summary["last_update"] = last_update
+            atomic_write_text(self.summary_path, json.dumps(summary))
+
+    def summary(self) -> Dict[str, Any]:
+        """Counters and totals without reading the journal"""
+        summary = self._read_summary()
+        if summary is None or summary.get("size", 0) != self._file_size():
+            with self._lock:
+                summary = self._summary_locked()
+        return summary
+
+    @property
+    def update_count(self) -> int:
+        """Successful updates recorded"""
+        return self.summary()["outcomes"].get("success", 0)
+
+    @property
+    def last_update(self) -> Optional[str]:
+        """Timestamp of the most recent successful update"""
+        return self.summary().get("last_update")
+
+    def mean_duration(self, outcome: str = "success") -> Optional[float]:
+        """Mean recorded duration of updates with the given outcome"""
+        summary = self.summary()
+        count = summary["duration_count"].get(outcome, 0)
+        if not count:
+            return None
+        return summary["duration_sum"][outcome] / count
+
+    def last(self, n: int = 10) -> List[Dict[str, Any]]:
+        """The newest n entries, oldest first, read from the end of the file"""
+        if n <= 0:
+            return []
+        try:
+            f = open(self.path, 'rb')
+        except FileNotFoundError:
+            return []
+        with f:
+            f.seek(0, os.SEEK_END)
+            position = f.tell()
+            data = b""
+            while position > 0 and data.count(b"\n") <= n:
+                step = min(_TAIL_BLOCK, position)
+                position -= step
+                f.seek(position)
+                data = f.read(step) + data
+        entries = []
+        for line in data.splitlines()[-(n + 1):]:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue
+        return entries[-n:]
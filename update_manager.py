@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Asyncio update manager for Field-Elevate-Hub
+Checks many repositories/worktrees concurrently, so one cycle takes about
+as long as the slowest repository rather than the sum of all of them
+"""
+
+import time
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from datetime import datetime
+from typing import Optional, Dict, Any
+
+from auto_updater import FieldElevateAutoUpdater
+from git_backend import GitRepository
+from hub_services import service_paths
+
+logger = logging.getLogger(__name__)
+
+
+def discover_repositories(root: Path) -> Dict[str, Path]:
+    """
+    Find the repositories to watch under a Hub checkout
+
+    The checkout itself is always included when it is a Git repository;
+    service directories are added only when they are separate checkouts
+    or worktrees (i.e. have their own ``.git``).
+    """
+    root = Path(root).resolve()
+    repos: Dict[str, Path] = {}
+    if GitRepository.discover(root) is not None:
+        repos["hub"] = root
+    for name, path in service_paths(root).items():
+        if path != root and (path / ".git").exists():
+            repos[name] = path
+    return repos
+
+
+class UpdateManager:
+    """Runs update checks for several repositories under bounded concurrency"""
+
+    def __init__(self, updaters: Dict[str, FieldElevateAutoUpdater], max_concurrency: int = 4,
+                 repo_timeout: float = 120, check_interval: int = 1800):
+        """
+        Initialize update manager
+
+        Args:
+            updaters: Repository name -> updater instance
+            max_concurrency: Maximum number of repositories checked at once
+            repo_timeout: Seconds before a single repository's check is abandoned
+            check_interval: Seconds between cycles when running in the background
+        """
+        self.updaters = updaters
+        self.max_concurrency = max(1, max_concurrency)
+        self.repo_timeout = repo_timeout
+        self.check_interval = check_interval
+        self.last_cycle: Optional[Dict[str, Any]] = None
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                            thread_name_prefix="field-elevate-update")
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._thread = None
+        self._loop = None
+        self._stop_event = None
+        self._wake_event = None
+        self._stopping = False
+
+    @property
+    def primary(self) -> FieldElevateAutoUpdater:
+        """The Hub checkout's updater (or the first one); its config drives the launcher"""
+        return self.updaters.get("hub") or next(iter(self.updaters.values()))
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        return getattr(self.primary, 'config', {})
+
+    @property
+    def last_commit(self) -> Optional[str]:
+        return getattr(self.primary, 'last_commit', None)
+
+    # Launcher handles are shared by every repository's updater, so whichever
+    # repository changed can stop or restart the services
+    def _attach(self, name: str, value: Any) -> None:
+        for updater in self.updaters.values():
+            setattr(updater, name, value)
+
+    @property
+    def supervisor(self):
+        return getattr(self.primary, 'supervisor', None)
+
+    @supervisor.setter
+    def supervisor(self, value) -> None:
+        self._attach('supervisor', value)
+
+    @property
+    def blue_green(self):
+        return getattr(self.primary, 'blue_green', None)
+
+    @blue_green.setter
+    def blue_green(self, value) -> None:
+        self._attach('blue_green', value)
+
+    @property
+    def sampler(self):
+        return getattr(self.primary, 'sampler', None)
+
+    @sampler.setter
+    def sampler(self, value) -> None:
+        self._attach('sampler', value)
+
+    def prepare_release(self) -> bool:
+        """Services run from the Hub checkout, so only its release is staged"""
+        return self.primary.prepare_release()
+
+    def app_root(self) -> Path:
+        return self.primary.app_root()
+
+    def verify_pending_update(self) -> bool:
+        """Health-check every repository's unverified update; True if all are healthy"""
+        results = [updater.verify_pending_update() for updater in self.updaters.values()]
+        return all(results)
+
+    def _publish_status(self) -> None:
+        for updater in self.updaters.values():
+            updater._publish_status()
+
+    def check_now(self) -> None:
+        """Start the next cycle immediately (e.g. from a push webhook)"""
+        if self._loop is not None and self._wake_event is not None:
+            self._loop.call_soon_threadsafe(self._wake_event.set)
+
+    @classmethod
+    def from_paths(cls, paths: Dict[str, Path], **kwargs) -> 'UpdateManager':
+        """Create a manager with one updater per repository path"""
+        updaters = {name: FieldElevateAutoUpdater(str(path)) for name, path in paths.items()}
+        return cls(updaters, **kwargs)
+
+    async def _check_repo(self, name: str, updater: FieldElevateAutoUpdater,
+                          semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        previous = self._in_flight.get(name)
+        if previous is not None and not previous.done():
+            # A timed-out check is still running in its worker thread
+            return {
+                'success': False,
+                'updated': False,
+                'message': 'Previous check still running',
+                'timestamp': datetime.now().isoformat()
+            }
+
+        async with semaphore:
+            started = time.perf_counter()
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor, updater.check_and_update)
+            self._in_flight[name] = future
+            try:
+                result = await asyncio.wait_for(asyncio.shield(future), timeout=self.repo_timeout)
+            except asyncio.TimeoutError:
+                logger.error(f"Update check for {name} timed out after {self.repo_timeout}s")
+                result = {
+                    'success': False,
+                    'updated': False,
+                    'message': f'Timed out after {self.repo_timeout}s',
+                    'timestamp': datetime.now().isoformat()
+                }
+            except Exception as e:
+                logger.error(f"Update check for {name} failed: {e}")
+                result = {
+                    'success': False,
+                    'updated': False,
+                    'message': f'Error: {e}',
+                    'timestamp': datetime.now().isoformat()
+                }
+            result['duration'] = time.perf_counter() - started
+            return result
+
+    async def run_cycle(self) -> Dict[str, Any]:
+        """
+        Check every repository once, concurrently
+
+        Returns:
+            Aggregated result with per-repository results under ``results``
+        """
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        names = list(self.updaters)
+        results = await asyncio.gather(
+            *(self._check_repo(name, self.updaters[name], semaphore) for name in names)
+        )
+        per_repo = dict(zip(names, results))
+
+        cycle = {
+            'success': all(r['success'] for r in results),
+            'updated': [name for name, r in per_repo.items() if r.get('updated')],
+            'failed': [name for name, r in per_repo.items() if not r['success']],
+            'results': per_repo,
+            'duration': time.perf_counter() - started,
+            'timestamp': datetime.now().isoformat()
+        }
+        self.last_cycle = cycle
+
+        # Restarts, builds and health checks block; keep them off the event loop
+        loop = asyncio.get_running_loop()
+        for name in cycle['updated']:
+            try:
+                await loop.run_in_executor(self._executor, self.updaters[name]._handle_update, per_repo[name])
+            except Exception as e:
+                logger.error(f"Handling the update of {name} failed: {e}")
+        if cycle['failed']:
+            logger.warning(f"Update cycle finished with failures: {', '.join(cycle['failed'])}")
+        return cycle
+
+    def run_cycle_sync(self) -> Dict[str, Any]:
+        """Run one cycle from synchronous code"""
+        return asyncio.run(self.run_cycle())
+
+    async def run_forever(self) -> None:
+        """Run cycles every check_interval until stop_auto_update() is called"""
+        self._stop_event = asyncio.Event()
+        self._wake_event = asyncio.Event()
+        if self._stopping:
+            return
+        while not self._stop_event.is_set():
+            self._wake_event.clear()
+            try:
+                await self.run_cycle()
+            except Exception as e:
+                logger.error(f"Error in update manager cycle: {e}")
+            try:
+                # Woken early by check_now() or stop_auto_update()
+                await asyncio.wait_for(self._wake_event.wait(), timeout=self.check_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start_auto_update(self) -> None:
+        """Start the manager's event loop in a background thread"""
+        if self._thread and self._thread.is_alive():
+            logger.warning("Update manager already running")
+            return
+        # Every repository gets its status/metrics/webhook endpoints; pushes wake this loop
+        taken_ports = set()
+        for updater in self.updaters.values():
+            updater.start_servers(on_push=self.check_now, taken_ports=taken_ports)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_until_complete, args=(self.run_forever(),), daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Field Elevate update manager started for {len(self.updaters)} repositories")
+
+    def stop_auto_update(self) -> None:
+        """Stop the background loop and release worker threads"""
+        self._stopping = True
+        if self._loop and self._stop_event is not None:
+            self._loop.call_soon_threadsafe(self._stop_event.set)
+            self._loop.call_soon_threadsafe(self._wake_event.set)
+        if self._thread:
+            self._thread.join(timeout=5)
+        self._executor.shutdown(wait=False)
+        for updater in self.updaters.values():
+            updater.stop_auto_update()
+        logger.info("Field Elevate update manager stopped")
+
+
+def main():
+    """Run one update cycle across every discovered repository"""
+    print("🔄 Field-Elevate-Hub Update Manager")
+    print("=" * 50)
+
+    repos = discover_repositories(Path(__file__).parent)
+    if not repos:
+        print("❌ No Git repositories found")
+        return
+
+    manager = UpdateManager.from_paths(repos)
+    next(iter(manager.updaters.values())).configure_logging()
+    cycle = manager.run_cycle_sync()
+
+    for name, result in cycle['results'].items():
+        status = "✅" if result['success'] else "❌"
+        print(f"{status} {name}: {result['message']} ({result['duration']:.2f}s)")
+    print(f"\n⏱️ Cycle time: {cycle['duration']:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
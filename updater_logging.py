@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Logging setup for the Field-Elevate-Hub auto-updater
+Nothing is configured at import time. configure_logging() installs a queue
+handler so log calls never block on disk I/O, and a background listener
+writes JSON records to a file rotated by size and age, plus the console
+"""
+
+import copy
+import json
+import time
+import atexit
+import logging
+import threading
+import contextvars
+import logging.handlers
+import queue
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+# Record attributes promoted to top-level JSON fields when present
+CONTEXT_FIELDS = ("repo", "stage", "commit", "duration")
+
+CONSOLE_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+_context: contextvars.ContextVar[Dict[str, Any]] = contextvars.ContextVar("updater_log_context", default={})
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_lock = threading.Lock()
+_TRACEBACK_FORMATTER = logging.Formatter()
+
+
+@contextmanager
+def log_context(**fields: Any):
+    """Attach fields (repo, stage, commit, ...) to every record logged in this block"""
+    token = _context.set({**_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _context.reset(token)
+
+
+class ContextFilter(logging.Filter):
+    """Copy the active log_context() fields onto records that don't set them"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        for key, value in _context.get().items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line with timestamp, level, logger, message and context fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key in CONTEXT_FIELDS:
+            value = getattr(record, key, None)
+            if value is not None:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            # Already formatted by QueueHandler.prepare
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class ContextQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that keeps a record's traceback apart from its message"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock prepare() folds the traceback into msg and drops it; keep it in
+        # exc_text instead, where JsonFormatter and the console formatter both find it
+        record = copy.copy(record)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _TRACEBACK_FORMATTER.formatException(record.exc_info)
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+class RotatingLogFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotates when the file exceeds max_bytes or is older than rotate_interval seconds"""
+
+    def __init__(self, filename: str, max_bytes: int = 10 * 1024 * 1024, backup_count: int = 5,
+                 rotate_interval: Optional[float] = 86400):
+        Path(filename).parent.mkdir(parents=True, exist_ok=True)
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count,
+                         encoding='utf-8', delay=True)
+        self.rotate_interval = rotate_interval
+        try:
+            opened = Path(filename).stat().st_mtime
+        except OSError:
+            opened = time.time()
+        self.rollover_at = opened + rotate_interval if rotate_interval else None
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.rollover_at is not None and time.time() >= self.rollover_at:
+            return True
+        return bool(super().shouldRollover(record))
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        if self.rotate_interval:
+            self.rollover_at = time.time() + self.rotate_interval
+
+
+def configure_logging(log_file: Optional[str] = None, level: str = "INFO", max_bytes: int = 10 * 1024 * 1024,
+                      backup_count: int = 5, rotate_interval: Optional[float] = 86400,
+                      console: bool = True) -> logging.handlers.QueueListener:
+    """
+    Route root logging through a queue to a background writer
+
+    Safe to call more than once; only the first call installs handlers.
+
+    Args:
+        log_file: JSON log file path (None logs to the console only)
+        level: Root log level
+        max_bytes: Rotate the file once it reaches this size
+        backup_count: Rotated files to keep
+        rotate_interval: Also rotate after this many seconds (None disables)
+        console: Also write plain-text records to stderr
+
+    Returns:
+        The running queue listener
+    """
+    global _listener, _queue_handler
+    with _lock:
+        if _listener is not None:
+            return _listener
+
+        handlers = []
+        if log_file:
+            file_handler = RotatingLogFileHandler(log_file, max_bytes, backup_count, rotate_interval)
+            file_handler.setFormatter(JsonFormatter())
+            handlers.append(file_handler)
+        if console:
+            stream_handler = logging.StreamHandler()
+            stream_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+            handlers.append(stream_handler)
+
+        _queue_handler = ContextQueueHandler(queue.SimpleQueue())
+        _queue_handler.addFilter(ContextFilter())
+        _listener = logging.handlers.QueueListener(_queue_handler.queue, *handlers,
+                                                   respect_handler_level=True)
+        _listener.start()
+
+        root = logging.getLogger()
+        root.addHandler(_queue_handler)
+        root.setLevel(level)
+        atexit.register(shutdown_logging)
+        return _listener
+
+
+def shutdown_logging() -> None:
+    """Flush queued records, stop the writer thread and remove the queue handler"""
+    global _listener, _queue_handler
+    with _lock:
+        if _listener is None:
+            return
+        logging.getLogger().removeHandler(_queue_handler)
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+        _queue_handler = None
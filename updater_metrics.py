@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Prometheus metrics for the Field-Elevate-Hub auto-updater
+A dependency-free exporter: counters, gauges and histograms rendered in
+the Prometheus text exposition format and served from /metrics
+"""
+
+import math
+import logging
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Optional, Dict, List, Tuple, Sequence
+
+logger = logging.getLogger(__name__)
+
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(zip(names, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], '_Metric'] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, **labels: str) -> '_Metric':
+        """Return the child metric for one combination of label values"""
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            child = self._children.get(key)
+            if child is None:
+                child = self._new_child()
+                self._children[key] = child
+            return child
+
+    def _new_child(self) -> '_Metric':
+        raise NotImplementedError
+
+    def _samples_with(self, name: str, labelnames: Sequence[str], labelvalues: Sequence[str]) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        if self.labelnames:
+            with self._lock:
+                children = list(self._children.items())
+            for key, child in children:
+                lines.extend(child._samples_with(self.name, self.labelnames, key))
+        else:
+            lines.extend(self._samples_with(self.name, (), ()))
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing value"""
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.value = 0.0
+
+    def _new_child(self) -> 'Counter':
+        return Counter(self.name, self.documentation)
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self.value += amount
+
+    def _samples_with(self, name, labelnames, labelvalues) -> List[str]:
+        return [f"{name}{_format_labels(labelnames, labelvalues)} {_format_value(self.value)}"]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down"""
+    kind = "gauge"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.value = 0.0
+
+    def _new_child(self) -> 'Gauge':
+        return Gauge(self.name, self.documentation)
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self.value = float(value)
+
+    def _samples_with(self, name, labelnames, labelvalues) -> List[str]:
+        return [f"{name}{_format_labels(labelnames, labelvalues)} {_format_value(self.value)}"]
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets"""
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DURATION_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self.counts = [0] * len(self.buckets)
+        self.sum = 0.0
+
+    def _new_child(self) -> 'Histogram':
+        return Histogram(self.name, self.documentation, buckets=self.buckets[:-1])
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self.sum += value
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self.counts[i] += 1
+                    break
+
+    def _samples_with(self, name, labelnames, labelvalues) -> List[str]:
+        with self._lock:
+            counts = list(self.counts)
+            total_sum = self.sum
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, counts):
+            cumulative += count
+            labels = _format_labels(labelnames, labelvalues, ("le", _format_value(bound)))
+            lines.append(f"{name}_bucket{labels} {cumulative}")
+        labels = _format_labels(labelnames, labelvalues)
+        lines.append(f"{name}_sum{labels} {_format_value(total_sum)}")
+        lines.append(f"{name}_count{labels} {cumulative}")
+        return lines
+
+
+class Registry:
+    """Collection of metrics rendered together"""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+STAGE_DURATION = REGISTRY.register(Histogram(
+    "field_elevate_updater_stage_duration_seconds",
+    "Duration of auto-updater stages (check, fetch, pull, backup, restart)",
+    ("repo", "stage")
+))
+STAGE_RESULTS = REGISTRY.register(Counter(
+    "field_elevate_updater_stage_total",
+    "Auto-updater stage runs by outcome",
+    ("repo", "stage", "outcome")
+))
+FETCHED_BYTES = REGISTRY.register(Counter(
+    "field_elevate_updater_fetched_bytes_total",
+    "Bytes added to the object store by fetches",
+    ("repo",)
+))
+BACKUP_BYTES = REGISTRY.register(Gauge(
+    "field_elevate_updater_backup_bytes",
+    "Bytes newly stored by the most recent backup snapshot",
+    ("repo",)
+))
+BACKUP_FILES = REGISTRY.register(Gauge(
+    "field_elevate_updater_backup_files",
+    "Files recorded in the most recent backup snapshot",
+    ("repo",)
+))
+COMMITS_BEHIND = REGISTRY.register(Gauge(
+    "field_elevate_updater_commits_behind",
+    "Commits the checkout is behind its tracked branch",
+    ("repo",)
+))
+LAST_SUCCESS = REGISTRY.register(Gauge(
+    "field_elevate_updater_last_success_timestamp_seconds",
+    "Unix time of the last successful update check",
+    ("repo",)
+))
+SERVICE_RSS = REGISTRY.register(Gauge(
+    "field_elevate_service_rss_bytes",
+    "Resident memory of a launched service process",
+    ("service",)
+))
+SERVICE_CPU = REGISTRY.register(Gauge(
+    "field_elevate_service_cpu_percent",
+    "CPU use of a launched service process over the last sample interval",
+    ("service",)
+))
+SERVICE_FDS = REGISTRY.register(Gauge(
+    "field_elevate_service_open_fds",
+    "Open file descriptors of a launched service process",
+    ("service",)
+))
+SERVICE_THREADS = REGISTRY.register(Gauge(
+    "field_elevate_service_threads",
+    "Threads in a launched service process",
+    ("service",)
+))
+RESOURCE_REGRESSION = REGISTRY.register(Gauge(
+    "field_elevate_service_resource_regression_ratio",
+    "New release's mean usage over the previous release's, for metrics past the regression ratio",
+    ("service", "metric")
+))
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        if self.path.split('?')[0] != '/metrics':
+            self.send_error(404)
+            return
+        body = self.server.registry.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+_server: Optional[ThreadingHTTPServer] = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(port: int, host: str = '0.0.0.0', registry: Registry = REGISTRY) -> ThreadingHTTPServer:
+    """Serve /metrics on a background thread; later calls reuse the running server"""
+    global _server
+    with _server_lock:
+        if _server is None:
+            _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            _server.daemon_threads = True
+            _server.registry = registry
+            threading.Thread(target=_server.serve_forever, daemon=True).start()
+            logger.info(f"Updater metrics available at http://{host}:{_server.server_address[1]}/metrics")
+        return _server
+
+
+def stop_metrics_server() -> None:
+    """Stop the /metrics server if it is running"""
+    global _server
+    with _server_lock:
+        if _server is not None:
+            _server.shutdown()
+            _server.server_close()
+            _server = None
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Push-notification listener for the Field-Elevate-Hub auto-updater
+Accepts GitHub-style signed webhooks (X-Hub-Signature-256) and coalesces
+bursts of pushes into a single "check now" for the update loop
+"""
+
+import hmac
+import json
+import time
+import hashlib
+import logging
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Optional, Callable
+
+logger = logging.getLogger(__name__)
+
+SIGNATURE_HEADER = "X-Hub-Signature-256"
+EVENT_HEADER = "X-GitHub-Event"
+
+# Pushes are small JSON documents; refuse anything much larger
+MAX_BODY_BYTES = 5 * 1024 * 1024
+
+
+def sign_payload(secret: str, body: bytes) -> str:
+    """Signature header value for a body, as GitHub computes it"""
+    digest = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return f"sha256={digest}"
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    """Constant-time check of an X-Hub-Signature-256 header"""
+    if not signature:
+        return False
+    return hmac.compare_digest(sign_payload(secret, body), signature.strip())
+
+
+class Debouncer:
+    """Runs a callback once a burst of calls has been quiet for `delay` seconds"""
+
+    def __init__(self, callback: Callable[[], None], delay: float, max_delay: Optional[float] = None):
+        """
+        Initialize debouncer
+
+        Args:
+            callback: Function run once per burst
+            delay: Quiet period that ends a burst
+            max_delay: Longest a steady stream of calls can postpone the callback
+        """
+        self.callback = callback
+        self.delay = delay
+        self.max_delay = max_delay if max_delay is not None else delay * 5
+        self._timer: Optional[threading.Timer] = None
+        self._first_call: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def __call__(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self._first_call is None:
+                self._first_call = now
+            if self._timer is not None:
+                self._timer.cancel()
+            remaining = self._first_call + self.max_delay - now
+            self._timer = threading.Timer(max(0.0, min(self.delay, remaining)), self._fire)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _fire(self) -> None:
+        with self._lock:
+            self._timer = None
+            self._first_call = None
+        try:
+            self.callback()
+        except Exception as e:
+            logger.error(f"Webhook callback failed: {e}")
+
+    def cancel(self) -> None:
+        """Drop a pending callback"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = None
+            self._first_call = None
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    def _reply(self, status: int, message: str) -> None:
+        body = json.dumps({'message': message}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:
+        listener: 'WebhookListener' = self.server.listener
+        if self.path.split('?')[0] != listener.path:
+            self._reply(404, 'not found')
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            length = -1
+        if length < 0 or length > MAX_BODY_BYTES:
+            self._reply(413, 'payload too large')
+            return
+        body = self.rfile.read(length)
+
+        if not verify_signature(listener.secret, body, self.headers.get(SIGNATURE_HEADER)):
+            listener.rejected += 1
+            logger.warning(f"Rejected webhook with bad signature from {self.client_address[0]}")
+            self._reply(401, 'invalid signature')
+            return
+
+        event = self.headers.get(EVENT_HEADER, 'push')
+        if event == 'ping':
+            self._reply(200, 'pong')
+            return
+        if event != 'push':
+            self._reply(202, f'ignored {event} event')
+            return
+
+        try:
+            payload = json.loads(body or b'{}')
+        except ValueError:
+            self._reply(400, 'invalid JSON')
+            return
+        ref = payload.get('ref') if isinstance(payload, dict) else None
+        if listener.branch and ref and ref != f"refs/heads/{listener.branch}":
+            self._reply(202, f'ignored push to {ref}')
+            return
+
+        listener.pushes_received += 1
+        listener.debouncer()
+        self._reply(202, 'update scheduled')
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class WebhookListener:
+    """Embedded HTTP endpoint that turns verified push webhooks into update checks"""
+
+    def __init__(self, on_push: Callable[[], None], secret: str, port: int = 9465,
+                 host: str = '0.0.0.0', path: str = '/webhook', branch: Optional[str] = None,
+                 debounce: float = 2.0, max_delay: Optional[float] = None):
+        """
+        Initialize webhook listener
+
+        Args:
+            on_push: Called once per burst of accepted pushes
+            secret: Shared HMAC secret configured on the Git host
+            port: Port to listen on (0 picks a free port)
+            host: Interface to bind
+            path: Request path that accepts webhooks
+            branch: Only pushes to this branch trigger a check (None accepts all)
+            debounce: Quiet seconds that end a burst of pushes
+            max_delay: Longest a burst can postpone the check
+        """
+        if not secret:
+            raise ValueError("A webhook secret is required")
+        self.secret = secret
+        self.port = port
+        self.host = host
+        self.path = path
+        self.branch = branch
+        self.debouncer = Debouncer(on_push, debounce, max_delay)
+        self.pushes_received = 0
+        self.rejected = 0
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def start(self) -> None:
+        """Bind the port and serve on a background thread"""
+        self._server = ThreadingHTTPServer((self.host, self.port), _WebhookHandler)
+        self._server.daemon_threads = True
+        self._server.listener = self
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        logger.info(f"Webhook listener on http://{self.host}:{self.port}{self.path}")
+
+    def stop(self) -> None:
+        """Stop serving and drop any pending check"""
+        self.debouncer.cancel()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None